@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Normalized benchmark results across languages.
+
+Every language reports results its own way: API benchmarks write
+api_results.json, the CPU benchmarks print "Test: ... / Execution time: N ms"
+blocks (C#, Scala and Elixir use "=== Name ===" headers instead of "Test:"
+and "Name: N ms, result = N" lines), and the JavaScript/Python runners print
+"  Name: N ms" lines (python/run_all.py also writes JSON). The adapters here
+turn each of those into records of one common schema:
+
+    language   e.g. 'go'
+    suite      'cpu' or 'api'
+    benchmark  test name as the suites print it, e.g. 'Fibonacci Recursive (n=35)'
+    metric     e.g. 'execution_time', 'requests_per_second', 'p99'
+    value      float
+    unit       'ms', 'req/s', 's', 'count' or '%'
+
+and the aggregator stores all records as one columnar dataset (a JSON object
+of equal-length column lists), so consumers can load a single file and pick
+the columns they need.
+
+Usage:
+    python benchmark_results.py                          # from benchmark_report.json or the language dirs
+    python benchmark_results.py --report my_report.json -o dataset.json
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+ROOT = Path(__file__).parent.resolve()
+LANGUAGES = ['python', 'javascript', 'go', 'rust', 'java', 'cpp', 'ruby', 'elixir', 'csharp', 'scala']
+DEFAULT_REPORT = ROOT / 'benchmark_report.json'
+DEFAULT_DATASET = ROOT / 'benchmark_dataset.json'
+
+SCHEMA_VERSION = 1
+COLUMNS = ['language', 'suite', 'benchmark', 'metric', 'value', 'unit']
+
+# Benchmark name used for the API load test records
+API_BENCHMARK = 'API Requests'
+
+# response_times keys in api_results.json -> metric name
+API_LATENCY_METRICS = {
+    'min_ms': 'min', 'max_ms': 'max', 'average_ms': 'average',
+    'median_ms': 'median', 'p95_ms': 'p95', 'p99_ms': 'p99',
+}
+
+_TEST_LINE = re.compile(r'^\s*Test:\s*(?P<name>.+?)\s*$')
+# "=== Sorting (Quicksort) ===", "=== 1. Sorting (Quicksort) ===", "=== Fibonacci Benchmark ==="
+_SECTION_LINE = re.compile(r'^\s*===\s*(?:\d+\.\s*)?(?P<name>.+?)(?:\s+Benchmarks?)?\s*===\s*$')
+_TIME_LINE = re.compile(r'^\s*Execution time:\s*(?P<value>[\d.]+)\s*ms\s*$')
+# "  Name: N ms", "Pattern Search: N ms (N matches)", "Recursive (n=35): N ms, result = N"
+_INLINE_TIME = re.compile(r'^(?P<indent>\s*)(?P<name>\S.*?):\s*(?P<value>[\d.]+)\s*ms'
+                          r'(?P<trailer>,\s*result\s*=\s*\S+|\s*\([^)]*\))?\s*$')
+
+
+def record(language: str, suite: str, benchmark: str, metric: str, value, unit: str) -> Dict:
+    """One normalized result."""
+    return {'language': language, 'suite': suite, 'benchmark': benchmark,
+            'metric': metric, 'value': float(value), 'unit': unit}
+
+
+def from_api_results(language: str, data: Dict) -> List[Dict]:
+    """Records for one language's api_results.json (with or without timeseries)."""
+    records = []
+    for key, unit in [('requests_per_second', 'req/s'), ('total_time_seconds', 's'),
+                      ('total_requests', 'count'), ('successful_requests', 'count'),
+                      ('failed_requests', 'count')]:
+        if data.get(key) is not None:
+            records.append(record(language, 'api', API_BENCHMARK, key, data[key], unit))
+    if data.get('total_requests'):
+        rate = data.get('successful_requests', 0) / data['total_requests'] * 100
+        records.append(record(language, 'api', API_BENCHMARK, 'success_rate', rate, '%'))
+    for key, metric in API_LATENCY_METRICS.items():
+        value = (data.get('response_times') or {}).get(key)
+        if value is not None:
+            records.append(record(language, 'api', API_BENCHMARK, metric, value, 'ms'))
+    return records
+
+
+def from_run_all(document: Dict) -> List[Dict]:
+    """
+    Records for the JSON written by python/run_all.py. API entries are skipped;
+    they are read from api_results.json instead.
+    """
+    language = document.get('language', 'python')
+    return [record(language, 'cpu', entry['test_name'], 'execution_time', entry['execution_time_ms'], 'ms')
+            for entry in document.get('benchmarks', [])
+            if 'execution_time_ms' in entry and 'total_requests' not in entry]
+
+
+def parse_stdout(language: str, text: str) -> List[Dict]:
+    """
+    Records parsed from a CPU suite's printed output. Understands
+    "Test: NAME" or "=== NAME ===" followed by "Execution time: N ms", and
+    "NAME: N ms" lines, optionally followed by "(N matches)" or
+    ", result = N". Unindented "NAME: N ms" lines are only read inside a
+    "=== NAME ===" section or with a trailer. A ", result = N" line is one
+    variant of the enclosing section, so "Recursive (n=35)" under
+    "=== Fibonacci Benchmark ===" becomes "Fibonacci Recursive (n=35)".
+    """
+    records = []
+    current = None
+    section = None
+    for line in text.splitlines():
+        match = _TEST_LINE.match(line)
+        if match:
+            current, section = match.group('name'), None
+            continue
+        match = _SECTION_LINE.match(line)
+        if match:
+            current = section = match.group('name')
+            continue
+        match = _TIME_LINE.match(line)
+        if match:
+            if current is not None:
+                records.append(record(language, 'cpu', current, 'execution_time', match.group('value'), 'ms'))
+            current = None
+            continue
+        match = _INLINE_TIME.match(line)
+        if match and (match.group('indent') or match.group('trailer') or section):
+            name = match.group('name').strip()
+            if (match.group('trailer') or '').startswith(',') and section and not name.startswith(section):
+                name = f'{section} {name}'
+            records.append(record(language, 'cpu', name, 'execution_time', match.group('value'), 'ms'))
+            current = None
+    return records
+
+
+def parse_log(language: str, log: Path) -> List[Dict]:
+    """
+    Records parsed from a CPU step log. Warns when nothing in it is
+    recognized, so an unsupported output format does not silently drop a
+    language from the dataset.
+    """
+    records = parse_stdout(language, log.read_text(errors='replace'))
+    if not records:
+        print(f"Warning: no benchmark results recognized in {log} ({language})", file=sys.stderr)
+    return records
+
+
+def from_report(report: Dict, root: Path = ROOT) -> List[Dict]:
+    """
+    Records for a run_benchmarks.py report. CPU results come from the Python
+    runner's JSON where available and from the CPU step logs otherwise.
+    """
+    records = []
+    for language, results in report.get('results', {}).items():
+        if 'api' in results:
+            records += from_api_results(language, results['api'])
+        if 'cpu' in results:
+            records += from_run_all(results['cpu'])
+    with_cpu_json = {language for language, results in report.get('results', {}).items() if 'cpu' in results}
+    for task in report.get('tasks', []):
+        if task.get('kind') != 'cpu' or task.get('status') != 'ok' or task['language'] in with_cpu_json:
+            continue
+        log = root / task['log']
+        if log.exists():
+            records += parse_log(task['language'], log)
+    return records
+
+
+def scan(root: Path = ROOT, languages: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Records from whatever result files exist in the language directories,
+    plus CPU step logs left by run_benchmarks.py.
+    """
+    records = []
+    for language in languages or LANGUAGES:
+        api_file = root / language / 'api_results.json'
+        if api_file.exists():
+            with open(api_file) as f:
+                records += from_api_results(language, json.load(f))
+        cpu_file = root / language / 'benchmark_results.json'
+        if cpu_file.exists():
+            with open(cpu_file) as f:
+                records += from_run_all(json.load(f))
+            continue
+        for log in sorted((root / '.build' / 'logs').glob(f'{language}-*.log')):
+            if '-build' not in log.stem and 'api' not in log.stem:
+                records += parse_log(language, log)
+    return records
+
+
+def aggregate(records: Iterable[Dict]) -> Dict:
+    """
+    Build the columnar dataset. A later record for the same
+    (language, suite, benchmark, metric) replaces an earlier one.
+    """
+    latest = {}
+    for rec in records:
+        latest[(rec['language'], rec['suite'], rec['benchmark'], rec['metric'])] = rec
+    rows = sorted(latest.values(), key=lambda r: (r['language'], r['suite'], r['benchmark'], r['metric']))
+    dataset = {'schema_version': SCHEMA_VERSION}
+    for column in COLUMNS:
+        dataset[column] = [row[column] for row in rows]
+    return dataset
+
+
+def load_dataset(path=DEFAULT_DATASET) -> Dict:
+    """Load a columnar dataset written by save_dataset."""
+    with open(path) as f:
+        dataset = json.load(f)
+    if dataset.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(f"unsupported dataset schema version: {dataset.get('schema_version')}")
+    return dataset
+
+
+def save_dataset(dataset: Dict, path=DEFAULT_DATASET) -> None:
+    with open(path, 'w') as f:
+        json.dump(dataset, f)
+
+
+def pivot(dataset: Dict, metric: str, suite: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """{language: {benchmark: value}} for one metric (optionally one suite)."""
+    table = {}
+    for language, row_suite, benchmark, row_metric, value in zip(
+            dataset['language'], dataset['suite'], dataset['benchmark'], dataset['metric'], dataset['value']):
+        if row_metric == metric and (suite is None or row_suite == suite):
+            table.setdefault(language, {})[benchmark] = value
+    return table
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Aggregate benchmark results into one columnar dataset.')
+    parser.add_argument('--report', default=None,
+                        help=f'run_benchmarks.py report to read (default: {DEFAULT_REPORT.name} if present, '
+                             'otherwise scan the language directories)')
+    parser.add_argument('-o', '--output', default=str(DEFAULT_DATASET),
+                        help=f'dataset to write (default: {DEFAULT_DATASET.name})')
+    args = parser.parse_args(argv)
+
+    report_path = Path(args.report) if args.report else DEFAULT_REPORT
+    if report_path.exists():
+        with open(report_path) as f:
+            records = from_report(json.load(f))
+        print(f"Read {report_path}")
+    elif args.report:
+        print(f"Report not found: {report_path}")
+        return 1
+    else:
+        records = scan()
+        print("Scanned language directories")
+
+    dataset = aggregate(records)
+    save_dataset(dataset, args.output)
+    languages = sorted(set(dataset['language']))
+    print(f"{len(dataset['value'])} results for {len(languages)} languages "
+          f"({', '.join(languages)}) saved to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,11 @@
+import cProfile
+import pstats
+import sys
 import time
 
+# Smaller input used under the profiler, which slows each call considerably
+PROFILE_N = 25
+
 def fibonacci_recursive(n):
     """
     Recursive Fibonacci implementation.
@@ -20,6 +26,149 @@ def fibonacci_iterative(n):
         a, b = b, a + b
     return b
 
+def make_fibonacci_closure():
+    """
+    Recursive Fibonacci bound to a local variable of an enclosing scope.
+    The recursive call resolves through a closure cell instead of a global lookup.
+    """
+    def fib(n):
+        if n <= 1:
+            return n
+        return fib(n - 1) + fib(n - 2)
+    return fib
+
+def fibonacci_explicit_stack(n):
+    """
+    Iterative emulation of the recursive call tree using an explicit stack.
+    Visits exactly the same nodes as fibonacci_recursive, without Python calls.
+    """
+    total = 0
+    stack = [n]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        k = pop()
+        if k <= 1:
+            total += k
+        else:
+            push(k - 1)
+            push(k - 2)
+    return total
+
+def recursive_call_count(n):
+    """
+    Number of calls made by fibonacci_recursive(n): 2 * fib(n + 1) - 1.
+    """
+    return 2 * fibonacci_iterative(n + 1) - 1
+
+def _count_calls_monitoring(func, n):
+    """
+    Count Python function starts while running func(n) using sys.monitoring.
+    Returns None on interpreters without sys.monitoring (CPython < 3.12) or
+    when another tool (a debugger or coverage) holds the profiler tool ID.
+    """
+    monitoring = getattr(sys, 'monitoring', None)
+    if monitoring is None:
+        return None
+
+    tool_id = monitoring.PROFILER_ID
+    counter = [0]
+
+    def on_start(code, offset):
+        counter[0] += 1
+
+    try:
+        monitoring.use_tool_id(tool_id, 'fibonacci-call-overhead')
+    except ValueError:
+        # The ID is taken; only free it if this function acquired it
+        return None
+    try:
+        monitoring.register_callback(tool_id, monitoring.events.PY_START, on_start)
+        monitoring.set_events(tool_id, monitoring.events.PY_START)
+        func(n)
+    finally:
+        try:
+            monitoring.set_events(tool_id, 0)
+            monitoring.register_callback(tool_id, monitoring.events.PY_START, None)
+        finally:
+            monitoring.free_tool_id(tool_id)
+    return counter[0]
+
+def profile_call_overhead(func, n):
+    """
+    Run func(n) plain and under cProfile. The difference between the two runs is
+    the instrumentation cost; the profile reports how much of the profiled time
+    cProfile attributes to the function itself. Returns None if another
+    profiler is already active (CPython 3.12+ allows only one).
+    """
+    start_time = time.perf_counter()
+    func(n)
+    plain_ms = (time.perf_counter() - start_time) * 1000
+
+    profiler = cProfile.Profile()
+    start_time = time.perf_counter()
+    try:
+        profiler.runcall(func, n)
+    except ValueError:
+        return None
+    profiled_ms = (time.perf_counter() - start_time) * 1000
+
+    stats = pstats.Stats(profiler)
+    own_ms = 0.0
+    total_calls = 0
+    for (filename, _, name), (_, nc, tt, _, _) in stats.stats.items():
+        if name == func.__name__ and filename == func.__code__.co_filename:
+            own_ms += tt * 1000
+            total_calls += nc
+
+    return {
+        'n': n,
+        'plain_time_ms': plain_ms,
+        'profiled_time_ms': profiled_ms,
+        'instrumentation_ms': max(profiled_ms - plain_ms, 0.0),
+        'function_time_ms': own_ms,
+        'total_calls': total_calls
+    }
+
+def run_call_overhead_benchmark(n=35, profile_n=None):
+    """
+    Compare interpreter call overhead for the Fibonacci(n) recursion tree.
+    Times a plain recursive function, a closure-bound variant and an explicit-stack
+    emulation, reports calls per second, and profiles each at profile_n.
+    """
+    variants = [
+        ('Plain Function', fibonacci_recursive),
+        ('Closure-bound', make_fibonacci_closure()),
+        ('Explicit Stack', fibonacci_explicit_stack)
+    ]
+    if profile_n is None:
+        profile_n = PROFILE_N
+    calls = recursive_call_count(n)
+    results = []
+
+    for label, func in variants:
+        start_time = time.perf_counter()
+        result = func(n)
+        end_time = time.perf_counter()
+        execution_time = (end_time - start_time) * 1000
+
+        entry = {
+            'test_name': f'Fibonacci Call Overhead: {label} (n={n})',
+            'execution_time_ms': execution_time,
+            'result': result,
+            'calls': calls,
+            'calls_per_second': calls / (end_time - start_time),
+            'ns_per_call': (end_time - start_time) * 1e9 / calls
+        }
+        if func is not fibonacci_explicit_stack:
+            entry['monitored_calls'] = _count_calls_monitoring(func, profile_n)
+            profile = profile_call_overhead(func, profile_n)
+            if profile is not None:
+                entry['profile'] = profile
+        results.append(entry)
+
+    return results
+
 def run_benchmark():
     """
     Run Fibonacci benchmarks.
@@ -53,6 +202,27 @@ def run_benchmark():
     return results
 
 if __name__ == '__main__':
+    if '--call-overhead' in sys.argv:
+        print(f"Python {sys.version.split()[0]} ({sys.implementation.name})")
+        print()
+        for result in run_call_overhead_benchmark():
+            print(f"Test: {result['test_name']}")
+            print(f"Result: {result['result']}")
+            print(f"Execution time: {result['execution_time_ms']:.2f} ms")
+            print(f"Calls: {result['calls']}")
+            print(f"Calls/sec: {result['calls_per_second']:,.0f}")
+            print(f"ns/call: {result['ns_per_call']:.1f}")
+            if result.get('monitored_calls') is not None:
+                print(f"sys.monitoring calls: {result['monitored_calls']}")
+            if 'profile' in result:
+                profile = result['profile']
+                print(f"cProfile (n={profile['n']}): {profile['total_calls']} calls, "
+                      f"{profile['plain_time_ms']:.2f} ms plain, "
+                      f"{profile['profiled_time_ms']:.2f} ms profiled "
+                      f"({profile['function_time_ms']:.2f} ms in function)")
+            print()
+        sys.exit(0)
+
     results = run_benchmark()
     for result in results:
         print(f"Test: {result['test_name']}")
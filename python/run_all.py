@@ -1,55 +1,191 @@
 #!/usr/bin/env python3
 """
 Run all Python benchmarks.
+
+Benchmark modules are discovered in this directory (any module defining a
+top-level run_benchmark function, sync or async). Each module runs in its own
+subprocess so heap growth in one benchmark cannot skew the next, and all
+results are collected into one JSON document.
+
+Usage:
+    python run_all.py                      # run everything
+    python run_all.py -k fib -k strings    # only modules matching a pattern
+    python run_all.py --output results.json
 """
-import sorting
-import fibonacci
-import matrix
-import strings
-import api_requests
+import argparse
+import ast
+import asyncio
+import contextlib
+import datetime
+import importlib
+import inspect
+import json
+import os
+import platform
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARK_DIR / 'benchmark_results.json'
+
+def discover_benchmarks(directory=BENCHMARK_DIR):
+    """
+    Find modules that define a top-level run_benchmark function.
+    Modules are parsed, not imported, so discovery never runs benchmark code.
+    """
+    modules = []
+    for path in sorted(directory.glob('*.py')):
+        if path.stem == Path(__file__).stem:
+            continue
+        try:
+            tree = ast.parse(path.read_text(), filename=str(path))
+        except SyntaxError:
+            continue
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == 'run_benchmark':
+                modules.append(path.stem)
+                break
+    return modules
+
+def select_benchmarks(modules, patterns):
+    """
+    Keep modules whose name contains any of the -k patterns (case-insensitive).
+    """
+    if not patterns:
+        return modules
+    patterns = [p.lower() for p in patterns]
+    return [m for m in modules if any(p in m.lower() for p in patterns)]
+
+def normalize_results(module_name, raw):
+    """
+    Turn whatever run_benchmark returned into a list of result dicts that all
+    carry module, test_name and execution_time_ms.
+    """
+    entries = raw if isinstance(raw, list) else [raw]
+    results = []
+    for entry in entries:
+        entry = dict(entry)
+        # API benchmarks report throughput metrics rather than a single timing
+        if 'test_name' not in entry:
+            entry['test_name'] = f"{module_name.replace('_', ' ').title()} ({entry.get('total_requests', '?')} requests)"
+        if 'execution_time_ms' not in entry and 'total_time_seconds' in entry:
+            entry['execution_time_ms'] = entry['total_time_seconds'] * 1000
+        # The full per-request timeseries stays in the module's own results file
+        entry.pop('timeseries', None)
+        entry['module'] = module_name
+        results.append(entry)
+    return results
+
+def run_worker(module_name):
+    """
+    Subprocess entry point: run one module's benchmark and write its results as
+    JSON to stdout. Anything the benchmark prints goes to stderr instead.
+    """
+    sys.path.insert(0, str(BENCHMARK_DIR))
+    with contextlib.redirect_stdout(sys.stderr):
+        module = importlib.import_module(module_name)
+        if inspect.iscoroutinefunction(module.run_benchmark):
+            raw = asyncio.run(module.run_benchmark())
+        else:
+            raw = module.run_benchmark()
+    json.dump(normalize_results(module_name, raw), sys.stdout, default=str)
+
+def run_isolated(module_name, timeout=None):
+    """
+    Run one benchmark module in a fresh interpreter.
+    Returns (results, error); error is None on success.
+    """
+    try:
+        proc = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--worker', module_name],
+            cwd=BENCHMARK_DIR, capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return [], f'timed out after {timeout}s'
+
+    if proc.returncode != 0:
+        stderr = proc.stderr.strip().splitlines()
+        return [], stderr[-1] if stderr else f'exited with status {proc.returncode}'
+    try:
+        return json.loads(proc.stdout), None
+    except json.JSONDecodeError as e:
+        return [], f'invalid results output: {e}'
+
+def run_all(modules, timeout=None, verbose=True):
+    """
+    Run each module in isolation and build the combined results document.
+    """
+    document = {
+        'language': 'python',
+        'python_version': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'started_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'benchmarks': [],
+        'failures': []
+    }
+
+    for module_name in modules:
+        if verbose:
+            print(f"Running {module_name}...")
+        results, error = run_isolated(module_name, timeout=timeout)
+        if error is not None:
+            document['failures'].append({'module': module_name, 'error': error})
+            if verbose:
+                print(f"  FAILED: {error}")
+        for result in results:
+            document['benchmarks'].append(result)
+            if verbose:
+                print(f"  {result['test_name']}: {result['execution_time_ms']:.2f} ms")
+        if verbose:
+            print()
+
+    return document
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run all Python benchmarks in isolated subprocesses.')
+    parser.add_argument('-k', dest='patterns', action='append', default=[],
+                        help='only run modules whose name contains PATTERN (repeatable)')
+    parser.add_argument('-o', '--output', default=str(DEFAULT_OUTPUT),
+                        help=f'results document to write (default: {DEFAULT_OUTPUT.name})')
+    parser.add_argument('--timeout', type=float, default=None,
+                        help='per-module timeout in seconds')
+    parser.add_argument('--list', action='store_true', help='list discovered benchmarks and exit')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.worker)
+        return 0
+
+    modules = select_benchmarks(discover_benchmarks(), args.patterns)
+    if args.list:
+        print("\n".join(modules))
+        return 0
+    if not modules:
+        print("No benchmarks matched.")
+        return 1
 
-def main():
     print("=" * 60)
     print("Python Performance Benchmarks")
     print("=" * 60)
     print()
-    
-    # Sorting
-    print("Running Sorting Benchmark...")
-    result = sorting.run_benchmark()
-    print(f"  {result['test_name']}: {result['execution_time_ms']:.2f} ms")
-    print()
-    
-    # Fibonacci
-    print("Running Fibonacci Benchmarks...")
-    results = fibonacci.run_benchmark()
-    for result in results:
-        print(f"  {result['test_name']}: {result['execution_time_ms']:.2f} ms")
-    print()
-    
-    # Matrix
-    print("Running Matrix Multiplication Benchmark...")
-    result = matrix.run_benchmark()
-    print(f"  {result['test_name']}: {result['execution_time_ms']:.2f} ms")
-    print()
-    
-    # Strings
-    print("Running String Manipulation Benchmarks...")
-    results = strings.run_benchmark()
-    for result in results:
-        print(f"  {result['test_name']}: {result['execution_time_ms']:.2f} ms")
-    print()
-    
-    # API Requests
-    print("Running API Request Benchmark...")
-    result = api_requests.run_benchmark()
-    print(f"  {result['test_name']}: {result['execution_time_ms']:.2f} ms")
-    print(f"  Successful: {result['successful_requests']}/{result['total_requests']}")
-    print()
-    
+
+    document = run_all(modules, timeout=args.timeout)
+
+    with open(args.output, 'w') as f:
+        json.dump(document, f, indent=2, default=str)
+
     print("=" * 60)
-    print("All benchmarks completed!")
+    if document['failures']:
+        print(f"{len(document['failures'])} of {len(modules)} benchmark modules failed")
+    else:
+        print("All benchmarks completed!")
+    print(f"Results saved to {args.output}")
     print("=" * 60)
+    return 1 if document['failures'] else 0
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -1,5 +1,18 @@
+import io
+import mmap
+import os
+import sys
 import time
 import re
+import tracemalloc
+from array import array, typecodes
+from concurrent.futures import ProcessPoolExecutor
+
+# 'u' is deprecated since Python 3.13 in favour of the equivalent 'w' typecode
+UNICODE_TYPECODE = 'w' if 'w' in typecodes else 'u'
+
+# Sizes used by the string builder comparison (10^4 .. 10^7 items)
+BUILDER_SIZES = [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
 
 def reverse_string(s):
     """
@@ -7,6 +20,118 @@ def reverse_string(s):
     """
     return s[::-1]
 
+def reverse_bytearray_inplace(buf):
+    """
+    Reverse a bytearray in place; no new buffer is allocated.
+    """
+    buf.reverse()
+    return buf
+
+def slice_bytes(data, chunk_size):
+    """
+    Split a buffer into chunk_size pieces with bytes slicing (one copy per slice).
+    """
+    data = bytes(data) if not isinstance(data, bytes) else data
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+def slice_memoryview(data, chunk_size):
+    """
+    Split a buffer into chunk_size pieces as memoryview slices, without copying.
+    """
+    view = memoryview(data)
+    return [view[i:i + chunk_size] for i in range(0, len(view), chunk_size)]
+
+# In a byte-reversed UTF-8 buffer every multi-byte character shows up as its
+# continuation bytes followed by its lead byte
+_REVERSED_UTF8_CHAR = re.compile(rb'[\x80-\xbf]+[\xc0-\xf7]')
+
+def reverse_utf8(data):
+    """
+    Reverse UTF-8 encoded text by code point, like str[::-1], with a single copy.
+    The bytes are copied once and reversed in place, then each multi-byte
+    character is put back in order.
+    """
+    out = bytearray(data)
+    out.reverse()
+    for match in _REVERSED_UTF8_CHAR.finditer(out):
+        start, end = match.span()
+        out[start:end] = out[start:end][::-1]
+    return out
+
+def reverse_utf8_file(path):
+    """
+    Reverse a UTF-8 text file loaded through mmap; the file is read straight
+    into the output buffer without an intermediate bytes object.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return bytearray()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return reverse_utf8(mm)
+
+def measure_allocations(func, args, payload_bytes, prepare=None):
+    """
+    Time func(*args), then run it again under tracemalloc and return
+    (time in ms, bytes allocated, copies), where copies is the peak allocation
+    expressed in multiples of the payload. prepare(args) returns fresh arguments
+    for each run when func mutates its input.
+    """
+    run_args = prepare(args) if prepare else args
+    start_time = time.perf_counter()
+    func(*run_args)
+    end_time = time.perf_counter()
+
+    run_args = prepare(args) if prepare else args
+    tracemalloc.start()
+    try:
+        func(*run_args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    copies = peak / payload_bytes if payload_bytes else 0.0
+    return (end_time - start_time) * 1000, peak, copies
+
+def reverse_utf8_via_str(data):
+    """
+    Reverse UTF-8 encoded text by decoding, reversing the str and re-encoding.
+    """
+    return bytes(data).decode('utf-8')[::-1].encode('utf-8')
+
+def run_buffer_benchmark(size=1000000, path=None, chunk_size=4096):
+    """
+    Buffer-oriented reversal and slicing benchmarks. Each entry reports the bytes
+    allocated while the operation ran and the equivalent number of payload copies.
+    """
+    text = ('a' * 9 + 'é') * (size // 10)
+    encoded = text.encode('utf-8')
+    def fresh_bytearray(args):
+        return (bytearray(args[0]),)
+
+    cases = [
+        ('str[::-1]', reverse_string, (text,), None),
+        ('bytearray.reverse() in place', reverse_bytearray_inplace, (encoded,), fresh_bytearray),
+        ('bytes slicing', slice_bytes, (encoded, chunk_size), None),
+        ('memoryview slicing', slice_memoryview, (encoded, chunk_size), None),
+        ('UTF-8 reversal via str', reverse_utf8_via_str, (encoded,), None),
+        ('UTF-8 reversal in place', reverse_utf8, (encoded,), None)
+    ]
+    if path is not None:
+        cases.append(('UTF-8 reversal (mmap file)', reverse_utf8_file, (path,), None))
+
+    results = []
+    for label, func, args, prepare in cases:
+        payload_bytes = os.path.getsize(path) if func is reverse_utf8_file else len(encoded)
+        execution_time, allocated, copies = measure_allocations(func, args, payload_bytes, prepare)
+        results.append({
+            'test_name': f'Buffer: {label}',
+            'execution_time_ms': execution_time,
+            'payload_bytes': payload_bytes,
+            'bytes_allocated': allocated,
+            'copies': copies
+        })
+
+    return results
+
 def concatenate_strings(iterations):
     """
     Concatenate strings multiple times.
@@ -16,6 +141,119 @@ def concatenate_strings(iterations):
         result += str(i)
     return result
 
+def concatenate_join(iterations):
+    """
+    Build the same string with str.join over a generator.
+    """
+    return ''.join(str(i) for i in range(iterations))
+
+def concatenate_stringio(iterations):
+    """
+    Build the same string by writing into an io.StringIO buffer.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    for i in range(iterations):
+        write(str(i))
+    return buf.getvalue()
+
+def concatenate_bytearray(iterations):
+    """
+    Build the same string as ASCII bytes appended to a bytearray.
+    """
+    buf = bytearray()
+    for i in range(iterations):
+        buf += b'%d' % i
+    return buf.decode('ascii')
+
+def concatenate_array(iterations):
+    """
+    Build the same string in an array of unicode code points.
+    """
+    buf = array(UNICODE_TYPECODE)
+    extend = buf.fromunicode
+    for i in range(iterations):
+        extend(str(i))
+    return buf.tounicode()
+
+def concatenate_memoryview(iterations):
+    """
+    Build the same string in a preallocated bytearray written through a memoryview,
+    doubling the buffer when it fills up.
+    """
+    buf = bytearray(max(iterations, 16))
+    view = memoryview(buf)
+    pos = 0
+    for i in range(iterations):
+        chunk = b'%d' % i
+        end = pos + len(chunk)
+        if end > len(buf):
+            view.release()
+            buf.extend(bytes(len(buf)))
+            view = memoryview(buf)
+        view[pos:end] = chunk
+        pos = end
+    result = str(view[:pos], 'ascii')
+    view.release()
+    return result
+
+# String builder variants compared by run_builder_benchmark
+STRING_BUILDERS = [
+    ('+= (in-place append)', concatenate_strings),
+    ("''.join(generator)", concatenate_join),
+    ('io.StringIO', concatenate_stringio),
+    ('bytearray', concatenate_bytearray),
+    (f"array('{UNICODE_TYPECODE}')", concatenate_array),
+    ('memoryview buffer', concatenate_memoryview)
+]
+
+def measure_peak_memory(func, *args):
+    """
+    Return the peak number of bytes allocated by func(*args), as seen by tracemalloc.
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def run_builder_benchmark(sizes=None):
+    """
+    Compare string builder patterns side by side at each size.
+    Time is measured without tracing; peak memory in a separate traced run.
+    """
+    if sizes is None:
+        sizes = BUILDER_SIZES
+    results = []
+
+    for size in sizes:
+        expected_length = None
+        for label, builder in STRING_BUILDERS:
+            start_time = time.perf_counter()
+            built = builder(size)
+            end_time = time.perf_counter()
+            execution_time = (end_time - start_time) * 1000
+
+            if expected_length is None:
+                expected_length = len(built)
+            correct = len(built) == expected_length
+            del built
+
+            results.append({
+                'test_name': f'String Builder: {label} ({size:,} items)',
+                'builder': label,
+                'iterations': size,
+                'execution_time_ms': execution_time,
+                'peak_memory_bytes': measure_peak_memory(builder, size),
+                'result_length': expected_length,
+                'correct': correct
+            })
+
+    return results
+
 def pattern_search(text, pattern):
     """
     Search for pattern in text using regex.
@@ -23,6 +261,122 @@ def pattern_search(text, pattern):
     matches = re.findall(pattern, text)
     return len(matches)
 
+def count_pattern_matches(data, pattern, start=0, end=None, lead_in=0, lead_out=None):
+    """
+    Count regex matches that start inside data[start:end] without building a list.
+    Scanning begins lead_in bytes early so the regex state at start is the same
+    as in a single pass over the whole buffer, and stops lead_out bytes past end
+    (at the end of data if lead_out is None), so a match that starts before end
+    and is shorter than lead_out is still found whole.
+    """
+    if end is None:
+        end = len(data)
+    scan_end = len(data) if lead_out is None else min(end + lead_out, len(data))
+    regex = re.compile(pattern)
+    count = 0
+    for match in regex.finditer(data, max(start - lead_in, 0), scan_end):
+        match_start = match.start()
+        if match_start >= end:
+            break
+        if match_start >= start:
+            count += 1
+    return count
+
+def _count_file_chunk(path, pattern, start, end, overlap):
+    """
+    Worker for count_pattern_file: map the file and count matches in one chunk.
+    """
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return count_pattern_matches(mm, pattern, start, end, overlap, overlap)
+
+def split_chunks(mm, chunk_size):
+    """
+    Split a buffer into (start, end) ranges of about chunk_size bytes,
+    moving each boundary forward to the next newline.
+    """
+    size = len(mm)
+    chunks = []
+    start = 0
+    while start < size:
+        end = min(start + chunk_size, size)
+        if end < size:
+            newline = mm.find(b'\n', end)
+            end = size if newline == -1 else newline + 1
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+def count_pattern_file(path, pattern, workers=None, chunk_size=64 * 1024 * 1024, overlap=4096):
+    """
+    Count matches of a bytes regex in a file of any size through mmap.
+    With workers > 1 the file is split into newline-aligned chunks that are
+    searched on a process pool; each chunk is scanned from overlap bytes before
+    its start to overlap bytes past its end, so matches shorter than overlap are
+    counted exactly once.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode('utf-8')
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if workers <= 1 or len(mm) <= chunk_size:
+                return count_pattern_matches(mm, pattern)
+            chunks = split_chunks(mm, chunk_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_count_file_chunk, path, pattern, start, end, overlap)
+            for start, end in chunks
+        ]
+        return sum(future.result() for future in futures)
+
+# Size of the corpus --corpus writes when the file does not exist; pass
+# --corpus-size for a file larger than the page cache
+DEFAULT_CORPUS_MB = 64
+
+def write_corpus(path, size_bytes, line=b"Lorem ipsum dolor sit amet consectetur adipiscing elit\n"):
+    """
+    Write a corpus of at least size_bytes by repeating a line of text.
+    """
+    block = line * max(1, (1024 * 1024) // len(line))
+    written = 0
+    with open(path, 'wb') as f:
+        while written < size_bytes:
+            f.write(block)
+            written += len(block)
+    return written
+
+def run_corpus_benchmark(path, pattern=rb'\b\w{5}\b', workers=None):
+    """
+    Search a corpus file through mmap, single-process and on a process pool,
+    and report throughput in MB/s.
+    """
+    size = os.path.getsize(path)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    results = []
+
+    for label, pool_size in [('single process', 1), (f'{workers} workers', workers)]:
+        start_time = time.perf_counter()
+        matches = count_pattern_file(path, pattern, workers=pool_size)
+        end_time = time.perf_counter()
+        elapsed = end_time - start_time
+
+        results.append({
+            'test_name': f'Corpus Pattern Search ({label})',
+            'execution_time_ms': elapsed * 1000,
+            'corpus_bytes': size,
+            'matches_found': matches,
+            'throughput_mb_s': size / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+        })
+
+    return results
+
 def run_benchmark():
     """
     Run string manipulation benchmarks.
@@ -71,6 +425,42 @@ def run_benchmark():
     return results
 
 if __name__ == '__main__':
+    if '--builders' in sys.argv:
+        print(f"{'Builder':<24} {'Items':>12} {'Time (ms)':>12} {'Peak memory':>14}")
+        for result in run_builder_benchmark():
+            print(f"{result['builder']:<24} {result['iterations']:>12,} "
+                  f"{result['execution_time_ms']:>12.2f} "
+                  f"{result['peak_memory_bytes'] / 1024 / 1024:>11.2f} MB")
+        sys.exit(0)
+
+    if '--buffers' in sys.argv:
+        # Usage: strings.py --buffers [FILE]
+        args = sys.argv[1:]
+        index = args.index('--buffers')
+        path = args[index + 1] if index + 1 < len(args) and not args[index + 1].startswith('--') else None
+        print(f"{'Operation':<32} {'Time (ms)':>10} {'Allocated':>14} {'Copies':>8}")
+        for result in run_buffer_benchmark(path=path):
+            print(f"{result['test_name'][len('Buffer: '):]:<32} {result['execution_time_ms']:>10.2f} "
+                  f"{result['bytes_allocated']:>14,} {result['copies']:>8.2f}")
+        sys.exit(0)
+
+    if '--corpus' in sys.argv:
+        # Usage: strings.py --corpus PATH [--corpus-size MB] [--workers N]
+        args = sys.argv[1:]
+        corpus_path = args[args.index('--corpus') + 1]
+        workers = int(args[args.index('--workers') + 1]) if '--workers' in args else None
+        if not os.path.exists(corpus_path):
+            size_mb = int(args[args.index('--corpus-size') + 1]) if '--corpus-size' in args else DEFAULT_CORPUS_MB
+            print(f"Writing {size_mb} MB corpus to {corpus_path}...")
+            write_corpus(corpus_path, size_mb * 1024 * 1024)
+        for result in run_corpus_benchmark(corpus_path, workers=workers):
+            print(f"Test: {result['test_name']}")
+            print(f"Execution time: {result['execution_time_ms']:.2f} ms")
+            print(f"Matches found: {result['matches_found']}")
+            print(f"Throughput: {result['throughput_mb_s']:.1f} MB/s")
+            print()
+        sys.exit(0)
+
     results = run_benchmark()
     for result in results:
         print(f"Test: {result['test_name']}")
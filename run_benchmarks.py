@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Cross-language benchmark orchestrator.
+
+Runs every language suite through a small dependency-aware scheduler:
+- compile steps run in parallel, and their outputs are cached by a hash of
+  the sources, so unchanged suites are not rebuilt;
+- CPU-bound suites run one at a time, pinned to a dedicated core, while
+  builds and I/O-bound (API) suites run on the remaining cores;
+- a failing or missing toolchain only affects the tasks that depend on it.
+
+Every task's output goes to .build/logs/, and all suite results are collected
+into one JSON report.
+
+Usage:
+    python run_benchmarks.py                    # everything
+    python run_benchmarks.py --langs go,rust    # only some languages
+    python run_benchmarks.py --list             # show the task graph
+"""
+import argparse
+import datetime
+import glob
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).parent.resolve()
+BUILD_DIR = ROOT / '.build'
+LOG_DIR = BUILD_DIR / 'logs'
+STAMP_DIR = BUILD_DIR / 'stamps'
+DEFAULT_REPORT = ROOT / 'benchmark_report.json'
+
+# Task kinds: builds and I/O suites share the worker pool, CPU suites run
+# exclusively on their own core
+BUILD, CPU, IO = 'build', 'cpu', 'io'
+
+CPP_BENCHMARKS = ['sorting', 'fibonacci', 'matrix', 'strings']
+
+
+class Task:
+    """One step in the benchmark graph: a command run in a language directory."""
+
+    def __init__(self, name: str, language: str, kind: str, command: List[str],
+                 deps: Optional[List[str]] = None, requires: Optional[str] = None,
+                 sources: Optional[List[str]] = None, artifacts: Optional[List[Path]] = None):
+        self.name = name
+        self.language = language
+        self.kind = kind
+        self.command = command
+        self.cwd = ROOT / language
+        self.deps = deps or []
+        # Executable that must be on PATH, otherwise the task is skipped
+        self.requires = requires
+        # Glob patterns (relative to the language directory) hashed for the build cache
+        self.sources = sources or []
+        self.artifacts = artifacts or []
+
+    @property
+    def log_path(self) -> Path:
+        return LOG_DIR / f"{self.name.replace(':', '-')}.log"
+
+
+def define_tasks() -> List[Task]:
+    """The full benchmark graph, in the order suites are reported."""
+    tasks = [
+        # Python: CPU modules and the API benchmark as separate steps
+        Task('python:cpu', 'python', CPU,
+             [sys.executable, 'run_all.py', '-k', 'sorting', '-k', 'fibonacci',
+              '-k', 'matrix', '-k', 'strings', '-o', 'benchmark_results.json']),
+        Task('python:api', 'python', IO, [sys.executable, 'api_requests.py']),
+
+        Task('javascript:suite', 'javascript', CPU, ['node', 'run_all.js'], requires='node'),
+
+        Task('go:build', 'go', BUILD, ['go', 'build', '-o', str(BUILD_DIR / 'go' / 'benchmarks'), '.'],
+             requires='go', sources=['*.go', 'go.mod'], artifacts=[BUILD_DIR / 'go' / 'benchmarks']),
+        Task('go:suite', 'go', CPU, [str(BUILD_DIR / 'go' / 'benchmarks')], deps=['go:build']),
+
+        # Cargo keeps its own incremental build in target/
+        Task('rust:build', 'rust', BUILD, ['cargo', 'build', '--release', '--quiet'],
+             requires='cargo', sources=['src/*.rs', 'Cargo.toml'],
+             artifacts=[ROOT / 'rust' / 'target' / 'release' / 'benchmarks']),
+        Task('rust:suite', 'rust', CPU, [str(ROOT / 'rust' / 'target' / 'release' / 'benchmarks')],
+             deps=['rust:build']),
+
+        Task('java:build', 'java', BUILD,
+             ['javac', '-d', str(BUILD_DIR / 'java')] + sorted(glob.glob('src/*.java', root_dir=ROOT / 'java')),
+             requires='javac', sources=['src/*.java'], artifacts=[BUILD_DIR / 'java' / 'Main.class']),
+        Task('java:suite', 'java', CPU, ['java', '-cp', str(BUILD_DIR / 'java'), 'Main'],
+             deps=['java:build'], requires='java'),
+    ]
+
+    # C++: one compile step per benchmark binary, so they build in parallel
+    for name in CPP_BENCHMARKS + ['api_requests']:
+        binary = BUILD_DIR / 'cpp' / name
+        command = ['g++', '-std=c++17', '-O2', f'{name}.cpp', '-o', str(binary)]
+        if name == 'api_requests':
+            command.append('-lcurl')
+        tasks.append(Task(f'cpp:build:{name}', 'cpp', BUILD, command,
+                          requires='g++', sources=[f'{name}.cpp'], artifacts=[binary]))
+        tasks.append(Task(f'cpp:{name}', 'cpp', IO if name == 'api_requests' else CPU,
+                          [str(binary)], deps=[f'cpp:build:{name}']))
+
+    tasks += [
+        Task('ruby:suite', 'ruby', CPU, ['ruby', 'run_all.rb'], requires='ruby'),
+
+        Task('elixir:deps', 'elixir', BUILD, ['mix', 'deps.get'], requires='mix', sources=['mix.exs'],
+             artifacts=[ROOT / 'elixir' / 'deps']),
+        Task('elixir:suite', 'elixir', CPU, ['elixir', 'run_all.exs'], deps=['elixir:deps'], requires='elixir'),
+
+        Task('csharp:build', 'csharp', BUILD, ['dotnet', 'build', '-c', 'Release', '--nologo', '-v', 'q'],
+             requires='dotnet', sources=['*.cs', '*.csproj']),
+        Task('csharp:suite', 'csharp', CPU, ['dotnet', 'run', '-c', 'Release', '--no-build'],
+             deps=['csharp:build'], requires='dotnet'),
+
+        Task('scala:build', 'scala', BUILD, ['sbt', 'compile'], requires='sbt',
+             sources=['build.sbt', 'src/**/*.scala'], artifacts=[ROOT / 'scala' / 'target']),
+        Task('scala:suite', 'scala', CPU, ['sbt', 'run'], deps=['scala:build'], requires='sbt'),
+    ]
+    return tasks
+
+
+def source_hash(task: Task) -> str:
+    """Hash of a build step's command and every source file it reads."""
+    digest = hashlib.sha256(json.dumps(task.command).encode())
+    for pattern in task.sources:
+        for path in sorted(glob.glob(pattern, root_dir=task.cwd, recursive=True)):
+            digest.update(path.encode())
+            digest.update((task.cwd / path).read_bytes())
+    return digest.hexdigest()
+
+
+def build_is_cached(task: Task, digest: str) -> bool:
+    """Whether a build step already ran on these exact sources and its outputs still exist."""
+    stamp = STAMP_DIR / f"{task.name.replace(':', '-')}.sha256"
+    return (stamp.exists() and stamp.read_text() == digest
+            and all(path.exists() for path in task.artifacts))
+
+
+def record_build(task: Task, digest: str) -> None:
+    """Remember the source hash of a successful build step."""
+    STAMP_DIR.mkdir(parents=True, exist_ok=True)
+    (STAMP_DIR / f"{task.name.replace(':', '-')}.sha256").write_text(digest)
+
+
+def core_sets(pin: bool):
+    """
+    Split the available cores into one for CPU suites and the rest for builds
+    and I/O suites. Returns (cpu_cores, shared_cores), both None without pinning.
+    """
+    if not pin or not hasattr(os, 'sched_getaffinity'):
+        return None, None
+    cores = sorted(os.sched_getaffinity(0))
+    if len(cores) < 2:
+        return set(cores), set(cores)
+    return {cores[-1]}, set(cores[:-1])
+
+
+def execute(task: Task, cores, timeout: Optional[float]) -> Dict:
+    """Run one task, logging its output. Returns its report entry."""
+    for path in task.artifacts:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    entry = {'name': task.name, 'language': task.language, 'kind': task.kind,
+             'log': str(task.log_path.relative_to(ROOT))}
+    with open(task.log_path, 'w') as log:
+        try:
+            proc = subprocess.Popen(task.command, cwd=task.cwd, stdout=log, stderr=subprocess.STDOUT)
+        except OSError as e:
+            entry.update(status='failed', error=str(e), duration_s=0.0)
+            return entry
+        if cores is not None:
+            try:
+                os.sched_setaffinity(proc.pid, cores)
+            except OSError:
+                pass
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            entry.update(status='failed', error=f'timed out after {timeout}s')
+            returncode = None
+    entry['duration_s'] = round(time.perf_counter() - start, 3)
+    if returncode is not None:
+        entry['returncode'] = returncode
+        entry['status'] = 'ok' if returncode == 0 else 'failed'
+        if returncode != 0:
+            entry['error'] = f'exited with status {returncode}'
+    return entry
+
+
+def run_graph(tasks: List[Task], jobs: int, timeout: Optional[float] = None,
+              pin: bool = True, rebuild: bool = False) -> Dict[str, Dict]:
+    """
+    Run the task graph and return {task name: report entry}. A task starts
+    once all of its dependencies succeeded; if one failed or was skipped, the
+    task is skipped too. Only one CPU task runs at a time.
+    """
+    cpu_cores, shared_cores = core_sets(pin)
+    # With a single core there is nothing to isolate CPU suites from, so they
+    # wait for builds to finish instead of competing with them
+    exclusive_cpu = cpu_cores is not None and cpu_cores == shared_cores
+    names = {task.name for task in tasks}
+    pending = list(tasks)
+    running = {}
+    entries = {}
+    digests = {}
+
+    def finish(task, status, error=None, **extra):
+        entries[task.name] = {'name': task.name, 'language': task.language, 'kind': task.kind,
+                              'status': status, **({'error': error} if error else {}), **extra}
+        print(f"  {status.upper():<7} {task.name}" + (f" ({error})" if error else ''))
+
+    with ThreadPoolExecutor(max_workers=jobs + 1) as pool:
+        while pending or running:
+            kinds_running = [task.kind for task in running.values()]
+            for task in list(pending):
+                deps = [d for d in task.deps if d in names]
+                if any(d not in entries for d in deps):
+                    continue
+                blocked = [d for d in deps if entries[d]['status'] not in ('ok', 'cached')]
+                if blocked:
+                    pending.remove(task)
+                    finish(task, 'skipped', f"{', '.join(blocked)} did not succeed")
+                    continue
+                if task.requires and shutil.which(task.requires) is None:
+                    pending.remove(task)
+                    finish(task, 'skipped', f'{task.requires} not installed')
+                    continue
+                if task.kind == BUILD and task.name not in digests:
+                    digests[task.name] = source_hash(task)
+                    if not rebuild and build_is_cached(task, digests[task.name]):
+                        pending.remove(task)
+                        finish(task, 'cached')
+                        continue
+                # Leave the task pending until a slot of its kind frees up
+                if task.kind == CPU:
+                    if CPU in kinds_running or (exclusive_cpu and BUILD in kinds_running):
+                        continue
+                else:
+                    shared = len(kinds_running) - kinds_running.count(CPU)
+                    if shared >= jobs or (exclusive_cpu and task.kind == BUILD and CPU in kinds_running):
+                        continue
+                pending.remove(task)
+                print(f"  START   {task.name}")
+                cores = cpu_cores if task.kind == CPU else shared_cores
+                running[pool.submit(execute, task, cores, timeout)] = task
+                kinds_running.append(task.kind)
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                entry = future.result()
+                entries[task.name] = entry
+                if entry['status'] == 'ok' and task.kind == BUILD:
+                    record_build(task, digests[task.name])
+                print(f"  {entry['status'].upper():<7} {task.name} ({entry['duration_s']:.1f}s)"
+                      + (f" - {entry['error']}, see {entry['log']}" if 'error' in entry else ''))
+    return entries
+
+
+def collect_results(languages: List[str]) -> Dict[str, Dict]:
+    """Gather each language's result files written by its suites."""
+    results = {}
+    for language in languages:
+        collected = {}
+        api_file = ROOT / language / 'api_results.json'
+        if api_file.exists():
+            try:
+                with open(api_file) as f:
+                    api = json.load(f)
+                # The per-request timeseries stays in the suite's own file
+                api.pop('timeseries', None)
+                collected['api'] = api
+            except (OSError, ValueError) as e:
+                collected['api_error'] = str(e)
+        cpu_file = ROOT / language / 'benchmark_results.json'
+        if cpu_file.exists():
+            try:
+                with open(cpu_file) as f:
+                    collected['cpu'] = json.load(f)
+            except (OSError, ValueError) as e:
+                collected['cpu_error'] = str(e)
+        if collected:
+            results[language] = collected
+    return results
+
+
+def select_tasks(tasks: List[Task], languages: List[str]) -> List[Task]:
+    """Tasks for the given languages (all if empty)."""
+    if not languages:
+        return tasks
+    return [task for task in tasks if task.language in languages]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Build and run every language benchmark suite.')
+    parser.add_argument('--langs', default='',
+                        help='comma-separated languages to run, e.g. go,rust (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=max((os.cpu_count() or 1) - 1, 1),
+                        help='parallel builds and I/O suites (default: CPU count - 1)')
+    parser.add_argument('--timeout', type=float, default=None, help='per-task timeout in seconds')
+    parser.add_argument('--rebuild', action='store_true', help='ignore the build cache')
+    parser.add_argument('--no-pin', dest='pin', action='store_false',
+                        help='do not pin CPU suites to a dedicated core')
+    parser.add_argument('-o', '--report', default=str(DEFAULT_REPORT),
+                        help=f'combined report to write (default: {DEFAULT_REPORT.name})')
+    parser.add_argument('--list', action='store_true', help='print the task graph and exit')
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    languages = [l.strip().lower() for l in args.langs.split(',') if l.strip()]
+    tasks = select_tasks(define_tasks(), languages)
+    if not tasks:
+        print(f"No tasks for --langs {args.langs}")
+        return 1
+    if args.list:
+        for task in tasks:
+            deps = f" (after {', '.join(task.deps)})" if task.deps else ''
+            print(f"{task.kind:<6} {task.name}{deps}")
+        return 0
+
+    print("=" * 60)
+    print("Running All Performance Benchmarks")
+    print("=" * 60)
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    started_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    entries = run_graph(tasks, jobs=args.jobs, timeout=args.timeout, pin=args.pin, rebuild=args.rebuild)
+
+    ran = sorted({task.language for task in tasks}, key=[t.language for t in tasks].index)
+    report = {
+        'started_at': started_at,
+        'finished_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'tasks': [entries[task.name] for task in tasks],
+        'results': collect_results(ran),
+    }
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    failed = [e['name'] for e in report['tasks'] if e['status'] == 'failed']
+    skipped = [e['name'] for e in report['tasks'] if e['status'] == 'skipped']
+    print("=" * 60)
+    print(f"{len(tasks) - len(failed) - len(skipped)} tasks succeeded, "
+          f"{len(failed)} failed, {len(skipped)} skipped")
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    print(f"Report saved to {args.report}")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Stack Wizard - Vectorized analysis modes
+
+Optional companion to stack_recommender.py for analyses that evaluate many
+stacks or scenarios at once with NumPy. The recommender itself stays
+dependency-free and imports this module only when one of these modes is
+requested.
+
+- Capacity planning: cores, instances, memory and cost needed per stack to
+  serve a range of load levels within a p95 latency target
+- Weight sensitivity: how often each stack comes out on top, and how stable
+  the ranking is, when every scoring weight is perturbed at random
+- Pareto fronts: non-dominated sorting of stacks with each breakdown
+  criterion as a separate objective
+- Similar stacks: nearest neighbours of a language/framework pair by its
+  description and scoring profile, optionally only those better on some
+  criteria
+"""
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from stack_recommender import STACK_OPTIONS, FRAMEWORK_DETAILS, tokenize
+
+# Rough single-core capacity of a typical JSON API service in each language:
+# requests/second, p95 service latency (ms), memory per instance and per busy
+# core (MB). Used as-is without benchmark results, and to fill in languages
+# that were not measured (scaled to the measured ones).
+CAPACITY_PROFILES = {
+    'rust':       {'rps': 12000, 'p95_ms': 4.0,  'instance_mb': 20,  'core_mb': 10},
+    'cpp':        {'rps': 12000, 'p95_ms': 4.0,  'instance_mb': 15,  'core_mb': 10},
+    'go':         {'rps': 8000,  'p95_ms': 6.0,  'instance_mb': 30,  'core_mb': 20},
+    'java':       {'rps': 6000,  'p95_ms': 8.0,  'instance_mb': 250, 'core_mb': 60},
+    'csharp':     {'rps': 7000,  'p95_ms': 7.0,  'instance_mb': 120, 'core_mb': 40},
+    'scala':      {'rps': 5000,  'p95_ms': 9.0,  'instance_mb': 280, 'core_mb': 60},
+    'elixir':     {'rps': 3000,  'p95_ms': 10.0, 'instance_mb': 80,  'core_mb': 30},
+    'javascript': {'rps': 3000,  'p95_ms': 12.0, 'instance_mb': 60,  'core_mb': 50},
+    'python':     {'rps': 1000,  'p95_ms': 20.0, 'instance_mb': 60,  'core_mb': 60},
+    'ruby':       {'rps': 800,   'p95_ms': 25.0, 'instance_mb': 90,  'core_mb': 80},
+}
+
+CORES_PER_INSTANCE = 4
+# Utilization ceiling, with or without a latency target
+MAX_UTILIZATION = 0.7
+# On-demand cloud prices used for the monthly estimate (USD)
+CORE_HOUR_COST = 0.04
+GB_HOUR_COST = 0.005
+HOURS_PER_MONTH = 730
+
+# Weight sensitivity: every criterion weight is scaled by a factor drawn
+# uniformly from [1 - spread, 1 + spread], independently per sample
+SENSITIVITY_SPREAD = 0.5
+# Samples scored per batch, to bound memory for very large runs
+SENSITIVITY_BATCH = 65536
+
+# Pareto sorting compares a block of leading candidates against the rest at
+# once; the block shrinks for large catalogs to bound the comparison array
+PARETO_CHUNK_ELEMENTS = 1 << 22
+PARETO_MAX_BLOCK = 256
+
+# Scoring profile used by the similarity index: criterion -> (probe
+# requirements, breakdown component). A stack's value is how many points the
+# probe adds to the component over the no-requirements baseline.
+SIMILARITY_TRAITS = {
+    'performance': ({'performance': 10}, 'performance'),
+    'scalability': ({'scalability': 10}, 'scalability'),
+    'development_speed': ({'development_speed': 10}, 'development_speed'),
+    'small_team': ({'team_size': 'small'}, 'team_size'),
+    'large_team': ({'team_size': 'large'}, 'team_size'),
+    'io_bound': ({'io_bound': True}, 'project_type'),
+    'real_time': ({'real_time': True}, 'real_time'),
+    'ml_ai': ({'ml_ai': True}, 'ml_ai'),
+    'enterprise': ({'enterprise': True}, 'enterprise'),
+    'microservices': ({'microservices': True}, 'microservices'),
+    'latency': ({'latency_ms': 100}, 'latency'),
+    'throughput': ({'throughput_rps': 10000}, 'throughput'),
+    'compliance': ({'compliance': ['any']}, 'compliance'),
+    'hiring': ({'hiring_priority': 'high'}, 'hiring'),
+}
+# Share of the similarity that comes from each block of the stack vectors
+SIMILARITY_WEIGHTS = {'language': 0.35, 'framework': 0.3, 'profile': 0.35}
+
+
+def _measured_api_metrics() -> Dict[str, Dict[str, float]]:
+    """Measured requests/second and p95 per language from the benchmark results."""
+    import benchmark_results
+
+    if os.path.exists(benchmark_results.DEFAULT_DATASET):
+        dataset = benchmark_results.load_dataset(benchmark_results.DEFAULT_DATASET)
+    else:
+        dataset = benchmark_results.aggregate(benchmark_results.scan())
+    rps = benchmark_results.pivot(dataset, 'requests_per_second', suite='api')
+    p95 = benchmark_results.pivot(dataset, 'p95', suite='api')
+    measured = {}
+    for lang in set(rps) & set(p95):
+        measured[lang] = {'rps': next(iter(rps[lang].values())), 'p95_ms': next(iter(p95[lang].values()))}
+    return measured
+
+
+def capacity_profiles(languages: List[str], measured: Optional[Dict[str, Dict[str, float]]] = None,
+                      bases: Optional[Dict[str, str]] = None) -> Dict:
+    """
+    Per-language capacity inputs as arrays aligned with languages. Measured
+    requests/second and p95 are used where available; other languages get
+    their built-in profile scaled by the median measured/built-in ratio, so
+    all stacks stay on the same footing. Catalog variants (keys of bases)
+    use their base language's profile and measurements.
+    """
+    measured = _measured_api_metrics() if measured is None else measured
+    sources = [(bases or {}).get(l, l) for l in languages]
+    base = np.array([[CAPACITY_PROFILES.get(l, CAPACITY_PROFILES['python'])[k]
+                      for k in ('rps', 'p95_ms', 'instance_mb', 'core_mb')] for l in sources], dtype=float)
+    rps, p95 = base[:, 0].copy(), base[:, 1].copy()
+    is_measured = np.array([l in measured for l in sources])
+    if is_measured.any():
+        measured_rps = np.array([measured[l]['rps'] for l in sources if l in measured])
+        measured_p95 = np.array([measured[l]['p95_ms'] for l in sources if l in measured])
+        rps_scale = np.median(measured_rps / rps[is_measured])
+        p95_scale = np.median(measured_p95 / p95[is_measured])
+        rps, p95 = rps * rps_scale, p95 * p95_scale
+        rps[is_measured], p95[is_measured] = measured_rps, measured_p95
+    return {
+        'languages': list(languages),
+        'per_core_rps': rps,
+        'p95_ms': p95,
+        'instance_mb': base[:, 2],
+        'core_mb': base[:, 3],
+        'measured': is_measured,
+    }
+
+
+def plan_capacity(profiles: Dict, loads, target_latency_ms: Optional[float] = None,
+                  cores_per_instance: int = CORES_PER_INSTANCE) -> Dict:
+    """
+    Resources needed by every stack at every load level, computed as
+    (stacks x loads) arrays in one pass.
+
+    Tail latency is modelled as growing with 1 / (1 - utilization), as in an
+    M/M/1 queue, so a p95 target T on a stack with unloaded p95 L caps
+    utilization at 1 - L/T. Stacks whose unloaded p95 already exceeds the
+    target are infeasible at any size.
+    """
+    loads = np.asarray(loads, dtype=float)
+    p95 = profiles['p95_ms']
+    if target_latency_ms:
+        max_utilization = np.clip(1.0 - p95 / float(target_latency_ms), 0.0, MAX_UTILIZATION)
+    else:
+        max_utilization = np.full(len(p95), MAX_UTILIZATION)
+    feasible = max_utilization > 0
+
+    usable_rps = (profiles['per_core_rps'] * max_utilization)[:, None]
+    with np.errstate(divide='ignore'):
+        cores = np.where(feasible[:, None], np.ceil(loads[None, :] / usable_rps), np.inf)
+    instances = np.ceil(cores / cores_per_instance)
+    memory_mb = instances * profiles['instance_mb'][:, None] + cores * profiles['core_mb'][:, None]
+    monthly_cost = (cores * CORE_HOUR_COST + memory_mb / 1024 * GB_HOUR_COST) * HOURS_PER_MONTH
+    utilization = np.where(feasible[:, None], loads[None, :] / (cores * profiles['per_core_rps'][:, None]), np.nan)
+    return {
+        'loads': loads,
+        'max_utilization': max_utilization,
+        'feasible': feasible,
+        'cores': cores,
+        'instances': instances,
+        'memory_mb': memory_mb,
+        'monthly_cost': monthly_cost,
+        'utilization': utilization,
+    }
+
+
+def default_loads(throughput_rps: Optional[int]) -> List[float]:
+    """Load levels around the target throughput, or a decade sweep without one."""
+    if throughput_rps:
+        return [throughput_rps * f for f in (0.25, 0.5, 1, 2, 4)]
+    return [100, 1000, 10000, 100000]
+
+
+def format_capacity_plan(profiles: Dict, plan: Dict, names: Optional[Dict[str, str]] = None) -> str:
+    """Render a capacity plan as one table per load level."""
+    names = names or {}
+    output = []
+    for j, load in enumerate(plan['loads']):
+        output.append(f"\nLoad: {load:,.0f} req/s")
+        output.append(f"{'Stack':<24} {'RPS/core':>9} {'p95':>7} {'Cores':>7} {'Inst':>6} "
+                      f"{'Memory':>10} {'$/month':>10}")
+        order = np.argsort(plan['monthly_cost'][:, j], kind='stable')
+        for i in order:
+            lang = profiles['languages'][i]
+            label = names.get(lang, lang) + ('' if profiles['measured'][i] else ' *')
+            if not plan['feasible'][i]:
+                output.append(f"{label:<24} {profiles['per_core_rps'][i]:>9.0f} "
+                              f"{profiles['p95_ms'][i]:>6.0f}ms   cannot meet the latency target")
+                continue
+            output.append(f"{label:<24} {profiles['per_core_rps'][i]:>9.0f} {profiles['p95_ms'][i]:>6.0f}ms "
+                          f"{plan['cores'][i, j]:>7.0f} {plan['instances'][i, j]:>6.0f} "
+                          f"{plan['memory_mb'][i, j] / 1024:>8.1f}GB {plan['monthly_cost'][i, j]:>10,.0f}")
+    if not profiles['measured'].all():
+        output.append("\n* not measured: built-in profile scaled to the measured languages")
+    return "\n".join(output)
+
+
+def weight_sensitivity(breakdowns: Dict[str, Dict[str, float]], samples: int,
+                       spread: float = SENSITIVITY_SPREAD, seed: Optional[int] = None) -> Dict:
+    """
+    Monte Carlo sensitivity of the ranking to the scoring weights.
+
+    A language's score is the sum of its breakdown components, i.e. the dot
+    product of its component vector with all-ones weights. Each sample draws
+    a random weight vector, so a batch of samples is scored at once as the
+    (samples x criteria) @ (criteria x languages) product.
+    """
+    languages = list(breakdowns)
+    components = list(next(iter(breakdowns.values())))
+    scores_matrix = np.array([[breakdowns[l][c] for c in components] for l in languages], dtype=float)
+    n_languages = len(languages)
+    # Baseline order as analyze_requirements sorts it (stable, descending)
+    baseline_order = np.argsort(-scores_matrix.sum(axis=1), kind='stable')
+
+    rng = np.random.default_rng(seed)
+    top_counts = np.zeros(n_languages, dtype=np.int64)
+    # rank_counts[i, r]: samples in which language i ranked r (0 = top)
+    rank_counts = np.zeros((n_languages, n_languages), dtype=np.int64)
+    same_order = 0
+    done = 0
+    while done < samples:
+        batch = min(SENSITIVITY_BATCH, samples - done)
+        weights = rng.uniform(1.0 - spread, 1.0 + spread, size=(batch, len(components)))
+        order = np.argsort(-(weights @ scores_matrix.T), axis=1, kind='stable')
+        top_counts += np.bincount(order[:, 0], minlength=n_languages)
+        for rank in range(n_languages):
+            rank_counts[:, rank] += np.bincount(order[:, rank], minlength=n_languages)
+        same_order += int((order == baseline_order).all(axis=1).sum())
+        done += batch
+
+    ranks = np.arange(n_languages)
+    baseline_rank = np.empty(n_languages, dtype=int)
+    baseline_rank[baseline_order] = ranks
+    cumulative = np.cumsum(rank_counts, axis=1)
+    return {
+        'languages': languages,
+        'samples': samples,
+        'spread': spread,
+        'baseline_rank': baseline_rank,
+        'p_top': top_counts / samples,
+        'p_same_rank': rank_counts[ranks, baseline_rank] / samples,
+        'mean_rank': rank_counts @ ranks / samples,
+        # 5th and 95th percentile ranks
+        'rank_low': np.argmax(cumulative >= 0.05 * samples, axis=1),
+        'rank_high': np.argmax(cumulative >= 0.95 * samples, axis=1),
+        'p_same_order': same_order / samples,
+    }
+
+
+def format_sensitivity(result: Dict, names: Optional[Dict[str, str]] = None) -> str:
+    """Render a weight sensitivity result, in baseline rank order."""
+    names = names or {}
+    output = [f"{'#':>3} {'Stack':<24} {'P(top)':>8} {'P(same rank)':>13} {'Mean rank':>10} {'90% range':>10}"]
+    for i in np.argsort(result['baseline_rank']):
+        lang = result['languages'][i]
+        rank_range = f"{result['rank_low'][i] + 1}-{result['rank_high'][i] + 1}"
+        output.append(f"{result['baseline_rank'][i] + 1:>3} {names.get(lang, lang):<24} "
+                      f"{result['p_top'][i]:>8.1%} {result['p_same_rank'][i]:>13.1%} "
+                      f"{result['mean_rank'][i] + 1:>10.2f} {rank_range:>10}")
+    output.append(f"\nFull ranking unchanged in {result['p_same_order']:.1%} of samples")
+    return "\n".join(output)
+
+
+def _dominates(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """[i, j]: row i of a dominates row j of b (no worse anywhere, better somewhere)"""
+    no_worse = np.ones((len(a), len(b)), dtype=bool)
+    better = np.zeros((len(a), len(b)), dtype=bool)
+    # One objective at a time keeps the temporaries at (a x b)
+    for k in range(a.shape[1]):
+        col_a, col_b = a[:, k, None], b[None, :, k]
+        no_worse &= col_a >= col_b
+        better |= col_a > col_b
+    return no_worse & better
+
+
+def pareto_ranks(objectives) -> np.ndarray:
+    """
+    Non-dominated sorting of stacks, every objective maximized: 0 for the
+    Pareto-optimal stacks, 1 for those only dominated by front 0, and so on.
+    Takes a (stacks x objectives) array, or a (sets x stacks x objectives)
+    batch, e.g. one catalog scored for several requirement sets.
+
+    Each front is peeled off in order of decreasing objective sum: a stack
+    can only be dominated by one with a larger sum. So within a block of the
+    leading candidates, the ones no other block member dominates are
+    non-dominated overall, and everything they dominate is dropped in one
+    vectorized comparison. That is far fewer comparisons than all pairs
+    when fronts are small relative to the catalog.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    if objectives.ndim == 3:
+        return np.stack([pareto_ranks(o) for o in objectives])
+    sums = objectives.sum(axis=1)
+    ranks = np.full(len(objectives), -1)
+    remaining = np.argsort(-sums, kind='stable')
+    front = 0
+    while remaining.size:
+        candidates, dominated = remaining, []
+        while candidates.size:
+            block_size = int(np.clip(PARETO_CHUNK_ELEMENTS // candidates.size, 1, PARETO_MAX_BLOCK))
+            block, rest = candidates[:block_size], candidates[block_size:]
+            in_block = _dominates(objectives[block], objectives[block])
+            leaders = block[~in_block.any(axis=0)]
+            ranks[leaders] = front
+            dominated.append(block[in_block.any(axis=0)])
+            worse = _dominates(objectives[leaders], objectives[rest]).any(axis=0)
+            dominated.append(rest[worse])
+            candidates = rest[~worse]
+        remaining = np.concatenate(dominated)
+        remaining = remaining[np.argsort(-sums[remaining], kind='stable')]
+        front += 1
+    return ranks
+
+
+def pareto_fronts(breakdowns: Dict[str, Dict[str, float]]) -> Dict:
+    """Pareto ranks of the languages, with their breakdown criteria as objectives."""
+    languages = list(breakdowns)
+    components = list(next(iter(breakdowns.values())))
+    objectives = np.array([[breakdowns[l][c] for c in components] for l in languages], dtype=float)
+    # Criteria that are equal for every language cannot separate them
+    varying = objectives.max(axis=0) > objectives.min(axis=0)
+    return {
+        'languages': languages,
+        'objectives': [c for c, v in zip(components, varying) if v],
+        'values': objectives[:, varying],
+        'ranks': pareto_ranks(objectives[:, varying]),
+    }
+
+
+def format_pareto(result: Dict, names: Optional[Dict[str, str]] = None) -> str:
+    """Render Pareto fronts, listing the criteria each optimal stack leads on."""
+    names = names or {}
+    values, ranks = result['values'], result['ranks']
+    leaders = values.max(axis=0)
+    output = [f"{'Front':>5}  {'Stack':<32} {'Score':>6}  Leads on"]
+    for i in np.lexsort((-values.sum(axis=1), ranks)):
+        lang = result['languages'][i]
+        leads = [c for c, v, top in zip(result['objectives'], values[i], leaders) if v == top]
+        output.append(f"{ranks[i] + 1:>5}  {names.get(lang, lang):<32} {values[i].sum():>6.1f}  "
+                      f"{', '.join(leads) if ranks[i] == 0 else ''}".rstrip())
+    optimal = int((ranks == 0).sum())
+    output.append(f"\n{optimal} of {len(ranks)} stacks are Pareto-optimal over "
+                  f"{len(result['objectives'])} criteria: {', '.join(result['objectives'])}")
+    return "\n".join(output)
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def _idf_block(documents: List[set]) -> np.ndarray:
+    """Unit rows of IDF-weighted token indicators, one row per document"""
+    vocabulary = sorted(set().union(*documents))
+    column = {token: j for j, token in enumerate(vocabulary)}
+    block = np.zeros((len(documents), len(vocabulary)))
+    for i, document in enumerate(documents):
+        block[i, [column[t] for t in document]] = 1.0
+    # Tokens every stack shares say nothing; rare ones say the most
+    block *= np.log(len(documents) / np.maximum(block.sum(axis=0), 1.0))
+    return _unit_rows(block)
+
+
+def build_similarity_index(recommender, catalog: Optional[Dict[str, Dict]] = None) -> Dict:
+    """
+    Feature vectors of every language/framework pair, as rows of one matrix
+    so similarity to any stack is a single matrix-vector product.
+
+    A vector has three blocks, each unit-normalized and then scaled by the
+    square root of its SIMILARITY_WEIGHTS entry, so the dot product of two
+    vectors is the weighted mean of the per-block cosine similarities (a
+    stack without framework details just scores 0 on that block):
+    IDF-weighted tokens of the language's strengths,
+    weaknesses (kept apart) and best_for; the same for the framework's
+    FRAMEWORK_DETAILS; and the language's scoring profile from
+    SIMILARITY_TRAITS, scaled to 0-1 per criterion.
+    """
+    catalog = STACK_OPTIONS if catalog is None else catalog
+    stacks, language_documents, framework_documents = [], [], []
+    for lang_key, lang_data in catalog.items():
+        language_tokens = set(tokenize(' '.join(lang_data['strengths'] + lang_data['best_for'])))
+        language_tokens |= {'-' + t for t in tokenize(' '.join(lang_data['weaknesses']))}
+        for framework in lang_data['frameworks']:
+            details = FRAMEWORK_DETAILS.get(framework, {})
+            stacks.append((lang_key, framework))
+            language_documents.append(language_tokens)
+            framework_documents.append(set(tokenize(' '.join(
+                [details.get('type', '')] + details.get('strengths', []) + details.get('best_for', [])))))
+
+    baseline = {lang_key: recommender._score_language(lang_key, {}) for lang_key in catalog}
+    per_language = {
+        lang_key: [recommender._score_language(lang_key, probe)[component] - baseline[lang_key][component]
+                   for probe, component in SIMILARITY_TRAITS.values()]
+        for lang_key in catalog
+    }
+    traits = np.array([per_language[lang_key] for lang_key, _ in stacks], dtype=float)
+    scale = np.abs(traits).max(axis=0)
+    traits = traits / np.where(scale > 0, scale, 1.0)
+
+    blocks = {'language': _idf_block(language_documents),
+              'framework': _idf_block(framework_documents),
+              'profile': _unit_rows(traits)}
+    matrix = np.hstack([blocks[name] * np.sqrt(weight) for name, weight in SIMILARITY_WEIGHTS.items()])
+    return {
+        'stacks': stacks,
+        'matrix': matrix,
+        'traits': traits,
+        'trait_names': list(SIMILARITY_TRAITS),
+    }
+
+
+def similar_stacks(index: Dict, anchor, better: Optional[List[str]] = None, k: int = 5) -> List[Tuple]:
+    """
+    The k stacks most similar to anchor, a (language, framework) pair, as
+    (language, framework, similarity) tuples, most similar first.
+    With better, only stacks that beat the anchor on every one of those
+    SIMILARITY_TRAITS criteria are considered.
+    """
+    stacks = index['stacks']
+    position = stacks.index(tuple(anchor))
+    similarity = index['matrix'] @ index['matrix'][position]
+    eligible = np.ones(len(stacks), dtype=bool)
+    eligible[position] = False
+    for criterion in better or []:
+        j = index['trait_names'].index(criterion)
+        eligible &= index['traits'][:, j] > index['traits'][position, j]
+    candidates = np.flatnonzero(eligible)
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-similarity[candidates], k - 1)[:k]]
+    candidates = candidates[np.argsort(-similarity[candidates], kind='stable')]
+    return [(stacks[i][0], stacks[i][1], float(similarity[i])) for i in candidates]
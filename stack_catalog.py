@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Stack Wizard - External stack catalog
+
+Stack variants beyond the built-in STACK_OPTIONS (a language plus a
+framework, runtime or deployment flavour) can be registered as plugin files
+in a catalog directory, one or more entries per .json or .toml file:
+
+    [[stack]]
+    key = "go-tinygo"
+    base = "go"
+    name = "TinyGo"
+    frameworks = ["Chi"]
+    strengths = ["Tiny binaries", "Fast startup"]
+    weaknesses = ["Partial standard library"]
+    best_for = ["Edge functions", "Embedded systems"]
+    runtime = { gc = "conservative" }
+    bonus = { deployment = 2, performance = -1 }
+
+A variant is scored as its base language, with project types matched
+against its own best_for and the bonus points added per breakdown
+component. Its frameworks are ranked as the base language's.
+
+The files are compiled into one binary index that is memory-mapped at
+startup. The index records the name, size and modification time of every
+plugin file (and the scorer version), so an unchanged catalog is loaded
+without parsing any of them. Entries, bonuses and the best_for token
+postings are fixed-size struct tables read when first used, and entry
+details are only decoded when displayed.
+
+Usage:
+    python stack_catalog.py [CATALOG_DIR]    # compile and list the catalog
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: JSON plugins only
+    tomllib = None
+
+from stack_recommender import STACK_OPTIONS, StackRecommender, tokenize
+from stack_lookup import scorer_fingerprint
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CATALOG_DIR = os.path.join(ROOT, 'catalog')
+INDEX_FILE = os.path.join(ROOT, 'catalog_index.bin')
+INDEX_MAGIC = b'SWCI'
+INDEX_VERSION = 2
+# magic, version, header length, then the entry, bonus, token and posting
+# counts and the strings section length; the sections follow in that order,
+# then the JSON entry records
+_PREFIX = struct.Struct('<4sIIIIIII')
+# key and base (string offset, length), record offset and length, first bonus and count
+_ENTRY = struct.Struct('<IHIHIIIH')
+_BONUS = struct.Struct('<Hd')  # component index, points
+_TOKEN = struct.Struct('<IHII')  # token (string offset, length), first posting and count
+_POSTING = struct.Struct('<I')  # entry position
+
+PLUGIN_SUFFIXES = ('.json', '.toml')
+REQUIRED_FIELDS = ('key', 'base', 'name', 'frameworks', 'best_for')
+LIST_FIELDS = ('frameworks', 'strengths', 'weaknesses', 'best_for')
+
+
+def plugin_files(directory: str) -> List[str]:
+    """Plugin files in a catalog directory, in load order"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.endswith(PLUGIN_SUFFIXES) and not name.startswith('.'))
+
+
+def catalog_signature(directory: str) -> List[List]:
+    """Name, size and modification time of every plugin file"""
+    signature = []
+    for path in plugin_files(directory):
+        stat = os.stat(path)
+        signature.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def read_plugin(path: str) -> List[Dict]:
+    """The stack entries of one plugin file"""
+    if path.endswith('.toml'):
+        if tomllib is None:
+            raise ValueError(f"{path}: TOML plugins need Python 3.11+ (tomllib)")
+        with open(path, 'rb') as f:
+            document = tomllib.load(f)
+    else:
+        with open(path) as f:
+            document = json.load(f)
+    entries = document.get('stack', []) if isinstance(document, dict) else document
+    if isinstance(entries, dict):
+        entries = [entries]
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a 'stack' list of entries")
+    return entries
+
+
+def validate_entry(entry: Dict, source: str, components: List[str]) -> Dict:
+    """A normalized copy of a plugin entry; ValueError if it is malformed"""
+    missing = [field for field in REQUIRED_FIELDS if field not in entry]
+    if missing:
+        raise ValueError(f"{source}: entry {entry.get('key', '?')!r} is missing {', '.join(missing)}")
+    key = str(entry['key']).strip().lower()
+    if key in STACK_OPTIONS:
+        raise ValueError(f"{source}: {key!r} is a built-in language")
+    if entry['base'] not in STACK_OPTIONS:
+        raise ValueError(f"{source}: unknown base language {entry['base']!r} for {key!r}")
+    normalized = {'key': key, 'base': entry['base'], 'name': str(entry['name']),
+                  'runtime': dict(entry.get('runtime', {})), 'source': os.path.basename(source)}
+    for field in LIST_FIELDS:
+        value = entry.get(field, [])
+        if not isinstance(value, list):
+            raise ValueError(f"{source}: {field} of {key!r} must be a list")
+        normalized[field] = [str(v) for v in value]
+    if not normalized['frameworks']:
+        raise ValueError(f"{source}: {key!r} lists no frameworks")
+    bonus = entry.get('bonus', {})
+    if not isinstance(bonus, dict):
+        raise ValueError(f"{source}: bonus of {key!r} must be a table of component points")
+    unknown = [c for c in bonus if c not in components]
+    if unknown:
+        raise ValueError(f"{source}: unknown bonus components for {key!r}: {', '.join(unknown)}")
+    invalid = [c for c, points in bonus.items() if isinstance(points, bool) or not isinstance(points, (int, float))]
+    if invalid:
+        raise ValueError(f"{source}: bonus points for {key!r} must be numbers: {', '.join(invalid)}")
+    normalized['bonus'] = {c: float(points) for c, points in bonus.items()}
+    return normalized
+
+
+def compile_catalog(directory: str = CATALOG_DIR, path: str = INDEX_FILE) -> Dict:
+    """
+    Parse every plugin file and write the binary index. Returns the index
+    header.
+    """
+    components = list(StackRecommender(calibration={})._score_language(next(iter(STACK_OPTIONS)), {}))
+    signature = catalog_signature(directory)
+    entries = []
+    seen = {}
+    for name, _, _ in signature:
+        source = os.path.join(directory, name)
+        for entry in read_plugin(source):
+            entry = validate_entry(entry, source, components)
+            if entry['key'] in seen:
+                raise ValueError(f"{source}: {entry['key']!r} is already defined in {seen[entry['key']]}")
+            seen[entry['key']] = name
+            entries.append(entry)
+
+    strings, string_parts = {}, []
+
+    def string(text: str) -> Tuple[int, int]:
+        # Offset and length of a string in the strings section, stored once
+        if text not in strings:
+            encoded = text.encode()
+            strings[text] = (sum(len(part) for part in string_parts), len(encoded))
+            string_parts.append(encoded)
+        return strings[text]
+
+    entry_table, bonus_table, records, tokens = [], [], [], {}
+    offset = 0
+    for position, entry in enumerate(entries):
+        record = json.dumps(entry, separators=(',', ':')).encode()
+        entry_table.append(_ENTRY.pack(*string(entry['key']), *string(entry['base']), offset, len(record),
+                                       len(bonus_table), len(entry['bonus'])))
+        bonus_table.extend(_BONUS.pack(components.index(c), points) for c, points in entry['bonus'].items())
+        records.append(record)
+        offset += len(record)
+        # Inverted index of best_for tokens, as in KEYWORD_INDEX
+        for token in set(tokenize(' '.join(entry['best_for']))):
+            tokens.setdefault(token.encode(), []).append(position)
+
+    # Token table sorted by token so a lookup is a binary search
+    token_table, postings = [], []
+    for token in sorted(tokens):
+        offset, length = string(token.decode())
+        token_table.append(_TOKEN.pack(offset, length, len(postings), len(tokens[token])))
+        postings.extend(tokens[token])
+
+    header = {
+        # Tokens and bonus components depend on the scorer version
+        'fingerprint': scorer_fingerprint({}),
+        'directory': os.path.abspath(directory),
+        'signature': signature,
+        'components': components,
+    }
+    header_bytes = json.dumps(header).encode()
+    strings_bytes = b''.join(string_parts)
+    # Replace atomically: other processes may have the old index mapped
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREFIX.pack(INDEX_MAGIC, INDEX_VERSION, len(header_bytes), len(entry_table), len(bonus_table),
+                             len(token_table), len(postings), len(strings_bytes)))
+        f.write(header_bytes)
+        f.write(b''.join(entry_table))
+        f.write(b''.join(bonus_table))
+        f.write(b''.join(token_table))
+        f.write(struct.pack(f'<{len(postings)}I', *postings))
+        f.write(strings_bytes)
+        f.write(b''.join(records))
+    os.replace(tmp_path, path)
+    return header
+
+
+class CatalogIndex:
+    """
+    A compiled catalog, memory-mapped read-only. Only the small header is
+    parsed at load; entries, bonuses and token postings are read from their
+    fixed-size tables when first used.
+    """
+
+    def __init__(self, path: str = INDEX_FILE):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, header_len, n_entries, n_bonuses, n_tokens, n_postings,
+         strings_len) = _PREFIX.unpack_from(self._mmap)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"{path} is not a version {INDEX_VERSION} catalog index")
+        header = json.loads(self._mmap[_PREFIX.size:_PREFIX.size + header_len])
+        self.fingerprint = header['fingerprint']
+        self.directory = header['directory']
+        self.signature = header['signature']
+        self._components = header['components']
+        self._n_entries = n_entries
+        self._n_tokens = n_tokens
+        self._entries_start = _PREFIX.size + header_len
+        self._bonuses_start = self._entries_start + n_entries * _ENTRY.size
+        self._tokens_start = self._bonuses_start + n_bonuses * _BONUS.size
+        self._postings_start = self._tokens_start + n_tokens * _TOKEN.size
+        self._strings_start = self._postings_start + n_postings * _POSTING.size
+        self._records_start = self._strings_start + strings_len
+        if len(self._mmap) < self._records_start:
+            raise ValueError(f"{path} is truncated")
+        self._keys = None
+        self._bases = None
+        self._positions = None
+        self._bonuses = {}
+        self._details = {}
+        self._tokens = {}
+        self._matches = {}
+
+    @property
+    def keys(self) -> List[str]:
+        """Variant keys in load order, decoded with their bases on first use"""
+        if self._keys is None:
+            keys, bases = [], {}
+            for fields in _ENTRY.iter_unpack(self._mmap[self._entries_start:self._bonuses_start]):
+                key = self._string(*fields[:2])
+                keys.append(key)
+                bases[key] = self._string(*fields[2:4])
+            self._keys, self._bases = keys, bases
+        return self._keys
+
+    def _position_index(self) -> Dict[str, int]:
+        if self._positions is None:
+            self._positions = {key: i for i, key in enumerate(self.keys)}
+        return self._positions
+
+    def _entry_fields(self, key: str) -> Tuple[int, ...]:
+        position = self._position_index()[key]
+        return _ENTRY.unpack_from(self._mmap, self._entries_start + position * _ENTRY.size)
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_start + offset
+        return self._mmap[start:start + length].decode()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._position_index()
+
+    def __len__(self) -> int:
+        return self._n_entries
+
+    def base(self, key: str) -> str:
+        if self._bases is None:
+            self.keys  # decodes the bases too
+        return self._bases[key]
+
+    def bonus(self, key: str) -> Dict[str, float]:
+        if key not in self._bonuses:
+            start, count = self._entry_fields(key)[6:8]
+            pairs = (_BONUS.unpack_from(self._mmap, self._bonuses_start + i * _BONUS.size)
+                     for i in range(start, start + count))
+            self._bonuses[key] = {self._components[c]: points for c, points in pairs}
+        return self._bonuses[key]
+
+    def entry(self, key: str) -> Dict:
+        """Full entry of a variant, decoded from the index on first use"""
+        if key not in self._details:
+            offset, length = self._entry_fields(key)[4:6]
+            start = self._records_start + offset
+            self._details[key] = json.loads(self._mmap[start:start + length])
+        return self._details[key]
+
+    def _postings(self, token: str) -> FrozenSet[str]:
+        """Variants whose best_for has a token, found by binary search of the token table"""
+        if token not in self._tokens:
+            wanted = token.encode()
+            keys = frozenset()
+            low, high = 0, self._n_tokens
+            while low < high:
+                middle = (low + high) // 2
+                offset, length, start, count = _TOKEN.unpack_from(self._mmap,
+                                                                  self._tokens_start + middle * _TOKEN.size)
+                probe = self._mmap[self._strings_start + offset:self._strings_start + offset + length]
+                if probe < wanted:
+                    low = middle + 1
+                elif probe > wanted:
+                    high = middle
+                else:
+                    positions = struct.unpack_from(f'<{count}I', self._mmap,
+                                                   self._postings_start + start * _POSTING.size)
+                    keys = frozenset(self.keys[i] for i in positions)
+                    break
+            self._tokens[token] = keys
+        return self._tokens[token]
+
+    def matches(self, project_type: str) -> FrozenSet[str]:
+        """Variants whose best_for matches a project type, as project_type_matches does"""
+        if project_type not in self._matches:
+            matches = set()
+            for phrase in project_type.split(','):
+                tokens = set(tokenize(phrase))
+                if tokens:
+                    matches |= frozenset.intersection(*(self._postings(t) for t in tokens))
+            self._matches[project_type] = frozenset(matches)
+        return self._matches[project_type]
+
+    def is_current(self, directory: str) -> bool:
+        """Whether the index was compiled from the catalog directory as it is now"""
+        return (self.directory == os.path.abspath(directory)
+                and self.signature == catalog_signature(directory)
+                and self.fingerprint == scorer_fingerprint({}))
+
+    def close(self):
+        self._mmap.close()
+
+
+def load_catalog(directory: str = CATALOG_DIR, path: str = INDEX_FILE) -> Optional[CatalogIndex]:
+    """
+    The catalog index for a directory, recompiled first if plugin files
+    changed since it was built. None if there are no plugin files.
+    """
+    if not plugin_files(directory):
+        return None
+    if os.path.exists(path):
+        try:
+            catalog = CatalogIndex(path)
+        except (OSError, ValueError, struct.error):
+            catalog = None
+        if catalog is not None and catalog.is_current(directory):
+            return catalog
+        if catalog is not None:
+            catalog.close()
+    compile_catalog(directory, path)
+    return CatalogIndex(path)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    directory = argv[0] if argv else CATALOG_DIR
+    try:
+        header = compile_catalog(directory)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    catalog = CatalogIndex(INDEX_FILE)
+    for key in catalog.keys:
+        entry = catalog.entry(key)
+        print(f"  {key:<24} {entry['name']:<28} base: {entry['base']:<10} ({entry['source']})")
+    print(f"✓ Compiled {len(catalog)} stacks from {len(header['signature'])} files in {directory} "
+          f"into {INDEX_FILE}")
+    catalog.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Stack Wizard - Precomputed recommendation table
+
+Every structured requirement input has a small discrete domain (1-10 scales,
+a few categories, booleans, and latency/throughput targets that only matter
+through the tier they fall in), and each of them feeds its own breakdown
+components. So instead of the full cross product, the table stores the
+factored form: for every input and every value, the breakdown components it
+owns for every language, as computed by the live scorer. The file is decoded
+once at load into one tuple block per input value, so a query picks one block
+per input, joins them and reads each language's components out in a single
+pass; only the free-text inputs (project type and team expertise) are scored
+live.
+
+Usage:
+    python stack_lookup.py                  # compile recommendation_table.bin
+    python stack_recommender.py -p 9 ...    # queries use the table when present
+"""
+
+import functools
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Optional
+
+from stack_recommender import (
+    STACK_OPTIONS, LATENCY_TIERS, THROUGHPUT_TIERS, StackRecommender, load_calibration
+)
+
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recommendation_table.bin')
+TABLE_MAGIC = b'SWLT'
+TABLE_VERSION = 1
+_PREFIX = struct.Struct('<4sII')  # magic, version, header length
+
+SCORER_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stack_recommender.py')
+
+_latency_thresholds = sorted(t for t, _, _ in LATENCY_TIERS)
+_throughput_thresholds = sorted(t for t, _, _ in THROUGHPUT_TIERS)
+
+# Requirement key -> (kind, representative values). Each value stands for
+# every input the live scorer treats the same way.
+DIMENSIONS = [
+    ('performance', 'scale', list(range(1, 11))),
+    ('scalability', 'scale', list(range(1, 11))),
+    ('development_speed', 'scale', list(range(1, 11))),
+    ('team_size', 'exact', ['', 'small', 'large']),
+    ('io_bound', 'flag', [False, True]),
+    ('real_time', 'flag', [False, True]),
+    ('ml_ai', 'flag', [False, True]),
+    ('enterprise', 'flag', [False, True]),
+    ('microservices', 'flag', [False, True]),
+    ('budget', 'choice', ['', 'low', 'high']),
+    ('deployment', 'choice', ['', 'serverless', 'containers', 'on-prem', 'edge']),
+    # At or under each threshold, or above all of them
+    ('latency_ms', 'at_most', [None] + _latency_thresholds + [_latency_thresholds[-1] + 1]),
+    # Under all thresholds, or at or over each of them
+    ('throughput_rps', 'at_least', [None, _throughput_thresholds[0] - 1] + _throughput_thresholds),
+    ('data_store', 'choice', ['', 'sql', 'nosql']),
+    ('compliance', 'any', [[], ['any']]),
+    ('hiring_priority', 'choice', ['', 'high']),
+]
+
+# Value the live scorer assumes for a missing 1-10 input
+SCALE_DEFAULT = 5
+
+# Inputs scored live on top of the table
+LIVE_KEYS = ('project_type', 'team_expertise')
+
+
+def value_index(kind: str, values: List, value) -> Optional[int]:
+    """
+    Index of the representative value equivalent to value, or None if the
+    table cannot answer for it (the caller then scores live).
+    """
+    if kind == 'scale':
+        if isinstance(value, bool) or not isinstance(value, int) or value not in values:
+            return None
+        return values.index(value)
+    if kind == 'flag':
+        return 1 if value else 0
+    if kind in ('exact', 'choice'):
+        if not isinstance(value, str):
+            return None
+        value = value if kind == 'exact' else value.lower()
+        return values.index(value) if value in values else 0
+    if kind == 'any':
+        if not isinstance(value, (list, tuple)):
+            return None
+        return 1 if value else 0
+    if not isinstance(value, int):
+        return 0
+    if kind == 'at_most':
+        for i, threshold in enumerate(values[1:-1], 1):
+            if value <= threshold:
+                return i
+        return len(values) - 1
+    if kind == 'at_least':
+        index = 1
+        for i, threshold in enumerate(values[2:], 2):
+            if value >= threshold:
+                index = i
+        return index
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _scorer_source_digest() -> bytes:
+    """Hash of the scoring code; read once per process"""
+    with open(SCORER_SOURCE, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def scorer_fingerprint(calibration: Dict) -> str:
+    """Identifies the scoring code and calibration a table was compiled from."""
+    digest = hashlib.sha256(_scorer_source_digest())
+    digest.update(json.dumps(calibration, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def compile_table(path: str = TABLE_FILE, calibration: Optional[Dict] = None) -> Dict:
+    """
+    Enumerate every value of every input dimension through the live scorer
+    and write the factored table. Returns the table header.
+    """
+    calibration = {} if calibration is None else calibration
+    recommender = StackRecommender(calibration=calibration)
+    languages = list(STACK_OPTIONS)
+
+    def breakdowns(requirements):
+        return [recommender._score_language(lang, requirements) for lang in languages]
+
+    base = breakdowns({})
+    components = list(base[0])
+    dimensions = []
+    owners = {}
+    for key, kind, values in DIMENSIONS:
+        rows = [breakdowns({} if value is None else {key: value}) for value in values]
+        owned = [c for c in components
+                 if any(row[i][c] != base[i][c] for row in rows for i in range(len(languages)))]
+        for c in owned:
+            if c in owners:
+                raise ValueError(f"breakdown component {c!r} depends on both {owners[c]!r} and {key!r}")
+            owners[c] = key
+        dimensions.append({'key': key, 'kind': kind, 'values': values,
+                           'components': [components.index(c) for c in owned],
+                           # Laid out [value][component][language], so one value's
+                           # component is a contiguous run across languages
+                           'data': [row[i][c] for row in rows for c in owned for i in range(len(languages))]})
+
+    # Base breakdown laid out [component][language] like the runs
+    data = [b[c] for c in components for b in base]
+    offset = len(data)
+    for dim in dimensions:
+        dim['offset'] = offset
+        offset += len(dim['data'])
+        data += dim.pop('data')
+
+    header = {
+        'fingerprint': scorer_fingerprint(calibration),
+        'languages': languages,
+        'components': components,
+        'dimensions': dimensions,
+    }
+    header_bytes = json.dumps(header).encode()
+    # Pad so the float64 block starts 8-byte aligned
+    header_bytes += b' ' * (-(_PREFIX.size + len(header_bytes)) % 8)
+    with open(path, 'wb') as f:
+        f.write(_PREFIX.pack(TABLE_MAGIC, TABLE_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(struct.pack(f'<{len(data)}d', *data))
+    return header
+
+
+class RecommendationTable:
+    """
+    A compiled table. It is decoded once at load into one block of values
+    per input value, laid out [language][component], so a query joins the
+    selected blocks and picks each language's row out with one precomputed
+    itemgetter.
+    """
+
+    def __init__(self, path: str = TABLE_FILE):
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                magic, version, header_len = _PREFIX.unpack_from(mm)
+                if magic != TABLE_MAGIC or version != TABLE_VERSION:
+                    raise ValueError(f"{path} is not a version {TABLE_VERSION} recommendation table")
+                start = _PREFIX.size
+                header = json.loads(mm[start:start + header_len])
+                data = struct.unpack_from(f'<{(len(mm) - start - header_len) // 8}d', mm, start + header_len)
+        self.fingerprint = header['fingerprint']
+        self.languages = header['languages']
+        self.components = header['components']
+        self.dimensions = header['dimensions']
+        n_languages = len(self.languages)
+        owned = {c for d in self.dimensions for c in d['components']}
+        unowned = [c for c in range(len(self.components)) if c not in owned]
+
+        # Base values of the components no input owns, then one block per
+        # input; positions[language][component] indexes the joined blocks
+        self._base_block = tuple(data[c * n_languages + lang] for lang in range(n_languages) for c in unowned)
+        positions = [[0] * len(self.components) for _ in range(n_languages)]
+        for lang in range(n_languages):
+            for k, c in enumerate(unowned):
+                positions[lang][c] = lang * len(unowned) + k
+        block_start = len(self._base_block)
+        self._dims = []
+        for d in self.dimensions:
+            width = len(d['components'])
+            blocks = []
+            for index in range(len(d['values'])):
+                run = d['offset'] + index * width * n_languages
+                blocks.append(tuple(data[run + k * n_languages + lang]
+                                    for lang in range(n_languages) for k in range(width)))
+            for lang in range(n_languages):
+                for k, c in enumerate(d['components']):
+                    positions[lang][c] = block_start + lang * width + k
+            block_start += width * n_languages
+            # Direct lookups for the values the table stores verbatim, by
+            # type so True never matches the scale value 1
+            exact, value_type = None, None
+            if d['kind'] in ('scale', 'flag', 'choice', 'exact'):
+                value_type = {'scale': int, 'flag': bool}.get(d['kind'], str)
+                exact = {v: i for i, v in enumerate(d['values'])}
+            default = SCALE_DEFAULT if d['kind'] == 'scale' else d['values'][0]
+            self._dims.append((d['key'], d['kind'], d['values'], default, value_type, exact, blocks))
+        self._rows = [itemgetter(*row) for row in positions]
+
+    def matches(self, calibration: Dict) -> bool:
+        """Whether the table was compiled from the current scorer and this calibration"""
+        return self.fingerprint == scorer_fingerprint(calibration)
+
+    def select(self, requirements: Dict) -> Optional[tuple]:
+        """
+        The stored values for the structured inputs, joined in the order
+        the row getters expect. None if an input is outside the table's
+        domain.
+        """
+        blocks = [self._base_block]
+        for key, kind, values, default, value_type, exact, value_blocks in self._dims:
+            # Missing inputs default the same way as in the live scorer
+            value = requirements.get(key, default)
+            index = exact.get(value) if type(value) is value_type else None
+            if index is None:
+                index = value_index(kind, values, value)
+                if index is None:
+                    return None
+            blocks.append(value_blocks[index])
+        return tuple(chain.from_iterable(blocks))
+
+    def breakdowns(self, requirements: Dict, project_points: Optional[List[float]] = None,
+                   expertise_points: Optional[List[float]] = None, selected: Optional[tuple] = None
+                   ) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Breakdown of every language, with the given live points for the
+        free-text inputs (aligned with languages; zero if not given). None
+        if an input is outside the table's domain. selected is the result
+        of select(requirements), if already computed.
+        """
+        joined = self.select(requirements) if selected is None else selected
+        if joined is None:
+            return None
+        components = self.components
+        result = {lang: dict(zip(components, row(joined))) for lang, row in zip(self.languages, self._rows)}
+        if project_points is not None:
+            for breakdown, project, expertise in zip(result.values(), project_points, expertise_points):
+                breakdown['project_type'] += project
+                breakdown['team_expertise'] += expertise
+        return result
+
+    def close(self):
+        """Kept for callers that close tables; the data is already decoded"""
+
+
+def load_table(path: str = TABLE_FILE) -> Optional[RecommendationTable]:
+    """The compiled table, or None if there is none (or it is unreadable)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return RecommendationTable(path)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else TABLE_FILE
+    header = compile_table(path, calibration=load_calibration())
+    entries = sum(len(d['values']) for d in header['dimensions'])
+    print(f"✓ Compiled {entries} input values x {len(header['languages'])} languages into {path} "
+          f"({os.path.getsize(path):,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
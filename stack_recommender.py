@@ -16,8 +16,14 @@ language and framework combination based on various criteria including:
 """
 
 import sys
+import os
 import json
-from typing import Dict, List, Tuple
+import functools
+import math
+import re
+import statistics
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
 # Backend language and framework combinations
 STACK_OPTIONS = {
@@ -253,17 +259,447 @@ FRAMEWORK_DETAILS = {
         'type': 'High-performance',
         'strengths': ['Fastest', 'Actor model', 'Async', 'Type-safe'],
         'best_for': ['High-performance', 'Real-time', 'WebSockets', 'APIs']
+    },
+    'Axum': {
+        'type': 'Modular',
+        'strengths': ['Tower middleware', 'Async', 'Type-safe', 'Ergonomic'],
+        'best_for': ['APIs', 'Microservices', 'Web services']
+    },
+    'Fastify': {
+        'type': 'Fast',
+        'strengths': ['Performance', 'Low overhead', 'Schema validation', 'Plugins'],
+        'best_for': ['APIs', 'Microservices', 'High throughput', 'Real-time']
+    },
+    'Grape': {
+        'type': 'API',
+        'strengths': ['REST DSL', 'Versioning', 'Lightweight'],
+        'best_for': ['APIs', 'Microservices']
+    },
+    'Plug': {
+        'type': 'Minimal',
+        'strengths': ['Composable', 'Lightweight', 'Simple'],
+        'best_for': ['APIs', 'Small services', 'Middleware']
+    },
+    'Nerves': {
+        'type': 'Embedded',
+        'strengths': ['Firmware', 'Fault-tolerant', 'OTA updates'],
+        'best_for': ['IoT', 'Embedded systems']
+    },
+    'Play Framework': {
+        'type': 'Full-stack',
+        'strengths': ['Stateless', 'Hot reload', 'Reactive', 'Productivity'],
+        'best_for': ['Web apps', 'APIs', 'Enterprise']
+    },
+    'Akka HTTP': {
+        'type': 'Reactive',
+        'strengths': ['Actor model', 'Streaming', 'Back-pressure', 'Concurrency'],
+        'best_for': ['Streaming apps', 'Distributed systems', 'Real-time']
+    },
+    'Crow': {
+        'type': 'Minimal',
+        'strengths': ['Flask-like', 'Header-only', 'Simple', 'Fast'],
+        'best_for': ['APIs', 'Small services', 'Embedded services']
+    },
+    'Drogon': {
+        'type': 'High-performance',
+        'strengths': ['Fastest', 'Async', 'Non-blocking I/O', 'HTTP/2'],
+        'best_for': ['High-performance', 'High throughput', 'APIs', 'WebSockets']
     }
 }
 
+# Requirement features frameworks are matched on. A framework has a feature
+# when one of its FRAMEWORK_DETAILS type, strengths or best_for entries has
+# all the tokens of one of the phrases (see tokenize); a request has it when
+# the requirements ask for it (see _framework_query).
+FRAMEWORK_FEATURES = {
+    'api': ['api'],
+    'ml': ['ml services', 'machine learning'],
+    'enterprise': ['enterprise', 'large systems'],
+    'complex': ['complex', 'batteries included', 'full-featured'],
+    'large_team': ['large teams', 'structured', 'modular'],
+    'real_time': ['real-time', 'websocket', 'channels'],
+    'event': ['event-driven', 'reactive', 'actor model'],
+    'serverless': ['serverless', 'fast startup'],
+    'containers': ['containers', 'kubernetes', 'cloud'],
+    'edge': ['low memory', 'low overhead', 'header-only'],
+    'minimal': ['minimal', 'lightweight', 'micro-framework'],
+    'simple': ['simple', 'easy to learn'],
+    'full_stack': ['full-stack', 'web apps', 'all-in-one'],
+    'contract': ['design-first', 'contracts', 'codegen'],
+    'iot': ['iot', 'embedded systems', 'firmware'],
+    'stream': ['stream', 'back-pressure'],
+    'performance': ['performance', 'fast', 'fastest', 'high throughput'],
+    # Only used by the rules below
+    'performance_8': [],
+    'performance_9': [],
+}
+
+# Per language, the frameworks preferred when the request has the given
+# features, strongest preference first. Each rule lists alternative feature
+# sets; it applies when the request has every feature of one of them. The
+# last rule has no condition and is the language's default.
+FRAMEWORK_RULES = {
+    'python': [('FastAPI', [['api'], ['ml']]),
+               ('Django', [['enterprise'], ['complex']]),
+               ('Flask', [[]])],
+    'javascript': [('NestJS', [['enterprise'], ['large_team']]),
+                   ('Fastify', [['real_time']]),
+                   ('Express.js', [[]])],
+    'java': [('Quarkus', [['serverless'], ['containers']]),
+             ('Vert.x', [['real_time'], ['event']]),
+             ('Micronaut', [['performance', 'containers'], ['performance', 'edge']]),
+             ('Javalin', [['minimal'], ['simple']]),
+             ('Spring Boot', [[]])],
+    'go': [('Gin', [['api', 'performance']]),
+           ('Buffalo', [['full_stack']]),
+           ('Goa', [['contract']]),
+           ('Chi', [['simple'], ['minimal']]),
+           ('Echo', [[]])],
+    'rust': [('Actix-web', [['real_time'], ['event'], ['api', 'performance_8']]),
+             ('Axum', [[]])],
+    'ruby': [('Grape', [['api']]),
+             ('Ruby on Rails', [[]])],
+    'elixir': [('Phoenix', [['real_time'], ['event']]),
+               ('Nerves', [['iot']]),
+               ('Plug', [[]])],
+    'csharp': [('Minimal APIs', [['minimal'], ['performance_8']]),
+               ('FastEndpoints', [['api']]),
+               ('ASP.NET Core', [[]])],
+    'scala': [('Akka HTTP', [['real_time'], ['stream']]),
+              ('Play Framework', [[]])],
+    'cpp': [('Drogon', [['performance_9']]),
+            ('Crow', [[]])],
+}
+
+# Project type matching works on tokens: lowercase words, with synonyms
+# rewritten to the words the catalog uses, stop words dropped and a light
+# suffix-stripping stem, so 'APIs' matches 'api' but 'rapid' does not
+PROJECT_TYPE_SYNONYMS = {
+    'chat': ['real', 'time'],
+    'realtime': ['real', 'time'],
+    'application': ['app'],
+    'applications': ['app'],
+    'webapp': ['web', 'app'],
+    'webapps': ['web', 'app'],
+    'fullstack': ['full', 'stack'],
+    'rest': ['api'],
+    'restful': ['api'],
+    'scraper': ['scrape'],
+    'crawler': ['crawl'],
+}
+STOP_WORDS = {'a', 'an', 'and', 'the', 'for', 'with', 'of', 'in', 'on', 'to', 'or'}
+
+# Project type terms that signal each framework feature
+PROJECT_TYPE_FEATURES = {
+    'api': ['api'],
+    'complex': ['complex'],
+    'event': ['event'],
+    'minimal': ['minimal'],
+    'simple': ['simple'],
+    'full_stack': ['full', 'web app'],
+    'contract': ['contract', 'design'],
+    'iot': ['iot', 'embedded'],
+    'stream': ['stream'],
+}
+
+# Project type terms that signal a scraping / crawling / parallel IO workload
+SCRAPING_TERMS = ['scrape', 'crawl', 'harvest', 'parallel']
+
+
+def _stem(word: str) -> str:
+    if len(word) > 4 and word.endswith('ies'):
+        word = word[:-3] + 'y'
+    elif len(word) > 5 and word.endswith('ing'):
+        word = word[:-3]
+    elif len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        word = word[:-1]
+    if len(word) > 3 and word.endswith('e'):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Stemmed tokens of a piece of free text, synonyms rewritten"""
+    tokens = []
+    for word in re.findall(r'[a-z0-9]+', text.lower()):
+        for synonym in PROJECT_TYPE_SYNONYMS.get(word, [word]):
+            if synonym not in STOP_WORDS:
+                tokens.append(_stem(synonym))
+    return tokens
+
+
+def build_keyword_index(catalog: Dict[str, Dict]) -> Dict[str, FrozenSet[str]]:
+    """Inverted index: token -> languages whose best_for mentions it"""
+    index = {}
+    for lang_key, lang_data in catalog.items():
+        for token in tokenize(' '.join(lang_data['best_for'])):
+            index.setdefault(token, set()).add(lang_key)
+    return {token: frozenset(langs) for token, langs in index.items()}
+
+
+KEYWORD_INDEX = build_keyword_index(STACK_OPTIONS)
+_FEATURE_TERMS = {feature: [frozenset(tokenize(phrase)) for phrase in phrases]
+                  for feature, phrases in PROJECT_TYPE_FEATURES.items()}
+_SCRAPING_TOKENS = frozenset(token for term in SCRAPING_TERMS for token in tokenize(term))
+# Languages whose project type score gets the scraping / parallel IO bias
+SCRAPING_LANGUAGES = ('go', 'elixir')
+
+
+@functools.lru_cache(maxsize=1024)
+def project_type_matches(project_type: str) -> FrozenSet[str]:
+    """
+    Languages whose best use cases match a project type. Each
+    comma-separated phrase matches the languages that have all of its
+    tokens; the project type matches if any phrase does.
+    """
+    matches = set()
+    for phrase in project_type.split(','):
+        tokens = set(tokenize(phrase))
+        if tokens:
+            matches |= frozenset.intersection(*(KEYWORD_INDEX.get(token, frozenset()) for token in tokens))
+    return frozenset(matches)
+
+
+@functools.lru_cache(maxsize=1024)
+def project_type_tokens(project_type: str) -> FrozenSet[str]:
+    """All tokens of a project type"""
+    return frozenset(tokenize(project_type))
+
+
+FEATURE_BITS = {feature: 1 << i for i, feature in enumerate(FRAMEWORK_FEATURES)}
+_FRAMEWORK_FEATURE_TERMS = {feature: [frozenset(tokenize(phrase)) for phrase in phrases]
+                            for feature, phrases in FRAMEWORK_FEATURES.items()}
+
+
+def _feature_mask(features: List[str]) -> int:
+    mask = 0
+    for feature in features:
+        mask |= FEATURE_BITS[feature]
+    return mask
+
+
+def _compile_framework_matrix() -> Dict[str, List[Tuple[str, List[Tuple[List[int], int]], int]]]:
+    """
+    Per language, every framework as (name, rules, feature mask). Rules are
+    (alternative condition masks, points), with points doubling up the
+    preference order so the strongest applicable rule always decides; the
+    feature overlap only orders frameworks no rule prefers.
+    """
+    matrix = {}
+    for lang_key, lang_data in STACK_OPTIONS.items():
+        rules = FRAMEWORK_RULES.get(lang_key, [])
+        entries = []
+        for name in lang_data['frameworks']:
+            details = FRAMEWORK_DETAILS.get(name, {})
+            phrases = [frozenset(tokenize(entry)) for entry in
+                              [details.get('type', '')] + details.get('strengths', []) + details.get('best_for', [])]
+            features = [f for f, terms in _FRAMEWORK_FEATURE_TERMS.items()
+                        if any(term <= tokens for term in terms for tokens in phrases)]
+            framework_rules = [([_feature_mask(condition) for condition in conditions], 1 << (len(rules) - i))
+                               for i, (framework, conditions) in enumerate(rules) if framework == name]
+            entries.append((name, framework_rules, _feature_mask(features)))
+        matrix[lang_key] = entries
+    return matrix
+
+
+@functools.lru_cache(maxsize=1024)
+def _project_type_features(project_type: str) -> Tuple[str, ...]:
+    """Framework features a project type asks for"""
+    tokens = project_type_tokens(project_type)
+    return tuple(f for f, terms in _FEATURE_TERMS.items() if any(term <= tokens for term in terms))
+
+
+def _framework_query(requirements: Dict) -> int:
+    """Feature mask of a request"""
+    deployment = requirements.get('deployment', '').lower()
+    performance = requirements.get('performance', 5)
+    features = list(_project_type_features(requirements.get('project_type', '')))
+    if requirements.get('ml_ai', False):
+        features.append('ml')
+    if requirements.get('enterprise', False):
+        features.append('enterprise')
+    if requirements.get('real_time', False):
+        features.append('real_time')
+    if requirements.get('team_size', '') == 'large':
+        features.append('large_team')
+    if deployment in ('serverless', 'containers', 'edge'):
+        features.append(deployment)
+    for threshold, feature in [(7, 'performance'), (8, 'performance_8'), (9, 'performance_9')]:
+        if performance >= threshold:
+            features.append(feature)
+    return _feature_mask(features)
+
+
+FRAMEWORK_MATRIX = _compile_framework_matrix()
+
+
+@functools.lru_cache(maxsize=4096)
+def _rank_frameworks(lang_key: str, query: int) -> Tuple[Tuple[str, float], ...]:
+    """Frameworks of a language ranked for a request's feature mask"""
+    n_features = bin(query).count('1')
+    ranked = []
+    for name, rules, features in FRAMEWORK_MATRIX.get(lang_key, []):
+        points = sum(weight for conditions, weight in rules
+                     if any(query & condition == condition for condition in conditions))
+        ranked.append((name, points + bin(query & features).count('1') / (n_features + 1)))
+    return tuple(sorted(ranked, key=lambda x: x[1], reverse=True))
+
+# Hand-tuned performance multipliers, used for languages without calibration data
+PERFORMANCE_MULTIPLIERS = {
+    'rust': 1.5, 'cpp': 1.5,
+    'go': 1.2, 'java': 1.2, 'csharp': 1.2,
+    'javascript': 0.8, 'elixir': 0.8, 'scala': 0.8,
+    'python': 0.5, 'ruby': 0.5,
+}
+DEFAULT_PERFORMANCE_MULTIPLIER = 0.5
+
+# Languages earning the latency/throughput bonuses without calibration data:
+# (threshold, points, languages)
+LATENCY_TIERS = [(100, 6, ['rust', 'cpp', 'go']), (500, 4, ['java', 'csharp', 'go'])]
+THROUGHPUT_TIERS = [(10000, 6, ['go', 'rust', 'cpp']), (1000, 4, ['go', 'rust', 'java'])]
+
+# Calibration table derived from measured benchmark results (see calibrate_from_dataset)
+CALIBRATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'calibration.json')
+CALIBRATION_VERSION = 1
+# Range the calibrated performance multipliers are scaled to, matching the hand-tuned ones
+CALIBRATED_PERFORMANCE_RANGE = (0.5, 1.5)
+# Timings below this are clock noise (several suites report whole milliseconds)
+MIN_TIMING_MS = 0.5
+
+
+def load_calibration(path: str = CALIBRATION_FILE) -> Dict[str, Dict[str, float]]:
+    """
+    Load per-language calibration factors. Returns an empty table if the file
+    is missing or was written by an incompatible version.
+    """
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != CALIBRATION_VERSION:
+        return {}
+    return data.get('languages', {})
+
+
+def _rescale(values: Dict[str, float], low: float, high: float) -> Dict[str, float]:
+    """Min-max scale values to [low, high] (all at the midpoint if they are equal)."""
+    if not values:
+        return {}
+    smallest, largest = min(values.values()), max(values.values())
+    if largest == smallest:
+        return {k: round((low + high) / 2, 3) for k in values}
+    return {k: round(low + (v - smallest) / (largest - smallest) * (high - low), 3) for k, v in values.items()}
+
+
+def calibrate_from_dataset(dataset: Dict) -> Dict[str, Dict[str, float]]:
+    """
+    Derive per-language factors from a normalized benchmark dataset
+    (benchmark_results.py):
+    - performance: CPU speed relative to the other languages, averaged in log
+      space over the benchmarks several languages ran, scaled to
+      CALIBRATED_PERFORMANCE_RANGE
+    - latency: 0-1, lower measured API p95 is better
+    - throughput: 0-1, higher measured API requests/second is better
+    """
+    cpu_times = {}
+    p95 = {}
+    rps = {}
+    for lang, suite, benchmark, metric, value in zip(
+            dataset['language'], dataset['suite'], dataset['benchmark'], dataset['metric'], dataset['value']):
+        if suite == 'cpu' and metric == 'execution_time':
+            cpu_times.setdefault(benchmark, {})[lang] = max(value, MIN_TIMING_MS)
+        elif suite == 'api' and metric == 'p95' and value > 0:
+            p95[lang] = value
+        elif suite == 'api' and metric == 'requests_per_second' and value > 0:
+            rps[lang] = value
+
+    relative = {}
+    for timings in cpu_times.values():
+        if len(timings) < 2:
+            continue
+        logs = {lang: math.log(ms) for lang, ms in timings.items()}
+        center = statistics.median(logs.values())
+        for lang, log_ms in logs.items():
+            relative.setdefault(lang, []).append(log_ms - center)
+
+    factors = {}
+    low, high = CALIBRATED_PERFORMANCE_RANGE
+    speed = {lang: -sum(diffs) / len(diffs) for lang, diffs in relative.items()}
+    for name, values in [('performance', _rescale(speed, low, high)),
+                         ('latency', _rescale({l: -math.log(v) for l, v in p95.items()}, 0.0, 1.0)),
+                         ('throughput', _rescale({l: math.log(v) for l, v in rps.items()}, 0.0, 1.0))]:
+        for lang, value in values.items():
+            factors.setdefault(lang, {})[name] = value
+    return factors
+
+
+def save_calibration(factors: Dict[str, Dict[str, float]], path: str = CALIBRATION_FILE) -> None:
+    with open(path, 'w') as f:
+        json.dump({'version': CALIBRATION_VERSION, 'languages': factors}, f, indent=2, sort_keys=True)
+
+
+_CONTAINERS = (list, tuple, set, frozenset, dict)
+
+
+def _freeze(value):
+    """Read-only copy of a requirement value: lists become tuples, dicts read-only views"""
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+class Recommendation(NamedTuple):
+    """
+    Immutable result of scoring one set of requirements. The mappings are
+    read-only views of copies owned by the result, with list values in the
+    requirements frozen to tuples.
+    """
+    recommendations: Tuple[Tuple[str, float, str], ...]  # (language, score, framework), best first
+    scores: Mapping[str, float]
+    breakdowns: Mapping[str, Mapping[str, float]]
+    requirements: Mapping  # the requirements as scored, plus constraint_miss
+    constraint_miss: bool
+
 
 class StackRecommender:
-    """Analyzes requirements and recommends the best backend stack"""
+    """
+    Analyzes requirements and recommends the best backend stack.
+
+    score() is stateless: it reads only the configuration fixed at
+    construction and returns a Recommendation, so one instance can serve
+    concurrent callers. analyze_requirements() wraps it and keeps the
+    latest result on the instance for format_recommendation().
+    """
     
-    def __init__(self):
+    def __init__(self, calibration: Optional[Dict[str, Dict[str, float]]] = None, table=None, catalog=None):
         self.scores = {}
         self.requirements = {}
         self.breakdowns = {}
+        # Measured per-language factors, e.g. load_calibration(); by default
+        # only the hand-tuned values are used, whatever calibration.json says
+        self.calibration = {} if calibration is None else calibration
+        # Precomputed lookup table (stack_lookup.py); only used if it was
+        # compiled from this scorer with the same calibration
+        self.table = table if table is not None and table.matches(self.calibration) else None
+        # Registered stack variants (stack_catalog.py), scored via their base language
+        self.catalog = catalog
+
+    def stacks(self) -> List[str]:
+        """Keys of every stack scored: the built-in languages, then catalog variants"""
+        return list(STACK_OPTIONS) + (self.catalog.keys if self.catalog is not None else [])
+
+    def base_language(self, lang_key: str) -> str:
+        """The built-in language a stack is scored as"""
+        return lang_key if lang_key in STACK_OPTIONS else self.catalog.base(lang_key)
+
+    def stack_info(self, lang_key: str) -> Dict:
+        """STACK_OPTIONS entry of a language, or the catalog entry of a variant"""
+        return STACK_OPTIONS[lang_key] if lang_key in STACK_OPTIONS else self.catalog.entry(lang_key)
     
     def analyze_requirements(self, requirements: Dict, top_n: int = None) -> List[Tuple[str, float, str]]:
         """
@@ -275,314 +711,324 @@ class StackRecommender:
         Returns:
             List of (language, score, framework) tuples sorted by score
         """
-        self.requirements = requirements
-        self.scores = {}
-        self.breakdowns = {}
-        
-        # Apply hard constraints first
-        constrained_languages = list(STACK_OPTIONS.keys())
+        result = self.score(requirements, top_n)
+        self.requirements = result.requirements
+        self.scores = result.scores
+        self.breakdowns = result.breakdowns
+        return list(result.recommendations)
+
+    def score(self, requirements: Dict, top_n: int = None) -> Recommendation:
+        """
+        Score each language for the requirements without touching the
+        instance or the caller's dict
+        """
+        requirements = {key: _freeze(value) if isinstance(value, _CONTAINERS) else value
+                        for key, value in requirements.items()}
+
+        # Apply hard constraints first; a language's constraints cover its variants
+        constrained_languages = self.stacks()
         must_use = [l.strip().lower() for l in requirements.get('must_use', []) if l.strip()]
         avoid = [l.strip().lower() for l in requirements.get('avoid', []) if l.strip()]
 
+        constraint_miss = False
         if must_use:
-            constrained_languages = [l for l in constrained_languages if l in must_use]
+            constrained_languages = [l for l in constrained_languages
+                                     if l in must_use or self.base_language(l) in must_use]
             if not constrained_languages:
                 # If nothing matches, fall back to all and note the miss
-                constrained_languages = list(STACK_OPTIONS.keys())
+                constrained_languages = self.stacks()
+                constraint_miss = True
                 requirements['constraint_miss'] = True
 
         if avoid:
-            constrained_languages = [l for l in constrained_languages if l not in avoid]
+            constrained_languages = [l for l in constrained_languages
+                                     if l not in avoid and self.base_language(l) not in avoid]
 
-        # Score each language
+        # Score each language, from the precomputed table when it covers the inputs
+        scores = {}
+        breakdowns = {}
+        language_breakdowns = self._table_breakdowns(requirements) if self.table is not None else None
+        if language_breakdowns is None:
+            language_breakdowns = {}
         for lang_key in constrained_languages:
-            lang_data = STACK_OPTIONS[lang_key]
-            score = 0.0
-            breakdown = {
-                'performance': 0.0,
-                'scalability': 0.0,
-                'development_speed': 0.0,
-                'team_size': 0.0,
-                'project_type': 0.0,
-                'real_time': 0.0,
-                'ml_ai': 0.0,
-                'team_expertise': 0.0,
-                'enterprise': 0.0,
-                'microservices': 0.0,
-                'budget': 0.0,
-                'deployment': 0.0,
-                'latency': 0.0,
-                'throughput': 0.0,
-                'data_store': 0.0,
-                'compliance': 0.0,
-                'hiring': 0.0,
-            }
-            
-            # Performance requirements (0-10)
-            performance_need = requirements.get('performance', 5)
-            if lang_key in ['rust', 'cpp']:
-                breakdown['performance'] = performance_need * 1.5
-            elif lang_key in ['go', 'java', 'csharp']:
-                breakdown['performance'] = performance_need * 1.2
-            elif lang_key in ['javascript', 'elixir', 'scala']:
-                breakdown['performance'] = performance_need * 0.8
-            else:
-                breakdown['performance'] = performance_need * 0.5
-            score += breakdown['performance']
-            
-            # Scalability requirements (0-10)
-            scalability_need = requirements.get('scalability', 5)
-            if lang_key in ['go', 'elixir', 'rust']:
-                breakdown['scalability'] = scalability_need * 1.4
-            elif lang_key in ['java', 'csharp', 'scala']:
-                breakdown['scalability'] = scalability_need * 1.2
-            else:
-                breakdown['scalability'] = scalability_need * 0.8
-            score += breakdown['scalability']
-            
-            # Development speed priority (0-10)
-            dev_speed = requirements.get('development_speed', 5)
-            if lang_key in ['python', 'ruby', 'javascript']:
-                breakdown['development_speed'] = dev_speed * 1.5
-            elif lang_key in ['go', 'java', 'csharp']:
-                breakdown['development_speed'] = dev_speed * 1.0
+            if lang_key in language_breakdowns:
+                breakdown = language_breakdowns[lang_key]
+            elif lang_key in STACK_OPTIONS:
+                breakdown = language_breakdowns[lang_key] = self._score_language(lang_key, requirements)
             else:
-                breakdown['development_speed'] = dev_speed * 0.6
-            score += breakdown['development_speed']
-            
-            # Team size consideration
-            team_size = requirements.get('team_size', 'medium')
-            if team_size == 'large' and lang_data['team_size'] in ['medium-to-large', 'any']:
-                breakdown['team_size'] = 10
-            elif team_size == 'small' and lang_data['team_size'] in ['small', 'small-to-medium', 'any']:
-                breakdown['team_size'] = 8
-            score += breakdown['team_size']
-            
-            # Project type matching
-            project_type = requirements.get('project_type', '')
-            if project_type and self._matches_project_type(project_type, lang_data):
-                breakdown['project_type'] = 15
-            score += breakdown['project_type']
-
-            # Scraping / crawling / parallel IO bias
-            project_type_lc = project_type.lower()
-            if any(k in project_type_lc for k in ['scrape', 'scraping', 'crawler', 'crawling', 'harvest', 'parallel']):
-                if lang_key in ['go', 'elixir']:
-                    breakdown['project_type'] += 10
-                    score += 10
-
-            # IO-bound / crawling workloads
-            if requirements.get('io_bound', False):
-                if lang_key in ['go', 'elixir']:
-                    breakdown['project_type'] += 12
-                    score += 12
-                elif lang_key in ['javascript', 'python']:
-                    breakdown['project_type'] += 4
-                    score += 4
-            
-            # Real-time requirements
-            if requirements.get('real_time', False):
-                if lang_key in ['elixir', 'javascript', 'go']:
-                    breakdown['real_time'] = 12
-            score += breakdown['real_time']
-            
-            # Machine learning / AI
-            if requirements.get('ml_ai', False):
-                if lang_key == 'python':
-                    breakdown['ml_ai'] = 20
-            score += breakdown['ml_ai']
-            
-            # Existing team expertise
-            team_expertise = requirements.get('team_expertise', [])
-            if lang_key in [e.lower() for e in team_expertise]:
-                breakdown['team_expertise'] = 15
-            score += breakdown['team_expertise']
-            
-            # Enterprise requirements
-            if requirements.get('enterprise', False):
-                if lang_key in ['java', 'csharp', 'scala']:
-                    breakdown['enterprise'] = 6
-            score += breakdown['enterprise']
-            
-            # Microservices architecture
-            if requirements.get('microservices', False):
-                if lang_key in ['go', 'java', 'javascript']:
-                    breakdown['microservices'] = 10
-            score += breakdown['microservices']
-
-            # Budget constraints
-            budget = requirements.get('budget', '').lower()
-            if budget == 'low' and lang_key in ['python', 'javascript', 'go', 'ruby']:
-                breakdown['budget'] = 5
-            elif budget == 'high' and lang_key in ['java', 'csharp', 'rust']:
-                breakdown['budget'] = 3
-            score += breakdown['budget']
-
-            # Deployment model
-            deployment = requirements.get('deployment', '').lower()
-            if deployment == 'serverless' and lang_key in ['python', 'javascript', 'go']:
-                breakdown['deployment'] = 6
-            elif deployment == 'containers' and lang_key in ['go', 'rust', 'java']:
-                breakdown['deployment'] = 4
-            elif deployment == 'on-prem' and lang_key in ['java', 'csharp']:
-                breakdown['deployment'] = 5
-            elif deployment == 'edge' and lang_key in ['rust', 'cpp', 'go']:
-                breakdown['deployment'] = 6
-            score += breakdown['deployment']
-
-            # Reliability targets
-            latency_ms = requirements.get('latency_ms')
-            if isinstance(latency_ms, int):
-                if latency_ms <= 100 and lang_key in ['rust', 'cpp', 'go']:
-                    breakdown['latency'] = 6
-                elif latency_ms <= 500 and lang_key in ['java', 'csharp', 'go']:
-                    breakdown['latency'] = 4
-            score += breakdown['latency']
-
-            throughput_rps = requirements.get('throughput_rps')
-            if isinstance(throughput_rps, int):
-                if throughput_rps >= 10000 and lang_key in ['go', 'rust', 'cpp']:
-                    breakdown['throughput'] = 6
-                elif throughput_rps >= 1000 and lang_key in ['go', 'rust', 'java']:
-                    breakdown['throughput'] = 4
-            score += breakdown['throughput']
-
-            # Data store preference
-            data_store = requirements.get('data_store', '').lower()
-            if data_store == 'sql' and lang_key in ['java', 'csharp', 'python', 'ruby']:
-                breakdown['data_store'] = 3
-            elif data_store == 'nosql' and lang_key in ['javascript', 'go']:
-                breakdown['data_store'] = 3
-            score += breakdown['data_store']
-
-            # Compliance requirements
-            compliance = [c.lower() for c in requirements.get('compliance', [])]
-            if compliance:
-                if lang_key in ['java', 'csharp']:
-                    breakdown['compliance'] = 6
-                elif lang_key in ['python', 'go']:
-                    breakdown['compliance'] = 3
-            score += breakdown['compliance']
-
-            # Hiring priority
-            hiring_priority = requirements.get('hiring_priority', '').lower()
-            if hiring_priority == 'high' and lang_key in ['python', 'javascript', 'java', 'csharp']:
-                breakdown['hiring'] = 5
-            score += breakdown['hiring']
-            
-            self.scores[lang_key] = score
-            self.breakdowns[lang_key] = breakdown
+                base = self.catalog.base(lang_key)
+                if base not in language_breakdowns:
+                    language_breakdowns[base] = self._score_language(base, requirements)
+                breakdown = self._score_variant(lang_key, requirements, language_breakdowns[base])
+            scores[lang_key] = sum(breakdown.values())
+            breakdowns[lang_key] = MappingProxyType(breakdown)
         
         # Get recommendations (all by default, or top_n)
-        sorted_langs = sorted(self.scores.items(), key=lambda x: x[1], reverse=True)
+        sorted_langs = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         if top_n is not None and top_n > 0:
             sorted_langs = sorted_langs[:top_n]
 
         # Match with best framework for each language
-        recommendations = []
-        for lang_key, score in sorted_langs:
-            framework = self._recommend_framework(lang_key, requirements)
-            recommendations.append((lang_key, score, framework))
-        
-        return recommendations
+        query = _framework_query(requirements)
+        recommendations = tuple((lang_key, score, self._recommend_framework(lang_key, requirements, query))
+                                for lang_key, score in sorted_langs)
+        return Recommendation(recommendations, MappingProxyType(scores), MappingProxyType(breakdowns),
+                              MappingProxyType(requirements), constraint_miss)
     
-    def _matches_project_type(self, project_type: str, lang_data: Dict) -> bool:
-        """Check if project type matches language's best use cases"""
-        best_for_text = ' '.join(lang_data['best_for']).lower()
-        project_keywords = [pt.strip().lower() for pt in project_type.split(',')]
-        return any(keyword in best_for_text for keyword in project_keywords)
-    
-    def _recommend_framework(self, lang_key: str, requirements: Dict) -> str:
-        """Recommend the best framework for a language based on requirements"""
-        frameworks = STACK_OPTIONS[lang_key]['frameworks']
-        
-        # Simple framework selection logic
-        project_type = requirements.get('project_type', '').lower()
-        deployment = requirements.get('deployment', '').lower()
-        real_time = requirements.get('real_time', False)
-        enterprise = requirements.get('enterprise', False)
-        team_size = requirements.get('team_size', '')
-        performance = requirements.get('performance', 5)
-        ml_ai = requirements.get('ml_ai', False)
-        
-        if lang_key == 'python':
-            if 'api' in project_type or ml_ai:
-                return 'FastAPI'
-            elif enterprise or 'complex' in project_type:
-                return 'Django'
-            else:
-                return 'Flask'
+    def _score_language(self, lang_key: str, requirements: Dict) -> Dict[str, float]:
+        """Score breakdown of one language for the given requirements"""
+        lang_data = STACK_OPTIONS[lang_key]
+        breakdown = {
+            'performance': 0.0,
+            'scalability': 0.0,
+            'development_speed': 0.0,
+            'team_size': 0.0,
+            'project_type': 0.0,
+            'real_time': 0.0,
+            'ml_ai': 0.0,
+            'team_expertise': 0.0,
+            'enterprise': 0.0,
+            'microservices': 0.0,
+            'budget': 0.0,
+            'deployment': 0.0,
+            'latency': 0.0,
+            'throughput': 0.0,
+            'data_store': 0.0,
+            'compliance': 0.0,
+            'hiring': 0.0,
+        }
         
-        elif lang_key == 'javascript':
-            if enterprise or team_size == 'large':
-                return 'NestJS'
-            if real_time:
-                return 'Fastify'
-            else:
-                return 'Express.js'
+        # Performance requirements (0-10)
+        performance_need = requirements.get('performance', 5)
+        breakdown['performance'] = performance_need * self._performance_multiplier(lang_key)
         
-        elif lang_key == 'java':
-            if deployment in ['serverless', 'containers']:
-                return 'Quarkus'
-            if real_time or 'event' in project_type:
-                return 'Vert.x'
-            if performance >= 7 and deployment in ['containers', 'edge']:
-                return 'Micronaut'
-            if 'minimal' in project_type or 'simple' in project_type:
-                return 'Javalin'
-            return 'Spring Boot'
+        # Scalability requirements (0-10)
+        scalability_need = requirements.get('scalability', 5)
+        if lang_key in ['go', 'elixir', 'rust']:
+            breakdown['scalability'] = scalability_need * 1.4
+        elif lang_key in ['java', 'csharp', 'scala']:
+            breakdown['scalability'] = scalability_need * 1.2
+        else:
+            breakdown['scalability'] = scalability_need * 0.8
         
-        elif lang_key == 'go':
-            if 'api' in project_type and performance >= 7:
-                return 'Gin'
-            if 'full' in project_type or 'web app' in project_type:
-                return 'Buffalo'
-            if 'contract' in project_type or 'design' in project_type:
-                return 'Goa'
-            if 'simple' in project_type or 'minimal' in project_type:
-                return 'Chi'
-            return 'Echo'
+        # Development speed priority (0-10)
+        dev_speed = requirements.get('development_speed', 5)
+        if lang_key in ['python', 'ruby', 'javascript']:
+            breakdown['development_speed'] = dev_speed * 1.5
+        elif lang_key in ['go', 'java', 'csharp']:
+            breakdown['development_speed'] = dev_speed * 1.0
+        else:
+            breakdown['development_speed'] = dev_speed * 0.6
         
-        elif lang_key == 'rust':
-            if real_time or 'event' in project_type:
-                return 'Actix-web'
-            if 'api' in project_type and performance >= 8:
-                return 'Actix-web'
-            return 'Axum'
+        # Team size consideration
+        team_size = requirements.get('team_size', 'medium')
+        if team_size == 'large' and lang_data['team_size'] in ['medium-to-large', 'any']:
+            breakdown['team_size'] = 10
+        elif team_size == 'small' and lang_data['team_size'] in ['small', 'small-to-medium', 'any']:
+            breakdown['team_size'] = 8
         
-        elif lang_key == 'ruby':
-            if 'api' in project_type:
-                return 'Grape'
-            return 'Ruby on Rails'
+        # Project type matching (free text)
+        breakdown['project_type'] = self._project_type_points(
+            requirements.get('project_type', ''), lang_key)
+
+        # IO-bound / crawling workloads
+        if requirements.get('io_bound', False):
+            if lang_key in ['go', 'elixir']:
+                breakdown['project_type'] += 12
+            elif lang_key in ['javascript', 'python']:
+                breakdown['project_type'] += 4
         
-        elif lang_key == 'elixir':
-            if real_time or 'event' in project_type:
-                return 'Phoenix'
-            if 'iot' in project_type or 'embedded' in project_type:
-                return 'Nerves'
-            return 'Plug'
+        # Real-time requirements
+        if requirements.get('real_time', False):
+            if lang_key in ['elixir', 'javascript', 'go']:
+                breakdown['real_time'] = 12
         
-        elif lang_key == 'csharp':
-            if 'minimal' in project_type or performance >= 8:
-                return 'Minimal APIs'
-            if 'api' in project_type:
-                return 'FastEndpoints'
-            return 'ASP.NET Core'
+        # Machine learning / AI
+        if requirements.get('ml_ai', False):
+            if lang_key == 'python':
+                breakdown['ml_ai'] = 20
         
-        elif lang_key == 'scala':
-            if real_time or 'stream' in project_type:
-                return 'Akka HTTP'
-            return 'Play Framework'
+        # Existing team expertise
+        breakdown['team_expertise'] = self._expertise_points(
+            requirements.get('team_expertise', []), lang_key)
         
-        elif lang_key == 'cpp':
-            if performance >= 9:
-                return 'Drogon'
-            return 'Crow'
+        # Enterprise requirements
+        if requirements.get('enterprise', False):
+            if lang_key in ['java', 'csharp', 'scala']:
+                breakdown['enterprise'] = 6
         
-        return frameworks[0] if frameworks else 'None'
+        # Microservices architecture
+        if requirements.get('microservices', False):
+            if lang_key in ['go', 'java', 'javascript']:
+                breakdown['microservices'] = 10
+
+        # Budget constraints
+        budget = requirements.get('budget', '').lower()
+        if budget == 'low' and lang_key in ['python', 'javascript', 'go', 'ruby']:
+            breakdown['budget'] = 5
+        elif budget == 'high' and lang_key in ['java', 'csharp', 'rust']:
+            breakdown['budget'] = 3
+
+        # Deployment model
+        deployment = requirements.get('deployment', '').lower()
+        if deployment == 'serverless' and lang_key in ['python', 'javascript', 'go']:
+            breakdown['deployment'] = 6
+        elif deployment == 'containers' and lang_key in ['go', 'rust', 'java']:
+            breakdown['deployment'] = 4
+        elif deployment == 'on-prem' and lang_key in ['java', 'csharp']:
+            breakdown['deployment'] = 5
+        elif deployment == 'edge' and lang_key in ['rust', 'cpp', 'go']:
+            breakdown['deployment'] = 6
+
+        # Reliability targets
+        latency_ms = requirements.get('latency_ms')
+        if isinstance(latency_ms, int):
+            breakdown['latency'] = self._target_points(
+                lang_key, 'latency', [t for t in LATENCY_TIERS if latency_ms <= t[0]])
+
+        throughput_rps = requirements.get('throughput_rps')
+        if isinstance(throughput_rps, int):
+            breakdown['throughput'] = self._target_points(
+                lang_key, 'throughput', [t for t in THROUGHPUT_TIERS if throughput_rps >= t[0]])
+
+        # Data store preference
+        data_store = requirements.get('data_store', '').lower()
+        if data_store == 'sql' and lang_key in ['java', 'csharp', 'python', 'ruby']:
+            breakdown['data_store'] = 3
+        elif data_store == 'nosql' and lang_key in ['javascript', 'go']:
+            breakdown['data_store'] = 3
+
+        # Compliance requirements
+        compliance = [c.lower() for c in requirements.get('compliance', [])]
+        if compliance:
+            if lang_key in ['java', 'csharp']:
+                breakdown['compliance'] = 6
+            elif lang_key in ['python', 'go']:
+                breakdown['compliance'] = 3
+
+        # Hiring priority
+        hiring_priority = requirements.get('hiring_priority', '').lower()
+        if hiring_priority == 'high' and lang_key in ['python', 'javascript', 'java', 'csharp']:
+            breakdown['hiring'] = 5
+        return breakdown
+
+    def _table_breakdowns(self, requirements: Dict) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Breakdown of every built-in language from the precomputed table, with
+        the free-text inputs scored once for all languages. None if an input
+        is outside the table's domain.
+        """
+        selected = self.table.select(requirements)
+        if selected is None:
+            return None
+        languages = self.table.languages
+        project_type = requirements.get('project_type', '')
+        matched = project_type_matches(project_type) if project_type else frozenset()
+        scraping = bool(project_type_tokens(project_type) & _SCRAPING_TOKENS)
+        known = {e.lower() for e in requirements.get('team_expertise', [])}
+        project_points = [(15 if lang in matched else 0) + (10 if scraping and lang in SCRAPING_LANGUAGES else 0)
+                          for lang in languages]
+        expertise_points = [15 if lang in known else 0 for lang in languages]
+        return self.table.breakdowns(requirements, project_points, expertise_points, selected)
+
+    def _score_variant(self, lang_key: str, requirements: Dict,
+                       base_breakdown: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """
+        Score breakdown of a catalog variant: its base language's, with the
+        project type matched on the variant's own best_for, plus its bonus
+        """
+        base = self.catalog.base(lang_key)
+        if base_breakdown is None:
+            base_breakdown = self._score_language(base, requirements)
+        breakdown = dict(base_breakdown)
+        breakdown['project_type'] -= self._project_type_points(requirements.get('project_type', ''), base)
+        breakdown['project_type'] += self._project_type_points(requirements.get('project_type', ''), lang_key)
+        for component, points in self.catalog.bonus(lang_key).items():
+            breakdown[component] += points
+        return breakdown
+
+    def _project_type_points(self, project_type: str, lang_key: str) -> float:
+        """Points from the free-text project type: best_for match plus the scraping bias"""
+        points = 0
+        if project_type and self._matches_project_type(project_type, lang_key):
+            points = 15
+
+        # Scraping / crawling / parallel IO bias
+        if self.base_language(lang_key) in SCRAPING_LANGUAGES and \
+                project_type_tokens(project_type) & _SCRAPING_TOKENS:
+            points += 10
+        return points
+
+    def _expertise_points(self, team_expertise: List[str], lang_key: str) -> float:
+        """Points for languages the team already knows"""
+        if lang_key in [e.lower() for e in team_expertise]:
+            return 15
+        return 0
+
+    def _performance_multiplier(self, lang_key: str) -> float:
+        """Calibrated performance multiplier, or the hand-tuned one"""
+        factors = self.calibration.get(lang_key, {})
+        if 'performance' in factors:
+            return factors['performance']
+        return PERFORMANCE_MULTIPLIERS.get(lang_key, DEFAULT_PERFORMANCE_MULTIPLIER)
+
+    def _target_points(self, lang_key: str, factor: str, tiers: List[Tuple]) -> float:
+        """
+        Bonus for a latency/throughput target. tiers are the ones the target
+        qualifies for, strictest first. With calibration data the strictest
+        tier's points are scaled by the measured 0-1 factor; otherwise the
+        first tier listing the language applies.
+        """
+        if not tiers:
+            return 0
+        factors = self.calibration.get(lang_key, {})
+        if factor in factors:
+            return round(tiers[0][1] * factors[factor], 2)
+        for _, points, languages in tiers:
+            if lang_key in languages:
+                return points
+        return 0
+
+    def _matches_project_type(self, project_type: str, lang_key: str) -> bool:
+        """Check if project type matches language's best use cases"""
+        if lang_key in STACK_OPTIONS:
+            return lang_key in project_type_matches(project_type)
+        return lang_key in self.catalog.matches(project_type)
+    
+    def _recommend_framework(self, lang_key: str, requirements: Dict, query: Optional[int] = None) -> str:
+        """Recommend the best framework for a language based on requirements"""
+        if lang_key in STACK_OPTIONS:
+            ranked = _rank_frameworks(lang_key, _framework_query(requirements) if query is None else query)
+        else:
+            ranked = self.rank_frameworks(lang_key, requirements, query)
+        return ranked[0][0] if ranked else 'None'
+
+    def rank_frameworks(self, lang_key: str, requirements: Dict,
+                        query: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        All frameworks of a language with their match scores, best first.
+        Scores are the points of the preference rules the request meets plus
+        the fraction of the request's features the framework covers. query
+        is the request's feature mask, if already computed.
+        """
+        query = _framework_query(requirements) if query is None else query
+        if lang_key in STACK_OPTIONS:
+            return list(_rank_frameworks(lang_key, query))
+        # Variants rank their frameworks as the base language does; ones the
+        # base language does not list come last
+        frameworks = self.catalog.entry(lang_key)['frameworks']
+        ranked = [(name, score) for name, score in _rank_frameworks(self.catalog.base(lang_key), query)
+                  if name in frameworks]
+        return ranked + [(name, 0.0) for name in frameworks if name not in dict(ranked)]
     
-    def format_recommendation(self, recommendations: List[Tuple[str, float, str]]) -> str:
-        """Format recommendations as a readable string"""
+    def format_recommendation(self, recommendations: List[Tuple[str, float, str]],
+                              result: Optional[Recommendation] = None) -> str:
+        """
+        Format recommendations as a readable string, with the breakdowns and
+        criteria of result (by default, of the last analyze_requirements call)
+        """
+        requirements = self.requirements if result is None else result.requirements
+        breakdowns = self.breakdowns if result is None else result.breakdowns
         output = []
         output.append("\n" + "="*80)
         output.append("  STACK WIZARD - BACKEND STACK RECOMMENDATIONS")
@@ -597,8 +1043,8 @@ class StackRecommender:
 
         rows = []
         for idx, (lang_key, score, framework) in enumerate(recommendations, 1):
-            lang_data = STACK_OPTIONS[lang_key]
-            b = self.breakdowns.get(lang_key, {})
+            lang_data = self.stack_info(lang_key)
+            b = breakdowns.get(lang_key, {})
             rows.append([
                 str(idx),
                 lang_data['name'],
@@ -640,35 +1086,35 @@ class StackRecommender:
 
         output.append("\n" + "="*80)
         output.append("Recommendation Criteria Used:")
-        if self.requirements.get('budget'):
-            output.append(f"  • Budget: {self.requirements['budget']}")
-        if self.requirements.get('deployment'):
-            output.append(f"  • Deployment Model: {self.requirements['deployment']}")
-        if self.requirements.get('performance'):
-            output.append(f"  • Performance Priority: {self.requirements['performance']}/10")
-        if self.requirements.get('scalability'):
-            output.append(f"  • Scalability Need: {self.requirements['scalability']}/10")
-        if self.requirements.get('development_speed'):
-            output.append(f"  • Development Speed: {self.requirements['development_speed']}/10")
-        if self.requirements.get('team_size'):
-            output.append(f"  • Team Size: {self.requirements['team_size']}")
-        if self.requirements.get('project_type'):
-            output.append(f"  • Project Type: {self.requirements['project_type']}")
-        if self.requirements.get('latency_ms'):
-            output.append(f"  • Latency Target: {self.requirements['latency_ms']} ms")
-        if self.requirements.get('throughput_rps'):
-            output.append(f"  • Throughput Target: {self.requirements['throughput_rps']} rps")
-        if self.requirements.get('data_store'):
-            output.append(f"  • Data Store Preference: {self.requirements['data_store']}")
-        if self.requirements.get('compliance'):
-            output.append(f"  • Compliance: {', '.join(self.requirements['compliance'])}")
-        if self.requirements.get('hiring_priority'):
-            output.append(f"  • Hiring Priority: {self.requirements['hiring_priority']}")
-        if self.requirements.get('must_use'):
-            output.append(f"  • Must Use: {', '.join(self.requirements['must_use'])}")
-        if self.requirements.get('avoid'):
-            output.append(f"  • Avoid: {', '.join(self.requirements['avoid'])}")
-        if self.requirements.get('constraint_miss'):
+        if requirements.get('budget'):
+            output.append(f"  • Budget: {requirements['budget']}")
+        if requirements.get('deployment'):
+            output.append(f"  • Deployment Model: {requirements['deployment']}")
+        if requirements.get('performance'):
+            output.append(f"  • Performance Priority: {requirements['performance']}/10")
+        if requirements.get('scalability'):
+            output.append(f"  • Scalability Need: {requirements['scalability']}/10")
+        if requirements.get('development_speed'):
+            output.append(f"  • Development Speed: {requirements['development_speed']}/10")
+        if requirements.get('team_size'):
+            output.append(f"  • Team Size: {requirements['team_size']}")
+        if requirements.get('project_type'):
+            output.append(f"  • Project Type: {requirements['project_type']}")
+        if requirements.get('latency_ms'):
+            output.append(f"  • Latency Target: {requirements['latency_ms']} ms")
+        if requirements.get('throughput_rps'):
+            output.append(f"  • Throughput Target: {requirements['throughput_rps']} rps")
+        if requirements.get('data_store'):
+            output.append(f"  • Data Store Preference: {requirements['data_store']}")
+        if requirements.get('compliance'):
+            output.append(f"  • Compliance: {', '.join(requirements['compliance'])}")
+        if requirements.get('hiring_priority'):
+            output.append(f"  • Hiring Priority: {requirements['hiring_priority']}")
+        if requirements.get('must_use'):
+            output.append(f"  • Must Use: {', '.join(requirements['must_use'])}")
+        if requirements.get('avoid'):
+            output.append(f"  • Avoid: {', '.join(requirements['avoid'])}")
+        if requirements.get('constraint_miss'):
             output.append("  • Note: None of the must-use languages matched; broadened recommendations.")
 
         missing = []
@@ -684,7 +1130,7 @@ class StackRecommender:
             ('budget', 'Budget'),
             ('compliance', 'Compliance'),
         ]:
-            if not self.requirements.get(key):
+            if not requirements.get(key):
                 missing.append(label)
         if missing:
             output.append("\nMissing Inputs (may reduce confidence):")
@@ -850,7 +1296,13 @@ def interactive_mode():
     top_n_input = input("    Your answer: ").strip()
     top_n = int(top_n_input) if top_n_input.isdigit() else None
 
-    recommender = StackRecommender()
+    import stack_catalog
+    try:
+        catalog = stack_catalog.load_catalog()
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring the stack catalog: {e}")
+        catalog = None
+    recommender = StackRecommender(calibration=load_calibration(), catalog=catalog)
     recommendations = recommender.analyze_requirements(requirements, top_n=top_n)
     print(recommender.format_recommendation(recommendations))
     
@@ -863,7 +1315,7 @@ def interactive_mode():
             'recommendations': [
                 {
                     'rank': idx,
-                    'language': STACK_OPTIONS[lang]['name'],
+                    'language': recommender.stack_info(lang)['name'],
                     'framework': framework,
                     'score': score
                 }
@@ -882,6 +1334,14 @@ def cli_mode(args):
     # Parse arguments
     i = 0
     top_n = None
+    calibration = None
+    analyses = []
+    loads = None
+    samples = None
+    similar_to = None
+    better = []
+    use_table = True
+    catalog_dir = None
     while i < len(args):
         arg = args[i]
         if arg in ['--performance', '-p'] and i + 1 < len(args):
@@ -950,6 +1410,41 @@ def cli_mode(args):
         elif arg in ['--team-expertise', '-e'] and i + 1 < len(args):
             requirements['team_expertise'] = args[i + 1].split(',')
             i += 2
+        elif arg == '--capacity':
+            analyses.append('capacity')
+            i += 1
+        elif arg == '--pareto':
+            analyses.append('pareto')
+            i += 1
+        elif arg == '--sensitivity' and i + 1 < len(args):
+            try:
+                samples = int(args[i + 1])
+            except ValueError:
+                samples = None
+            if samples and samples > 0:
+                analyses.append('sensitivity')
+            i += 2
+        elif arg == '--loads' and i + 1 < len(args):
+            try:
+                loads = [float(v) for v in args[i + 1].split(',') if v.strip()]
+            except ValueError:
+                loads = None
+            i += 2
+        elif arg == '--no-calibration':
+            calibration = {}
+            i += 1
+        elif arg == '--no-table':
+            use_table = False
+            i += 1
+        elif arg == '--catalog' and i + 1 < len(args):
+            catalog_dir = args[i + 1]
+            i += 2
+        elif arg == '--similar' and i + 1 < len(args):
+            similar_to = args[i + 1]
+            i += 2
+        elif arg == '--better' and i + 1 < len(args):
+            better = [c.strip().lower().replace('-', '_') for c in args[i + 1].split(',') if c.strip()]
+            i += 2
         elif arg == '--top' and i + 1 < len(args):
             try:
                 top_n = int(args[i + 1])
@@ -959,14 +1454,168 @@ def cli_mode(args):
         else:
             i += 1
     
+    if calibration is None:
+        calibration = load_calibration()
+
+    if similar_to is not None:
+        try:
+            import stack_analysis
+        except ImportError:
+            print("Error: analysis modes need NumPy (pip install numpy).")
+            return
+        show_similar_stacks(stack_analysis, StackRecommender(calibration=calibration), similar_to, better, top_n or 5)
+        return
+
     if not requirements:
         print("Error: No requirements provided. Use --help for usage information.")
         return
     
-    recommender = StackRecommender()
+    table = None
+    if use_table:
+        import stack_lookup
+        table = stack_lookup.load_table()
+    import stack_catalog
+    try:
+        catalog = stack_catalog.load_catalog(catalog_dir or stack_catalog.CATALOG_DIR)
+    except (OSError, ValueError) as e:
+        print(f"Error: could not load the stack catalog: {e}")
+        return
+    recommender = StackRecommender(calibration=calibration, table=table, catalog=catalog)
     recommendations = recommender.analyze_requirements(requirements, top_n=top_n)
     print(recommender.format_recommendation(recommendations))
 
+    if analyses:
+        try:
+            import stack_analysis
+        except ImportError:
+            print("Error: analysis modes need NumPy (pip install numpy).")
+            return
+        if 'capacity' in analyses:
+            show_capacity_plan(stack_analysis, recommender, recommendations, requirements, loads)
+        if 'pareto' in analyses:
+            show_pareto(stack_analysis, recommender, requirements)
+        if 'sensitivity' in analyses:
+            show_sensitivity(stack_analysis, recommender, samples)
+
+
+def show_capacity_plan(stack_analysis, recommender: StackRecommender,
+                       recommendations: List[Tuple[str, float, str]],
+                       requirements: Dict, loads: Optional[List[float]] = None):
+    """Print the resources each recommended stack needs across load levels"""
+    languages = [lang_key for lang_key, _, _ in recommendations]
+    names = {lang_key: f"{recommender.stack_info(lang_key)['name'].split(' ')[0]} + {framework}"
+             for lang_key, _, framework in recommendations}
+    profiles = stack_analysis.capacity_profiles(
+        languages, bases={lang_key: recommender.base_language(lang_key) for lang_key in languages})
+    plan = stack_analysis.plan_capacity(
+        profiles, loads or stack_analysis.default_loads(requirements.get('throughput_rps')),
+        target_latency_ms=requirements.get('latency_ms'))
+    target = f"p95 <= {requirements['latency_ms']} ms" if requirements.get('latency_ms') else \
+        f"{stack_analysis.MAX_UTILIZATION:.0%} max utilization"
+    print(f"CAPACITY PLAN ({target}, {stack_analysis.CORES_PER_INSTANCE} cores per instance)")
+    print(stack_analysis.format_capacity_plan(profiles, plan, names))
+
+
+def show_pareto(stack_analysis, recommender: StackRecommender, requirements: Dict):
+    """Print the stacks that are best on some trade-off between the criteria"""
+    names = {lang_key: f"{recommender.stack_info(lang_key)['name'].split(' ')[0]} + "
+                       f"{recommender._recommend_framework(lang_key, requirements)}"
+             for lang_key in recommender.breakdowns}
+    result = stack_analysis.pareto_fronts(recommender.breakdowns)
+    print("\nPARETO FRONTS (front 1: no other stack is at least as good on every criterion)")
+    print(stack_analysis.format_pareto(result, names))
+
+
+def parse_stack(text: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    (language key, framework) for text like 'go+gin', 'Go + Gin' or
+    'python'. The framework is None if not given; None if the language or
+    framework is unknown.
+    """
+    parts = [p.strip().lower() for p in text.replace('/', '+').split('+')]
+    for lang_key, lang_data in STACK_OPTIONS.items():
+        names = {lang_key, lang_data['name'].lower(), lang_data['name'].split(' ')[0].lower()}
+        if parts[0] not in names:
+            continue
+        if len(parts) < 2 or not parts[1]:
+            return lang_key, None
+        for framework in lang_data['frameworks']:
+            if framework.lower() == parts[1]:
+                return lang_key, framework
+        return None
+    return None
+
+
+def show_similar_stacks(stack_analysis, recommender: StackRecommender, anchor_text: str,
+                        better: List[str], k: int):
+    """Print the stacks most similar to a language/framework pair"""
+    anchor = parse_stack(anchor_text)
+    if anchor is None:
+        print(f"Error: unknown stack '{anchor_text}'. Use LANGUAGE or LANGUAGE+FRAMEWORK, e.g. go+gin.")
+        return
+    unknown = [c for c in better if c not in stack_analysis.SIMILARITY_TRAITS]
+    if unknown:
+        print(f"Error: unknown criteria: {', '.join(unknown)}. "
+              f"Choose from: {', '.join(stack_analysis.SIMILARITY_TRAITS)}")
+        return
+    lang_key, framework = anchor
+    if framework is None:
+        framework = recommender._recommend_framework(lang_key, {})
+    index = stack_analysis.build_similarity_index(recommender)
+    matches = stack_analysis.similar_stacks(index, (lang_key, framework), better=better, k=k)
+
+    title = f"STACKS SIMILAR TO {STACK_OPTIONS[lang_key]['name'].split(' ')[0]} + {framework}"
+    if better:
+        title += f", BETTER ON {', '.join(better)}"
+    print(title)
+    if not matches:
+        print("  No stack is better on all of these criteria.")
+    for rank, (match_lang, match_framework, similarity) in enumerate(matches, 1):
+        name = f"{STACK_OPTIONS[match_lang]['name'].split(' ')[0]} + {match_framework}"
+        print(f"{rank:>3}. {name:<32} similarity {similarity:.2f}")
+
+
+def show_sensitivity(stack_analysis, recommender: StackRecommender, samples: int):
+    """Print how robust the ranking is to the scoring weights"""
+    names = {lang_key: recommender.stack_info(lang_key)['name'] for lang_key in recommender.breakdowns}
+    result = stack_analysis.weight_sensitivity(recommender.breakdowns, samples)
+    print(f"\nWEIGHT SENSITIVITY ({samples:,} samples, every weight scaled by "
+          f"{1 - result['spread']:g}-{1 + result['spread']:g}x)")
+    print(stack_analysis.format_sensitivity(result, names))
+
+
+def calibrate(dataset_path: Optional[str] = None):
+    """
+    Derive calibration factors from benchmark results and save them to
+    CALIBRATION_FILE. Uses the normalized dataset if present, otherwise the
+    result files in the language directories.
+    """
+    import benchmark_results
+
+    path = dataset_path or benchmark_results.DEFAULT_DATASET
+    if os.path.exists(path):
+        dataset = benchmark_results.load_dataset(path)
+        print(f"Calibrating from {path}")
+    elif dataset_path:
+        print(f"Error: dataset not found: {dataset_path}")
+        return
+    else:
+        dataset = benchmark_results.aggregate(benchmark_results.scan())
+        print("Calibrating from the result files in the language directories")
+
+    factors = calibrate_from_dataset(dataset)
+    if not factors:
+        print("Error: no usable benchmark results found; calibration unchanged.")
+        return
+    save_calibration(factors)
+
+    print(f"\n{'Language':<12} {'Perf':>6} {'Latency':>8} {'RPS':>6}")
+    for lang_key in STACK_OPTIONS:
+        f = factors.get(lang_key, {})
+        cells = [f"{f[k]:.2f}" if k in f else '-' for k in ('performance', 'latency', 'throughput')]
+        print(f"{lang_key:<12} {cells[0]:>6} {cells[1]:>8} {cells[2]:>6}")
+    print(f"\n✓ Calibration saved to {CALIBRATION_FILE}")
+
 
 def show_help():
     """Show help information"""
@@ -999,6 +1648,25 @@ OPTIONS:
     --microservices              Microservices architecture
     -e, --team-expertise LANGS   Team expertise (comma-separated languages)
     --top NUM                    Limit number of recommendations (default: all)
+    --capacity                   Estimate cores, instances, memory and monthly cost per
+                                 stack for the throughput/latency targets (needs NumPy)
+    --loads LIST                 Load levels in req/s for --capacity (comma-separated)
+    --pareto                     Show the Pareto-optimal stacks, treating each score
+                                 criterion as a separate objective (needs NumPy)
+    --similar STACK              List the stacks most similar to STACK (e.g. go+gin);
+                                 no requirements needed (needs NumPy)
+    --better LIST                With --similar, only stacks better on these criteria
+                                 (comma-separated, e.g. ml_ai,development_speed)
+    --sensitivity N              Re-score with N random perturbations of the scoring
+                                 weights and report ranking stability (needs NumPy)
+    --no-calibration             Ignore calibration.json and use the built-in weights
+    --no-table                   Score live even if recommendation_table.bin exists
+    --compile-table              Precompute recommendation_table.bin for fast lookups
+                                 (recompile after changing weights or calibration)
+    --catalog DIR                Load stack variant plugins from DIR (default: catalog/)
+    --compile-catalog [DIR]      Compile and list the stack catalog plugins
+    --calibrate [DATASET]        Derive performance/latency/throughput weights from
+                                 benchmark results and save them to calibration.json
     -h, --help                   Show this help message
 
 EXAMPLES:
@@ -1017,6 +1685,9 @@ EXAMPLES:
     # Real-time ML service
     python stack_recommender.py -p 8 --real-time --ml-ai --project-type "ML API"
 
+    # Stacks like Go + Gin, but with better ML support
+    python stack_recommender.py --similar go+gin --better ml_ai
+
 SUPPORTED LANGUAGES:
     Python, JavaScript (Node.js), Go, Rust, Java, C#, Ruby, Elixir, Scala, C++
 
@@ -1030,6 +1701,14 @@ def main():
     if len(sys.argv) > 1:
         if sys.argv[1] in ['-h', '--help']:
             show_help()
+        elif sys.argv[1] == '--calibrate':
+            calibrate(sys.argv[2] if len(sys.argv) > 2 else None)
+        elif sys.argv[1] == '--compile-table':
+            import stack_lookup
+            stack_lookup.main(sys.argv[2:])
+        elif sys.argv[1] == '--compile-catalog':
+            import stack_catalog
+            sys.exit(stack_catalog.main(sys.argv[2:]))
         else:
             cli_mode(sys.argv[1:])
     else:
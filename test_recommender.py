@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from stack_recommender import StackRecommender, STACK_OPTIONS
+from stack_recommender import StackRecommender, STACK_OPTIONS, calibrate_from_dataset
 
 
 def get_language_score(recommendations, language):
@@ -173,6 +173,48 @@ def test_framework_recommendations():
     print("✓ Framework recommendation test passed")
 
 
+def test_project_type_matching():
+    """Test that project types match whole words, plurals and synonyms only"""
+    from stack_recommender import project_type_matches
+
+    assert 'python' in project_type_matches('API')
+    # 'api' inside 'rapid' is not a match
+    assert 'python' not in project_type_matches('rapid')
+    assert project_type_matches('chat') == project_type_matches('real-time')
+    assert project_type_matches('web application') == {'ruby'}
+    assert 'elixir' in project_type_matches('game server, IoT')
+    assert project_type_matches('api,') == project_type_matches('api')
+
+    recommender = StackRecommender()
+    recommender.analyze_requirements({'project_type': 'rapid prototype'})
+    assert recommender.breakdowns['go']['project_type'] == 0
+    assert recommender._recommend_framework('python', {'project_type': 'rapid prototype'}) == 'Flask'
+
+    print("✓ Project type matching test passed")
+
+
+def test_framework_ranking():
+    """Test that every framework of a language is ranked, preferred pick first"""
+    recommender = StackRecommender()
+    ranked = recommender.rank_frameworks('go', {'project_type': 'api', 'performance': 8})
+    assert [name for name, _ in ranked][0] == 'Gin'
+    assert sorted(name for name, _ in ranked) == sorted(STACK_OPTIONS['go']['frameworks'])
+    # Frameworks no rule prefers are ordered by their overlap with the request
+    scores = dict(ranked)
+    assert scores['Fiber'] > scores['Buffalo']
+    # Features come from whole words: 'Rapid dev' is not an API, nor
+    # 'Embedded services' IoT
+    scores = dict(recommender.rank_frameworks('go', {'project_type': 'api'}))
+    assert scores['Gin'] > scores['Buffalo']
+    iot = dict(recommender.rank_frameworks('cpp', {'project_type': 'iot'}))
+    assert iot['Crow'] == dict(recommender.rank_frameworks('cpp', {}))['Crow']
+
+    ranked = recommender.rank_frameworks('java', {'deployment': 'serverless', 'real_time': True})
+    assert ranked[0][0] == 'Quarkus' and ranked[1][0] == 'Vert.x'
+
+    print("✓ Framework ranking test passed")
+
+
 def test_balanced_requirements():
     """Test with balanced, moderate requirements"""
     recommender = StackRecommender()
@@ -370,6 +412,39 @@ def test_unknown_must_use_fallback():
     print("✓ Unknown must-use fallback test passed")
 
 
+def test_stateless_scoring():
+    """Test that score() leaves its inputs alone and is safe to share across threads"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    recommender = StackRecommender()
+    requirements = {'performance': 5, 'must_use': ['kotlin']}
+    result = recommender.score(requirements)
+    assert requirements == {'performance': 5, 'must_use': ['kotlin']}
+    assert result.constraint_miss and result.requirements['constraint_miss']
+    try:
+        result.breakdowns['go']['performance'] = 0
+        assert False, "Expected read-only breakdowns"
+    except TypeError:
+        pass
+
+    # Mutating the input afterwards doesn't reach the result
+    requirements = {'must_use': ['go', 'rust'], 'compliance': ['hipaa']}
+    result = recommender.score(requirements)
+    requirements['must_use'].append('python')
+    requirements['compliance'].clear()
+    assert result.requirements['must_use'] == ('go', 'rust')
+    assert result.requirements['compliance'] == ('hipaa',)
+
+    cases = [{'performance': p, 'development_speed': 11 - p, 'project_type': t}
+             for p in range(1, 11) for t in ['api', 'chat', 'ml service']]
+    expected = [recommender.score(case).recommendations for case in cases]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(5):
+            assert list(pool.map(lambda case: recommender.score(case).recommendations, cases)) == expected
+
+    print("✓ Stateless scoring test passed")
+
+
 def test_scraping_parallel_bias():
     """Test that scraping/parallel wording favors Go/Elixir"""
     recommender = StackRecommender()
@@ -408,6 +483,292 @@ def test_io_bound_bias():
     print("✓ IO-bound bias test passed")
 
 
+def test_calibrated_weights():
+    """Test that calibration follows measured results and falls back per language"""
+    dataset = {
+        'language': ['rust', 'python', 'go', 'rust', 'python', 'go', 'go', 'python'],
+        'suite': ['cpu', 'cpu', 'cpu', 'cpu', 'cpu', 'cpu', 'api', 'api'],
+        'benchmark': ['Sorting', 'Sorting', 'Sorting', 'Matrix', 'Matrix', 'Matrix', 'API', 'API'],
+        'metric': ['execution_time'] * 6 + ['p95', 'p95'],
+        'value': [10.0, 400.0, 20.0, 2.0, 90.0, 3.0, 50.0, 200.0],
+        'unit': ['ms'] * 8,
+    }
+    factors = calibrate_from_dataset(dataset)
+    assert factors['rust']['performance'] == 1.5
+    assert factors['python']['performance'] == 0.5
+    assert 0.5 < factors['go']['performance'] < 1.5
+    assert factors['go']['latency'] == 1.0 and factors['python']['latency'] == 0.0
+
+    recommender = StackRecommender(calibration=factors)
+    recommender.analyze_requirements({'performance': 10, 'latency_ms': 80})
+    assert recommender.breakdowns['go']['latency'] == 6
+    assert recommender.breakdowns['go']['performance'] == 10 * factors['go']['performance']
+    assert recommender.breakdowns['python']['latency'] == 0
+    # Java has no measurements, so the built-in weights apply
+    assert recommender.breakdowns['java']['performance'] == 12
+    assert recommender.breakdowns['java']['latency'] == 4
+
+    print("✓ Calibrated weights test passed")
+
+
+def test_capacity_plan():
+    """Test that the capacity planner sizes stacks from their measured capacity"""
+    try:
+        import stack_analysis
+    except ImportError:
+        print("- Capacity plan test skipped (NumPy not installed)")
+        return
+    measured = {'go': {'rps': 1000, 'p95_ms': 20}, 'python': {'rps': 250, 'p95_ms': 50}}
+    profiles = stack_analysis.capacity_profiles(['go', 'python', 'rust'], measured=measured)
+    # Rust is unmeasured: its built-in profile is scaled like the measured ones
+    assert not profiles['measured'][2]
+    assert profiles['per_core_rps'][2] > profiles['per_core_rps'][0]
+
+    plan = stack_analysis.plan_capacity(profiles, [700, 7000], target_latency_ms=40)
+    assert plan['cores'].shape == (3, 2)
+    # Go: utilization capped at 0.5 by the p95 target -> 500 usable req/s per core
+    assert list(plan['cores'][0]) == [2, 14]
+    # Python's unloaded p95 already misses the target
+    assert not plan['feasible'][1]
+    assert (plan['monthly_cost'][0, 1] > plan['monthly_cost'][0, 0])
+
+    print("✓ Capacity plan test passed")
+
+
+def test_weight_sensitivity():
+    """Test that weight perturbations only reorder languages with mixed strengths"""
+    try:
+        import stack_analysis
+    except ImportError:
+        print("- Weight sensitivity test skipped (NumPy not installed)")
+        return
+    breakdowns = {
+        'go': {'performance': 10.0, 'development_speed': 2.0},
+        'python': {'performance': 2.0, 'development_speed': 9.0},
+        'ruby': {'performance': 1.0, 'development_speed': 1.0},
+    }
+    result = stack_analysis.weight_sensitivity(breakdowns, 20000, seed=7)
+    assert list(result['baseline_rank']) == [0, 1, 2]
+    # Go and Python trade places depending on the weights; Ruby never wins
+    assert 0.5 < result['p_top'][0] < 1.0
+    assert abs(result['p_top'].sum() - 1.0) < 1e-9
+    assert result['p_top'][2] == 0 and result['p_same_rank'][2] == 1.0
+    assert result['p_same_order'] == result['p_top'][0]
+
+    print("✓ Weight sensitivity test passed")
+
+
+def test_pareto_fronts():
+    """Test that Pareto sorting keeps trade-offs apart and ranks dominated stacks"""
+    try:
+        import stack_analysis
+    except ImportError:
+        print("- Pareto fronts test skipped (NumPy not installed)")
+        return
+    objectives = [[10, 2], [2, 9], [5, 5], [4, 4], [1, 1], [5, 5]]
+    assert list(stack_analysis.pareto_ranks(objectives)) == [0, 0, 0, 1, 2, 0]
+    # A batch is sorted set by set
+    batch = stack_analysis.pareto_ranks([objectives, [[1, 1], [2, 2], [0, 3], [3, 0], [1, 1], [2, 2]]])
+    assert batch.shape == (2, 6) and list(batch[1]) == [1, 0, 0, 0, 1, 0]
+
+    recommender = StackRecommender()
+    recommender.analyze_requirements({'performance': 9, 'development_speed': 9, 'ml_ai': True})
+    result = stack_analysis.pareto_fronts(recommender.breakdowns)
+    optimal = {l for l, r in zip(result['languages'], result['ranks']) if r == 0}
+    assert 'python' in optimal and 'rust' in optimal
+    assert 'team_size' not in result['objectives']
+
+    print("✓ Pareto fronts test passed")
+
+
+def test_similar_stacks():
+    """Test that similarity search finds close stacks and honors the better-on filter"""
+    try:
+        import stack_analysis
+    except ImportError:
+        print("- Similar stacks test skipped (NumPy not installed)")
+        return
+    from stack_recommender import parse_stack
+
+    assert parse_stack('Go + Gin') == ('go', 'Gin')
+    assert parse_stack('python') == ('python', None)
+    assert parse_stack('go+django') is None
+
+    index = stack_analysis.build_similarity_index(StackRecommender(calibration={}))
+    assert len(index['stacks']) == sum(len(l['frameworks']) for l in STACK_OPTIONS.values())
+    nearest = stack_analysis.similar_stacks(index, ('go', 'Gin'), k=3)
+    assert len(nearest) == 3 and all(lang == 'go' for lang, _, _ in nearest)
+    assert nearest[0][2] >= nearest[1][2] >= nearest[2][2]
+
+    better_ml = stack_analysis.similar_stacks(index, ('go', 'Gin'), better=['ml_ai'])
+    assert better_ml[0][:2] == ('python', 'FastAPI')
+    assert {lang for lang, _, _ in better_ml} == {'python'}
+
+    print("✓ Similar stacks test passed")
+
+
+def test_lookup_table_matches_live_scoring():
+    """Test that the precomputed table gives the same results as live scoring"""
+    import tempfile
+    import stack_lookup
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'table.bin')
+        stack_lookup.compile_table(path, calibration={})
+        table = stack_lookup.RecommendationTable(path)
+        try:
+            fast = StackRecommender(calibration={}, table=table)
+            live = StackRecommender(calibration={})
+            assert fast.table is not None
+            cases = [
+                {},
+                {'performance': 9, 'scalability': 8, 'latency_ms': 80, 'throughput_rps': 20000},
+                {'project_type': 'web scraping, api', 'io_bound': True, 'team_expertise': ['Go']},
+                {'development_speed': 10, 'team_size': 'small', 'budget': 'Low', 'deployment': 'serverless',
+                 'data_store': 'sql', 'compliance': ['HIPAA'], 'hiring_priority': 'high', 'ml_ai': True},
+                # Outside the table's domain: scored live
+                {'performance': 7.5, 'enterprise': True},
+            ]
+            for requirements in cases:
+                assert fast.analyze_requirements(dict(requirements)) == live.analyze_requirements(dict(requirements))
+                assert fast.breakdowns == live.breakdowns
+            # A table compiled with other calibration factors is not used
+            assert StackRecommender(calibration={'go': {'performance': 1.5}}, table=table).table is None
+        finally:
+            table.close()
+
+    print("✓ Lookup table test passed")
+
+
+def test_catalog_plugins():
+    """Test that catalog variants are scored through their base language"""
+    import json
+    import tempfile
+    import stack_catalog
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = os.path.join(tmp, 'catalog')
+        os.mkdir(directory)
+        path = os.path.join(tmp, 'catalog.bin')
+        with open(os.path.join(directory, 'go.json'), 'w') as f:
+            json.dump({'stack': [{'key': 'go-tinygo', 'base': 'go', 'name': 'TinyGo', 'frameworks': ['Chi'],
+                                  'best_for': ['Edge functions', 'Embedded systems'],
+                                  'bonus': {'deployment': 2, 'performance': -1}}]}, f)
+        with open(os.path.join(directory, 'python.toml'), 'w') as f:
+            f.write('[[stack]]\nkey = "python-pypy"\nbase = "python"\nname = "PyPy"\n'
+                    'frameworks = ["Litestar", "FastAPI"]\nbest_for = ["Batch jobs"]\n')
+
+        catalog = stack_catalog.load_catalog(directory, path)
+        try:
+            assert catalog.keys == ['go-tinygo', 'python-pypy']
+            assert len(catalog) == 2 and 'go-tinygo' in catalog and 'go' not in catalog
+            assert catalog.bonus('go-tinygo') == {'deployment': 2.0, 'performance': -1.0}
+            assert catalog.matches('edge functions, batch jobs') == {'go-tinygo', 'python-pypy'}
+            recommender = StackRecommender(calibration={}, catalog=catalog)
+            result = recommender.score({'performance': 8, 'project_type': 'embedded systems'})
+            go, tinygo = result.breakdowns['go'], result.breakdowns['go-tinygo']
+            assert tinygo['project_type'] == 15
+            assert tinygo['deployment'] == go['deployment'] + 2
+            assert tinygo['performance'] == go['performance'] - 1
+            assert all(tinygo[c] == go[c] for c in go if c not in ('project_type', 'deployment', 'performance'))
+
+            # Frameworks the base language ranks come first
+            ranked = recommender.rank_frameworks('python-pypy', {})
+            assert [name for name, _ in ranked] == ['FastAPI', 'Litestar']
+
+            # Constraints on a language cover its variants
+            constrained = recommender.score({'must_use': ['python']})
+            assert set(constrained.scores) == {'python', 'python-pypy'}
+            assert 'go-tinygo' not in recommender.score({'avoid': ['go']}).scores
+        finally:
+            catalog.close()
+
+        # Changing a plugin recompiles the index; an unchanged catalog does not
+        assert stack_catalog.load_catalog(directory, path).keys == ['go-tinygo', 'python-pypy']
+        os.remove(os.path.join(directory, 'go.json'))
+        assert stack_catalog.load_catalog(directory, path).keys == ['python-pypy']
+
+    # A malformed bonus is a ValueError, not a crash
+    for bonus in [['performance'], {'performance': 'high'}, {'performance': True}]:
+        entry = {'key': 'go-x', 'base': 'go', 'name': 'X', 'frameworks': ['Chi'], 'best_for': [], 'bonus': bonus}
+        try:
+            stack_catalog.validate_entry(entry, 'x.json', ['performance'])
+            assert False, f"Expected ValueError for bonus {bonus!r}"
+        except ValueError:
+            pass
+
+    print("✓ Catalog plugins test passed")
+
+
+def test_chunked_pattern_count():
+    """Test that chunked regex counting matches a single pass, for a rare pattern"""
+    import re
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python'))
+    import strings
+
+    line = b"Lorem ipsum dolor sit amet consectetur adipiscing elit\n"
+    data = line * 2000 + b"a rare needle\n" + line * 3000 + b"another needle\n" + line * 500
+    pattern = rb'needle'
+    expected = len(re.findall(pattern, data))
+    assert expected == 2
+    chunks = strings.split_chunks(data, 4096)
+    assert len(chunks) > 16
+    assert sum(strings.count_pattern_matches(data, pattern, start, end, 64, 64) for start, end in chunks) == expected
+    # A match straddling a chunk boundary is counted once
+    start, end = chunks[3]
+    straddling = data[:end - 3] + b"needle" + data[end + 3:]
+    assert sum(strings.count_pattern_matches(straddling, pattern, a, b, 64, 64)
+               for a, b in strings.split_chunks(straddling, 4096)) == len(re.findall(pattern, straddling))
+
+    print("✓ Chunked pattern count test passed")
+
+
+def _parsed_times(language, text):
+    """{benchmark: ms} parsed from a CPU suite's printed output"""
+    import benchmark_results
+    return {r['benchmark']: r['value'] for r in benchmark_results.parse_stdout(language, text)}
+
+
+def test_parse_test_blocks():
+    """Test parsing "Test:" / "Execution time:" blocks (Go, Rust, Java, C++, Ruby, Elixir sorting)"""
+    text = ("Test: Sorting (Quicksort)\nArray size: 100000\nExecution time: 88.50 ms\n"
+            "Correctly sorted: true\n\nTest: Fibonacci Recursive (n=35)\nResult: 9227465\n"
+            "Execution time: 40.00 ms\n")
+    assert _parsed_times('go', text) == {'Sorting (Quicksort)': 88.5, 'Fibonacci Recursive (n=35)': 40.0}
+    print("✓ Test block parsing test passed")
+
+
+def test_parse_indented_lines():
+    """Test parsing "  Name: N ms" lines (JavaScript and Python runners)"""
+    text = ("Running CPU benchmarks\n  Sorting (Quicksort): 10.00 ms\n"
+            "  Fibonacci Recursive (n=35): 100.25 ms\nTotal: 3 suites\n")
+    assert _parsed_times('javascript', text) == {'Sorting (Quicksort)': 10.0, 'Fibonacci Recursive (n=35)': 100.25}
+    print("✓ Indented line parsing test passed")
+
+
+def test_parse_section_output():
+    """Test parsing "=== Name ===" sections (C#, Scala, Elixir)"""
+    import benchmark_results
+    text = ("\n=== 1. Sorting (Quicksort) ===\n\n=== Sorting (Quicksort) ===\nExecution time: 12.34 ms\n"
+            "\n=== 2. Fibonacci ===\n\n=== Fibonacci Benchmark ===\n"
+            "Recursive (n=35): 45.10 ms, result = 9227465\nIterative (n=40): 0.01 ms, result = 102334155\n"
+            "\n=== Matrix Multiplication Benchmark ===\nExecution time: 5.00 ms\n"
+            "\n=== String Manipulation Benchmarks ===\nString Reversal (1M chars): 3.21 ms\n"
+            "String Concatenation (10K iterations): 1.00 ms\nPattern Search: 2.50 ms (1000 matches)\n")
+    # Names line up with the other languages' so calibration can compare them
+    assert _parsed_times('csharp', text) == {
+        'Sorting (Quicksort)': 12.34,
+        'Fibonacci Recursive (n=35)': 45.1,
+        'Fibonacci Iterative (n=40)': 0.01,
+        'Matrix Multiplication': 5.0,
+        'String Reversal (1M chars)': 3.21,
+        'String Concatenation (10K iterations)': 1.0,
+        'Pattern Search': 2.5,
+    }
+    assert benchmark_results.parse_stdout('scala', "Compiling...\nDone in 3 s\n") == []
+    print("✓ Section output parsing test passed")
+
+
 def run_all_tests():
     """Run all test functions"""
     print("\n" + "="*60)
@@ -422,6 +783,8 @@ def run_all_tests():
         test_real_time_requirements,
         test_team_expertise_bonus,
         test_framework_recommendations,
+        test_framework_ranking,
+        test_project_type_matching,
         test_balanced_requirements,
         test_all_languages_present,
         test_score_ranges,
@@ -431,8 +794,20 @@ def run_all_tests():
         test_deployment_serverless_bias,
         test_compliance_bonus,
         test_unknown_must_use_fallback,
+        test_stateless_scoring,
         test_scraping_parallel_bias,
-        test_io_bound_bias
+        test_io_bound_bias,
+        test_calibrated_weights,
+        test_capacity_plan,
+        test_weight_sensitivity,
+        test_pareto_fronts,
+        test_similar_stacks,
+        test_lookup_table_matches_live_scoring,
+        test_catalog_plugins,
+        test_chunked_pattern_count,
+        test_parse_test_blocks,
+        test_parse_indented_lines,
+        test_parse_section_output
     ]
     
     passed = 0
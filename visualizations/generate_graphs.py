@@ -5,22 +5,22 @@ API Performance Visualization Generator
 This script reads API performance test results from all language implementations
 and generates comprehensive comparison visualizations including:
 - Throughput comparison (bar chart)
-- Response time distribution (box plot)
+- Response time distribution (violin plot)
 - Cumulative requests timeline (line graph)
 - Response time heatmap
 - Success rate comparison (bar chart)
 - Interactive dashboard (HTML)
 """
 
+import argparse
+import base64
+import hashlib
 import json
 import os
 import sys
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
 
 # Language directories to search for results
@@ -40,19 +40,229 @@ COLORS = {
     'scala': '#c22d40'
 }
 
-def load_results():
-    """Load API results from all language directories."""
+# Bump to invalidate every cached figure after a rendering change
+CACHE_VERSION = 1
+CACHE_FILE = '.render_cache.json'
+
+# Point budget per line for timeline plots; longer series are downsampled
+MAX_TIMELINE_POINTS = 2000
+
+# Number of evenly spaced quantiles used to summarize a latency distribution
+# (violin and ECDF plots), independent of how many samples were recorded
+QUANTILE_POINTS = 1000
+
+# Percentiles marked on distribution plots
+MARKED_PERCENTILES = [50, 99, 99.9]
+
+# Raw samples are used as the latency distribution only if they cover at
+# least this fraction of the successful requests; a truncated timeseries
+# would understate the tail
+MIN_SAMPLE_COVERAGE = 0.9
+
+# Summary fields (response_times in api_results.json) -> the quantile they
+# pin, used when neither full samples nor a histogram are available
+SUMMARY_QUANTILES = [('min_ms', 0.0), ('median_ms', 0.5), ('p95_ms', 0.95), ('p99_ms', 0.99), ('max_ms', 1.0)]
+
+# Bucket width for windowed throughput/latency charts: 'auto' picks 100 ms
+# for runs up to AUTO_WINDOW_CUTOFF_S seconds and 1 s for longer ones
+WINDOW_SIZES = {'100ms': 0.1, '1s': 1.0}
+AUTO_WINDOW_CUTOFF_S = 60.0
+
+# Point budgets of the pre-aggregated dashboard timeline levels, coarsest
+# first, and the number of points the browser draws per line after a zoom
+DASHBOARD_LEVELS = [1000, 10000, 100000]
+DASHBOARD_DISPLAY_POINTS = 2000
+
+# Client-side level selection for the dashboard timeline. Levels are embedded
+# as base64 little-endian typed arrays (Float64 times, Uint32 counts); on zoom
+# the finest level that fits the display budget is sliced to the visible range.
+DASHBOARD_ZOOM_SCRIPT = """
+(function() {
+    var gd = document.getElementById('{plot_id}');
+    var payload = %(payload)s;
+    function decode(b64, Type) {
+        var bin = atob(b64), bytes = new Uint8Array(bin.length);
+        for (var i = 0; i < bin.length; i++) { bytes[i] = bin.charCodeAt(i); }
+        return new Type(bytes.buffer);
+    }
+    function lowerBound(arr, value) {
+        var lo = 0, hi = arr.length;
+        while (lo < hi) { var mid = (lo + hi) >> 1; if (arr[mid] < value) { lo = mid + 1; } else { hi = mid; } }
+        return lo;
+    }
+    var series = payload.series.map(function(s) {
+        return {trace: s.trace, levels: s.levels.map(function(l) {
+            return {x: decode(l.x, Float64Array), y: decode(l.y, Uint32Array)};
+        })};
+    });
+    function update(range) {
+        var xs = [], ys = [], traces = [];
+        series.forEach(function(s) {
+            var chosen = null, lo = 0, hi = 0;
+            for (var i = s.levels.length - 1; i >= 0 && chosen === null; i--) {
+                var level = s.levels[i];
+                lo = range ? Math.max(lowerBound(level.x, range[0]) - 1, 0) : 0;
+                hi = range ? Math.min(lowerBound(level.x, range[1]) + 1, level.x.length) : level.x.length;
+                if (hi - lo <= payload.budget || i === 0) { chosen = level; }
+            }
+            xs.push(chosen.x.subarray(lo, hi));
+            ys.push(chosen.y.subarray(lo, hi));
+            traces.push(s.trace);
+        });
+        Plotly.restyle(gd, {x: xs, y: ys}, traces);
+    }
+    var axis = payload.axis;
+    gd.on('plotly_relayout', function(event) {
+        if (event[axis + '.range[0]'] !== undefined) {
+            update([event[axis + '.range[0]'], event[axis + '.range[1]']]);
+        } else if (event[axis + '.range'] !== undefined) {
+            update(event[axis + '.range']);
+        } else if (event[axis + '.autorange']) {
+            update(null);
+        }
+    });
+})();
+"""
+
+# Sidecar files (summary JSON + timeseries arrays) derived from api_results.json
+SIDECAR_DIR = Path(__file__).parent / '.cache'
+
+# Output settings, set from --format/--dpi/--quick/--cdn-plotlyjs. The
+# dashboard embeds plotly.js by default so it also works offline
+IMAGE_FORMATS = ['png', 'svg']
+IMAGE_OPTIONS = {'format': 'png', 'dpi': 300, 'plotlyjs': 'inline'}
+QUICK_DPI = 72
+
+def _pyplot():
+    """
+    Import pyplot on first use with the headless Agg backend, so runs that
+    render nothing (or only the dashboard) never pay for matplotlib.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def _plotly():
+    """Import plotly on first use; only the dashboard needs it."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    return go, make_subplots
+
+def output_name(name):
+    """File name a chart is written to, using the configured image format."""
+    if name.endswith('.png'):
+        return name[:-len('.png')] + '.' + IMAGE_OPTIONS['format']
+    return name
+
+def save_figure(plt, output_dir, name):
+    """Save and close the current figure with the configured format and DPI."""
+    filename = output_name(name)
+    plt.savefig(output_dir / filename, dpi=IMAGE_OPTIONS['dpi'], bbox_inches='tight')
+    plt.close()
+    print(f"✓ Generated {filename}")
+
+class LanguageResults(Mapping):
+    """
+    One language's api_results.json. Summary fields are loaded eagerly from a
+    small sidecar; the per-request timeseries is only read, from a binary
+    .npz sidecar, the first time it is needed. Sidecars are rebuilt whenever
+    the source file's size or modification time changes.
+    """
+
+    def __init__(self, lang, source, cache_dir=SIDECAR_DIR):
+        self.lang = lang
+        self.source = Path(source)
+        self.cache_dir = Path(cache_dir)
+        stat = self.source.stat()
+        self.fingerprint = f'{stat.st_mtime_ns}-{stat.st_size}'
+        self._arrays = None
+        self.summary = self._load_summary()
+
+    @property
+    def _sidecar_stem(self):
+        # Keyed by source path too, so result sets from different runs never collide
+        source_id = hashlib.sha1(str(self.source.resolve()).encode()).hexdigest()[:10]
+        return f'{self.lang}-{source_id}'
+
+    @property
+    def _summary_path(self):
+        return self.cache_dir / f'{self._sidecar_stem}.summary.json'
+
+    @property
+    def _arrays_path(self):
+        return self.cache_dir / f'{self._sidecar_stem}.timeseries.npz'
+
+    def _load_summary(self):
+        try:
+            with open(self._summary_path, 'r') as f:
+                sidecar = json.load(f)
+            if sidecar.get('fingerprint') == self.fingerprint and self._arrays_path.exists():
+                return sidecar['summary']
+        except (OSError, ValueError):
+            pass
+        return self._build_sidecars()
+
+    def _build_sidecars(self):
+        """Parse the full JSON once and split it into the two sidecars."""
+        with open(self.source, 'r') as f:
+            data = json.load(f)
+        timeseries = data.pop('timeseries', None) or []
+        timestamps = np.fromiter((p['timestamp'] for p in timeseries), dtype=np.float64, count=len(timeseries))
+        response_times = np.fromiter((p['response_time_ms'] for p in timeseries), dtype=np.float64, count=len(timeseries))
+        self._arrays = (timestamps, response_times)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        np.savez(self._arrays_path, timestamps=timestamps, response_times=response_times)
+        with open(self._summary_path, 'w') as f:
+            json.dump({'fingerprint': self.fingerprint, 'summary': data}, f)
+        return data
+
+    def arrays(self):
+        """(timestamps, response_times) as float64 arrays, in file order."""
+        if self._arrays is None:
+            try:
+                with np.load(self._arrays_path) as npz:
+                    self._arrays = (npz['timestamps'], npz['response_times'])
+            except (OSError, KeyError, ValueError):
+                self.summary = self._build_sidecars()
+        return self._arrays
+
+    @property
+    def timeseries(self):
+        timestamps, response_times = self.arrays()
+        return [
+            {'timestamp': float(t), 'response_time_ms': float(r)}
+            for t, r in zip(timestamps, response_times)
+        ]
+
+    def __getitem__(self, key):
+        if key == 'timeseries':
+            return self.timeseries
+        return self.summary[key]
+
+    def __iter__(self):
+        yield from self.summary
+        yield 'timeseries'
+
+    def __len__(self):
+        return len(self.summary) + 1
+
+def load_results(langs=None, root=None):
+    """
+    Load API results from the language directories under root (the repository
+    by default), for all languages or only those in langs. Only summaries are
+    read here; timeseries load lazily.
+    """
     results = {}
-    repo_root = Path(__file__).parent.parent
+    repo_root = Path(root) if root is not None else Path(__file__).parent.parent
     
-    for lang in LANGUAGES:
+    for lang in (langs or LANGUAGES):
         results_file = repo_root / lang / 'api_results.json'
         if results_file.exists():
             try:
-                with open(results_file, 'r') as f:
-                    data = json.load(f)
-                    results[lang] = data
-                    print(f"✓ Loaded results for {lang}")
+                results[lang] = LanguageResults(lang, results_file)
+                print(f"✓ Loaded results for {lang}")
             except Exception as e:
                 print(f"✗ Error loading {lang} results: {e}")
         else:
@@ -64,8 +274,210 @@ def load_results():
     
     return results
 
-def create_throughput_comparison(results, output_dir):
+def downsample_minmax(x, y, max_points):
+    """
+    Keep the first, last, minimum and maximum point of each bucket.
+    Fully vectorized; preserves spikes and the envelope of the series.
+    Returns the indices of the points to keep.
+    """
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+    buckets = max(max_points // 4, 1)
+    size = n // buckets
+    body = buckets * size
+    offsets = np.arange(buckets) * size
+    grid = y[:body].reshape(buckets, size)
+    keep = np.concatenate([
+        offsets,
+        offsets + size - 1,
+        offsets + grid.argmin(axis=1),
+        offsets + grid.argmax(axis=1),
+        np.arange(body, n),
+    ])
+    return np.unique(keep)
+
+def downsample_lttb(x, y, max_points):
+    """
+    Largest-Triangle-Three-Buckets downsampling: from each bucket keep the point
+    forming the largest triangle with the previous kept point and the average
+    of the next bucket. Returns the indices of the points to keep.
+    """
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    keep = np.empty(max_points, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean() if next_end > next_start else x[-1]
+        avg_y = y[next_start:next_end].mean() if next_end > next_start else y[-1]
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        keep[i + 1] = previous
+    return keep
+
+DOWNSAMPLERS = {
+    'lttb': downsample_lttb,
+    'minmax': downsample_minmax,
+}
+
+def histogram_quantiles(bounds, counts, q):
+    """
+    Quantiles of a serialized latency histogram, interpolating linearly inside
+    each bucket. bounds has one more entry than counts; q is in [0, 1].
+    """
+    cumulative = np.concatenate([[0.0], np.cumsum(counts, dtype=np.float64)])
+    total = cumulative[-1]
+    if total <= 0:
+        return np.full(np.shape(q), np.nan)
+    rank = np.asarray(q, dtype=np.float64) * total
+    bucket = np.clip(np.searchsorted(cumulative, rank, side='left') - 1, 0, len(counts) - 1)
+    in_bucket = np.where(counts[bucket] > 0, (rank - cumulative[bucket]) / np.maximum(counts[bucket], 1), 0.0)
+    return bounds[bucket] + np.clip(in_bucket, 0.0, 1.0) * (bounds[bucket + 1] - bounds[bucket])
+
+def latency_quantiles(latency, q):
+    """
+    Quantiles (q in [0, 1]) of a prepared latency distribution, computed in one
+    vectorized call from raw samples, a histogram or the summary percentiles
+    (interpolated linearly between them).
+    """
+    if latency is None:
+        return None
+    kind, payload = latency
+    if kind in ('samples', 'sampled'):
+        return np.quantile(payload, q)
+    if kind == 'summary':
+        known_q, known_ms = payload
+        return np.interp(q, known_q, known_ms)
+    bounds, counts = payload
+    return histogram_quantiles(bounds, counts, q)
+
+def latency_percentiles(latency, percentiles):
+    """Percentiles (0-100) of a prepared latency distribution."""
+    return latency_quantiles(latency, np.asarray(percentiles, dtype=np.float64) / 100.0)
+
+def prepare_latency(data, response_times):
+    """
+    Pick the best available latency source for a language: raw per-request
+    samples if they cover (nearly) every successful request, otherwise a
+    serialized histogram ({"bounds_ms": [...], "counts": [...]}), otherwise
+    the summary percentiles. A partial timeseries is the last resort and is
+    marked 'sampled' so charts can label it. None if there is no data.
+    """
+    expected = data.get('successful_requests') or 0
+    if len(response_times) > 0 and len(response_times) >= MIN_SAMPLE_COVERAGE * expected:
+        return ('samples', response_times)
+    histogram = data.get('latency_histogram')
+    if histogram and histogram.get('counts'):
+        bounds = np.asarray(histogram['bounds_ms'], dtype=np.float64)
+        counts = np.asarray(histogram['counts'], dtype=np.float64)
+        if len(bounds) == len(counts) + 1:
+            return ('histogram', (bounds, counts))
+    summary = data.get('response_times') or {}
+    known = [(q, summary[key]) for key, q in SUMMARY_QUANTILES if summary.get(key) is not None]
+    if len(known) >= 2 and all(b[1] >= a[1] for a, b in zip(known, known[1:])):
+        return ('summary', (np.array([q for q, _ in known]), np.array([ms for _, ms in known], dtype=np.float64)))
+    if len(response_times) > 0:
+        return ('sampled', response_times)
+    return None
+
+def latency_label(lang, latency):
+    """Legend label for a language's latency distribution."""
+    if latency is not None and latency[0] == 'sampled':
+        return f'{lang.upper()} (sampled)'
+    return lang.upper()
+
+def timeseries_arrays(data, load=True):
+    """
+    (timestamps, response_times) arrays for one language's results, from the
+    lazy sidecar when available. With load=False, empty arrays are returned.
+    """
+    if not load:
+        return np.empty(0), np.empty(0)
+    if isinstance(data, LanguageResults):
+        return data.arrays()
+    timeseries = data.get('timeseries') or []
+    timestamps = np.fromiter((p['timestamp'] for p in timeseries), dtype=np.float64, count=len(timeseries))
+    response_times = np.fromiter((p['response_time_ms'] for p in timeseries), dtype=np.float64, count=len(timeseries))
+    return timestamps, response_times
+
+def windowed_metrics(timestamps, response_times, window):
+    """
+    Per-bucket throughput and latency over a run, fully vectorized.
+    Requests are bucketed by completion time into windows of `window` seconds.
+    Returns (bucket start times, requests/sec, p50 ms, p99 ms); latency is NaN
+    for empty buckets.
+    """
+    if len(timestamps) == 0:
+        empty = np.empty(0)
+        return empty, empty, empty, empty
+    bucket = np.floor(timestamps / window).astype(np.int64)
+    bucket -= bucket.min()
+    counts = np.bincount(bucket)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    # Sort by bucket, then by latency within each bucket
+    values = response_times[np.lexsort((response_times, bucket))]
+
+    def bucket_quantile(q):
+        position = q * np.maximum(counts - 1, 0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, np.maximum(counts - 1, 0))
+        fraction = position - lower
+        base = np.minimum(starts, len(values) - 1)
+        result = values[base + lower] + (values[base + upper] - values[base + lower]) * fraction
+        return np.where(counts > 0, result, np.nan)
+
+    offset = np.floor(timestamps.min() / window) * window
+    bucket_starts = offset + np.arange(len(counts)) * window
+    return bucket_starts, counts / window, bucket_quantile(0.5), bucket_quantile(0.99)
+
+def resolve_window(window, prepared):
+    """Bucket width in seconds for a --window choice ('auto', '100ms' or '1s')."""
+    if window != 'auto':
+        return WINDOW_SIZES[window]
+    duration = max((p['timestamps'][-1] - p['timestamps'][0] for p in prepared.values()
+                    if len(p['timestamps']) > 0), default=0.0)
+    return WINDOW_SIZES['100ms'] if duration <= AUTO_WINDOW_CUTOFF_S else WINDOW_SIZES['1s']
+
+def prepare_results(results, max_points=MAX_TIMELINE_POINTS, method='lttb', with_timeseries=True,
+                    window='auto'):
+    """
+    Sort each language's timeseries once and keep it as NumPy arrays, so the
+    figures that need it do not re-sort the same data. The cumulative timeline
+    is downsampled here to at most max_points points per language. With
+    with_timeseries=False no timeseries is loaded at all.
+    """
+    downsample = DOWNSAMPLERS[method]
+    prepared = {}
+    for lang, data in results.items():
+        timestamps, response_times = timeseries_arrays(data, load=with_timeseries)
+        order = np.argsort(timestamps, kind='stable')
+        timestamps = timestamps[order]
+        cumulative = np.arange(1, len(timestamps) + 1)
+        keep = downsample(timestamps, cumulative, max_points)
+        prepared[lang] = {
+            'timestamps': timestamps,
+            'response_times': response_times[order],
+            'timeline': (timestamps[keep], cumulative[keep]),
+            'latency': prepare_latency(data, response_times)
+        }
+    window_s = resolve_window(window, prepared)
+    for lang, entry in prepared.items():
+        entry['window_s'] = window_s
+        entry['windows'] = windowed_metrics(entry['timestamps'], entry['response_times'], window_s)
+    return prepared
+
+def create_throughput_comparison(results, output_dir, prepared=None):
     """Create bar chart comparing throughput (requests per second)."""
+    plt = _pyplot()
     languages = []
     throughputs = []
     colors_list = []
@@ -91,67 +503,129 @@ def create_throughput_comparison(results, output_dir):
                 ha='center', va='bottom', fontweight='bold', fontsize=11)
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'throughput_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated throughput_comparison.png")
+    save_figure(plt, output_dir, 'throughput_comparison.png')
 
-def create_response_time_distribution(results, output_dir):
-    """Create box plot comparing response time distributions."""
-    data_for_plot = []
+def create_response_time_distribution(results, output_dir, prepared=None):
+    """Create violin plot of the real response time distributions."""
+    plt = _pyplot()
+    if prepared is None:
+        prepared = prepare_results(results)
+    quantile_grid = np.linspace(0.0, 1.0, QUANTILE_POINTS)
+    
+    stats = []
     labels = []
     colors_list = []
-    
-    for lang, data in sorted(results.items()):
-        if data.get('response_times') and data['successful_requests'] > 0:
-            rt = data['response_times']
-            # Create box plot data points
-            # Note: Since we only have min/median/p95/p99/max from the JSON data,
-            # we approximate Q1 as the midpoint between min and median.
-            # This is a simplified representation for visualization purposes.
-            data_for_plot.append([
-                rt['min_ms'],
-                rt['median_ms'] - (rt['median_ms'] - rt['min_ms']) / 2,  # Q1 approximation
-                rt['median_ms'],
-                rt['p95_ms'],
-                rt['p99_ms'],
-                rt['max_ms']
-            ])
-            labels.append(lang.upper())
-            colors_list.append(COLORS.get(lang, '#888888'))
+    markers = []
+    for lang in sorted(results):
+        values = latency_quantiles(prepared[lang]['latency'], quantile_grid)
+        if values is None:
+            continue
+        # Density over the quantile grid: equal probability mass between
+        # consecutive quantiles, so the density is inversely proportional to gaps
+        low, high = values[0], values[-1]
+        if high <= low:
+            low, high = low - 0.5, high + 0.5
+        edges = np.linspace(low, high, 201)
+        density, _ = np.histogram(values, bins=edges, density=True)
+        coords = (edges[:-1] + edges[1:]) / 2
+        stats.append({
+            'coords': coords,
+            'vals': density,
+            'mean': float(values.mean()),
+            'median': float(np.median(values)),
+            'min': float(values[0]),
+            'max': float(values[-1]),
+        })
+        labels.append(latency_label(lang, prepared[lang]['latency']))
+        colors_list.append(COLORS.get(lang, '#888888'))
+        markers.append(latency_percentiles(prepared[lang]['latency'], MARKED_PERCENTILES))
     
     fig, ax = plt.subplots(figsize=(14, 8))
+    positions = np.arange(len(labels))
+    if stats:
+        parts = ax.violin(stats, positions=positions, widths=0.8, showmedians=True, showextrema=True)
+        for body, color in zip(parts['bodies'], colors_list):
+            body.set_facecolor(color)
+            body.set_edgecolor('black')
+            body.set_alpha(0.7)
+        marker_styles = ['_', 'x', '*']
+        for index, (percentile, style) in enumerate(zip(MARKED_PERCENTILES, marker_styles)):
+            ax.scatter(positions, [m[index] for m in markers], marker=style, s=80,
+                       color='black', zorder=3, label=f'p{percentile:g}')
+        ax.legend(loc='upper right', fontsize=11, framealpha=0.9)
     
-    # Create box plot
-    positions = range(len(labels))
-    bp = ax.boxplot(data_for_plot, positions=positions, labels=labels,
-                     patch_artist=True, widths=0.6,
-                     showfliers=True, notch=True)
-    
-    # Color the boxes
-    for patch, color in zip(bp['boxes'], colors_list):
-        patch.set_facecolor(color)
-        patch.set_alpha(0.7)
-    
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels)
     ax.set_xlabel('Language', fontsize=14, fontweight='bold')
     ax.set_ylabel('Response Time (ms)', fontsize=14, fontweight='bold')
     ax.set_title('API Performance: Response Time Distribution', fontsize=16, fontweight='bold', pad=20)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'response_time_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated response_time_distribution.png")
+    save_figure(plt, output_dir, 'response_time_distribution.png')
 
-def create_cumulative_requests_timeline(results, output_dir):
+def create_latency_ecdf(results, output_dir, prepared=None):
+    """Create ECDF plot of response times per language."""
+    plt = _pyplot()
+    if prepared is None:
+        prepared = prepare_results(results)
+    quantile_grid = np.linspace(0.0, 1.0, QUANTILE_POINTS)
+    
+    plt.figure(figsize=(14, 8))
+    for lang in sorted(results):
+        values = latency_quantiles(prepared[lang]['latency'], quantile_grid)
+        if values is None:
+            continue
+        plt.step(values, quantile_grid, where='post', label=latency_label(lang, prepared[lang]['latency']),
+                 color=COLORS.get(lang, '#888888'), linewidth=2, alpha=0.8)
+    
+    plt.xlabel('Response Time (ms)', fontsize=14, fontweight='bold')
+    plt.ylabel('Fraction of Requests', fontsize=14, fontweight='bold')
+    plt.title('API Performance: Response Time ECDF', fontsize=16, fontweight='bold', pad=20)
+    plt.legend(loc='lower right', fontsize=11, framealpha=0.9)
+    plt.grid(True, alpha=0.3, linestyle='--')
+    plt.tight_layout()
+    save_figure(plt, output_dir, 'latency_ecdf.png')
+
+def create_latency_percentile_curve(results, output_dir, prepared=None):
+    """Create HDR-style latency by percentile plot (log-scaled tail axis)."""
+    plt = _pyplot()
+    if prepared is None:
+        prepared = prepare_results(results)
+    # Percentiles from 0 to 99.99, evenly spaced in "number of nines"
+    nines = np.linspace(0.0, 4.0, 400)
+    percentiles = 100.0 * (1.0 - 10.0 ** -nines)
+    
+    fig, ax = plt.subplots(figsize=(14, 8))
+    for lang in sorted(results):
+        values = latency_percentiles(prepared[lang]['latency'], percentiles)
+        if values is None:
+            continue
+        ax.plot(10.0 ** nines, values, label=latency_label(lang, prepared[lang]['latency']),
+                color=COLORS.get(lang, '#888888'), linewidth=2, alpha=0.8)
+    
+    ax.set_xscale('log')
+    ticks = [1, 10, 100, 1000, 10000]
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(['0%', '90%', '99%', '99.9%', '99.99%'])
+    ax.set_xlabel('Percentile', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Response Time (ms)', fontsize=14, fontweight='bold')
+    ax.set_title('API Performance: Latency by Percentile', fontsize=16, fontweight='bold', pad=20)
+    ax.legend(loc='upper left', fontsize=11, framealpha=0.9)
+    ax.grid(True, which='both', alpha=0.3, linestyle='--')
+    plt.tight_layout()
+    save_figure(plt, output_dir, 'latency_percentiles.png')
+
+def create_cumulative_requests_timeline(results, output_dir, prepared=None):
     """Create line graph showing cumulative requests completed over time."""
+    plt = _pyplot()
+    if prepared is None:
+        prepared = prepare_results(results)
     plt.figure(figsize=(14, 8))
     
-    for lang, data in sorted(results.items()):
-        if data.get('timeseries') and len(data['timeseries']) > 0:
-            timeseries = sorted(data['timeseries'], key=lambda x: x['timestamp'])
-            timestamps = [point['timestamp'] for point in timeseries]
-            cumulative = list(range(1, len(timestamps) + 1))
-            
+    for lang in sorted(results):
+        timestamps, cumulative = prepared[lang]['timeline']
+        if len(timestamps) > 0:
             plt.plot(timestamps, cumulative, label=lang.upper(), 
                     color=COLORS.get(lang, '#888888'), linewidth=2, alpha=0.8)
     
@@ -161,12 +635,42 @@ def create_cumulative_requests_timeline(results, output_dir):
     plt.legend(loc='lower right', fontsize=11, framealpha=0.9)
     plt.grid(True, alpha=0.3, linestyle='--')
     plt.tight_layout()
-    plt.savefig(output_dir / 'cumulative_requests_timeline.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated cumulative_requests_timeline.png")
+    save_figure(plt, output_dir, 'cumulative_requests_timeline.png')
 
-def create_response_time_heatmap(results, output_dir):
+def create_windowed_timeseries(results, output_dir, prepared=None):
+    """Create throughput and p50/p99 latency per time window charts."""
+    plt = _pyplot()
+    if prepared is None:
+        prepared = prepare_results(results)
+    
+    fig, (ax_rps, ax_latency) = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
+    window_s = None
+    for lang in sorted(results):
+        bucket_starts, rps, p50, p99 = prepared[lang]['windows']
+        if len(bucket_starts) == 0:
+            continue
+        window_s = prepared[lang]['window_s']
+        color = COLORS.get(lang, '#888888')
+        ax_rps.step(bucket_starts, rps, where='post', label=lang.upper(), color=color, linewidth=1.5, alpha=0.8)
+        ax_latency.plot(bucket_starts, p99, color=color, linewidth=1.5, alpha=0.8, label=f'{lang.upper()} p99')
+        ax_latency.plot(bucket_starts, p50, color=color, linewidth=1, linestyle='--', alpha=0.6)
+    
+    window_label = f'{window_s * 1000:.0f} ms' if window_s and window_s < 1 else f'{window_s or 1:.0f} s'
+    ax_rps.set_ylabel('Requests per Second', fontsize=14, fontweight='bold')
+    ax_rps.set_title(f'API Performance: Throughput and Latency per {window_label} Window',
+                     fontsize=16, fontweight='bold', pad=20)
+    ax_rps.legend(loc='upper right', fontsize=10, framealpha=0.9)
+    ax_rps.grid(True, alpha=0.3, linestyle='--')
+    ax_latency.set_xlabel('Time (seconds)', fontsize=14, fontweight='bold')
+    ax_latency.set_ylabel('Response Time (ms, p99 solid / p50 dashed)', fontsize=12, fontweight='bold')
+    ax_latency.grid(True, alpha=0.3, linestyle='--')
+    
+    plt.tight_layout()
+    save_figure(plt, output_dir, 'windowed_timeseries.png')
+
+def create_response_time_heatmap(results, output_dir, prepared=None):
     """Create heatmap comparing response time metrics across languages."""
+    plt = _pyplot()
     languages = []
     metrics_data = {
         'Min': [],
@@ -212,12 +716,11 @@ def create_response_time_heatmap(results, output_dir):
     ax.set_title('API Performance: Response Time Heatmap (ms)', fontsize=16, fontweight='bold', pad=20)
     plt.colorbar(im, ax=ax, label='Response Time (ms)')
     plt.tight_layout()
-    plt.savefig(output_dir / 'response_time_heatmap.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated response_time_heatmap.png")
+    save_figure(plt, output_dir, 'response_time_heatmap.png')
 
-def create_success_rate_comparison(results, output_dir):
+def create_success_rate_comparison(results, output_dir, prepared=None):
     """Create bar chart comparing success rates."""
+    plt = _pyplot()
     languages = []
     success_rates = []
     colors_list = []
@@ -244,13 +747,33 @@ def create_success_rate_comparison(results, output_dir):
                 ha='center', va='bottom', fontweight='bold', fontsize=11)
     
     plt.tight_layout()
-    plt.savefig(output_dir / 'success_rate_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("✓ Generated success_rate_comparison.png")
+    save_figure(plt, output_dir, 'success_rate_comparison.png')
+
+def encode_typed_array(values, dtype):
+    """Base64 encoding of an array as a little-endian typed array."""
+    return base64.b64encode(np.ascontiguousarray(values, dtype=dtype).tobytes()).decode('ascii')
 
-def create_interactive_dashboard(results, output_dir):
+def timeline_levels(timestamps, budgets=DASHBOARD_LEVELS):
+    """
+    Multi-resolution cumulative timeline: one min/max-downsampled
+    (timestamps, counts) pair per budget, coarsest first, stopping at the
+    first level that already holds every point.
+    """
+    cumulative = np.arange(1, len(timestamps) + 1)
+    levels = []
+    for budget in budgets:
+        keep = downsample_minmax(timestamps, cumulative, budget)
+        levels.append((timestamps[keep], cumulative[keep]))
+        if len(keep) == len(timestamps):
+            break
+    return levels
+
+def create_interactive_dashboard(results, output_dir, prepared=None):
     """Create interactive HTML dashboard with plotly."""
-    
+    go, make_subplots = _plotly()
+    if prepared is None:
+        prepared = prepare_results(results)
+
     # Prepare data
     languages = sorted(results.keys())
     throughputs = [results[lang]['requests_per_second'] for lang in languages]
@@ -263,7 +786,7 @@ def create_interactive_dashboard(results, output_dir):
         subplot_titles=('Throughput Comparison', 'Success Rate', 
                        'Response Time Distribution', 'Request Completion Timeline'),
         specs=[[{'type': 'bar'}, {'type': 'bar'}],
-               [{'type': 'box'}, {'type': 'scatter'}]]
+               [{'type': 'violin'}, {'type': 'scatter'}]]
     )
     
     # Throughput comparison
@@ -286,32 +809,39 @@ def create_interactive_dashboard(results, output_dir):
         row=1, col=2
     )
     
-    # Response time distribution (box plot)
+    # Response time distribution (violin over the quantile grid)
+    quantile_grid = np.linspace(0.0, 1.0, QUANTILE_POINTS)
     for lang in languages:
-        data = results[lang]
-        if data.get('response_times') and data['successful_requests'] > 0:
-            rt = data['response_times']
+        values = latency_quantiles(prepared[lang]['latency'], quantile_grid)
+        if values is not None:
             fig.add_trace(
-                go.Box(y=[rt['min_ms'], rt['median_ms'], rt['p95_ms'], rt['p99_ms'], rt['max_ms']],
-                       name=lang.upper(),
-                       marker_color=COLORS.get(lang, '#888888')),
+                go.Violin(y=values, name=latency_label(lang, prepared[lang]['latency']),
+                          box_visible=True, meanline_visible=True, points=False,
+                          line_color=COLORS.get(lang, '#888888')),
                 row=2, col=1
             )
     
-    # Cumulative timeline
+    # Cumulative timeline: the figure carries the coarsest level, finer levels
+    # are embedded as typed arrays and swapped in client-side on zoom
+    timeline_series = []
     for lang in languages:
-        data = results[lang]
-        if data.get('timeseries') and len(data['timeseries']) > 0:
-            timeseries = sorted(data['timeseries'], key=lambda x: x['timestamp'])
-            timestamps = [point['timestamp'] for point in timeseries]
-            cumulative = list(range(1, len(timestamps) + 1))
-            
+        timestamps = prepared[lang]['timestamps']
+        if len(timestamps) > 0:
+            levels = timeline_levels(timestamps)
+            coarse_x, coarse_y = levels[0]
             fig.add_trace(
-                go.Scatter(x=timestamps, y=cumulative, name=lang.upper(),
+                go.Scatter(x=coarse_x, y=coarse_y, name=lang.upper(),
                           mode='lines',
                           line=dict(color=COLORS.get(lang, '#888888'), width=2)),
                 row=2, col=2
             )
+            timeline_series.append({
+                'trace': len(fig.data) - 1,
+                'levels': [
+                    {'x': encode_typed_array(x, '<f8'), 'y': encode_typed_array(y, '<u4')}
+                    for x, y in levels
+                ]
+            })
     
     # Update layout
     fig.update_layout(
@@ -331,35 +861,356 @@ def create_interactive_dashboard(results, output_dir):
     fig.update_xaxes(title_text="Time (seconds)", row=2, col=2)
     fig.update_yaxes(title_text="Cumulative Requests", row=2, col=2)
     
-    # Save to HTML
-    fig.write_html(output_dir / 'api_performance_dashboard.html')
+    # Save to HTML; plotly.js is inlined unless --cdn-plotlyjs was given
+    payload = {
+        'axis': fig.get_subplot(2, 2).xaxis.plotly_name,
+        'budget': DASHBOARD_DISPLAY_POINTS,
+        'series': timeline_series,
+    }
+    fig.write_html(output_dir / 'api_performance_dashboard.html',
+                   include_plotlyjs='cdn' if IMAGE_OPTIONS['plotlyjs'] == 'cdn' else True,
+                   post_script=DASHBOARD_ZOOM_SCRIPT % {'payload': json.dumps(payload)})
     print("✓ Generated api_performance_dashboard.html")
 
+# Bootstrap settings for cross-run comparisons
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE_LEVEL = 0.95
+# Upper bound on resample matrix elements held in memory at once
+BOOTSTRAP_CHUNK_ELEMENTS = 20_000_000
+
+def bootstrap_statistic(samples, statistic, resamples, rng):
+    """
+    Bootstrap distribution of statistic(matrix, axis=1) over `resamples`
+    resamples of samples, drawn as index matrices in memory-bounded chunks.
+    """
+    n = len(samples)
+    chunk = max(1, BOOTSTRAP_CHUNK_ELEMENTS // max(n, 1))
+    out = np.empty(resamples)
+    for start in range(0, resamples, chunk):
+        stop = min(start + chunk, resamples)
+        indices = rng.integers(0, n, size=(stop - start, n))
+        out[start:stop] = statistic(samples[indices], axis=1)
+    return out
+
+def _p99(matrix, axis):
+    return np.percentile(matrix, 99, axis=axis)
+
+def compare_metric(baseline, candidate, statistic, resamples, rng):
+    """
+    Delta (candidate - baseline) of a statistic with a percentile bootstrap
+    confidence interval. Returns None if either side has no samples.
+    """
+    if len(baseline) == 0 or len(candidate) == 0:
+        return None
+    base_point = float(statistic(baseline[np.newaxis, :], axis=1)[0])
+    cand_point = float(statistic(candidate[np.newaxis, :], axis=1)[0])
+    deltas = (bootstrap_statistic(candidate, statistic, resamples, rng)
+              - bootstrap_statistic(baseline, statistic, resamples, rng))
+    alpha = (1.0 - CONFIDENCE_LEVEL) / 2
+    low, high = np.quantile(deltas, [alpha, 1.0 - alpha])
+    return {
+        'baseline': base_point,
+        'candidate': cand_point,
+        'delta': cand_point - base_point,
+        'delta_pct': (cand_point - base_point) / base_point * 100 if base_point else float('nan'),
+        'ci_low': float(low),
+        'ci_high': float(high),
+        'significant': bool(low > 0 or high < 0),
+    }
+
+def _covering_samples(prepared):
+    """A language's raw response times if they cover the run (see prepare_latency), else no samples."""
+    latency = prepared['latency']
+    return prepared['response_times'] if latency is not None and latency[0] == 'samples' else np.empty(0)
+
+def compare_runs(runs, window='1s', resamples=BOOTSTRAP_RESAMPLES, seed=0):
+    """
+    Compare result sets against the first one. runs is a list of
+    (label, results) pairs. Throughput is compared through per-window request
+    rates, p99 latency through the raw response times; p99 is None for a
+    language whose timeseries covers less than MIN_SAMPLE_COVERAGE of its
+    requests in either run. Returns
+    {candidate label: {language: {'throughput': ..., 'p99': ...}}}.
+    """
+    rng = np.random.default_rng(seed)
+    (_, baseline), candidates = runs[0], runs[1:]
+    base_prepared = prepare_results(baseline, window=window)
+    # Every run uses the baseline's bucket width so the rates are comparable
+    window = next(name for name, width in WINDOW_SIZES.items()
+                  if width == next(iter(base_prepared.values()))['window_s'])
+    comparison = {}
+    for label, results in candidates:
+        prepared = prepare_results(results, window=window)
+        comparison[label] = {}
+        for lang in sorted(set(baseline) & set(results)):
+            base, cand = base_prepared[lang], prepared[lang]
+            comparison[label][lang] = {
+                'throughput': compare_metric(base['windows'][1], cand['windows'][1], np.mean, resamples, rng),
+                'p99': compare_metric(_covering_samples(base), _covering_samples(cand), _p99, resamples, rng),
+            }
+    return comparison
+
+def create_comparison_chart(comparison, baseline_label, output_dir):
+    """Create per-language throughput and p99 delta charts with confidence intervals."""
+    plt = _pyplot()
+    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    labels = list(comparison)
+    width = 0.8 / max(len(labels), 1)
+    languages = sorted({lang for deltas in comparison.values() for lang in deltas})
+    positions = np.arange(len(languages))
+    
+    for ax, metric, title in [(axes[0], 'throughput', 'Throughput (req/s per window)'),
+                              (axes[1], 'p99', 'p99 Response Time')]:
+        for i, label in enumerate(labels):
+            entries = [comparison[label].get(lang, {}).get(metric) for lang in languages]
+            pct = np.array([e['delta_pct'] if e else np.nan for e in entries])
+            # Convert the absolute CI to percent of the baseline for the error bars
+            err_low = np.array([(e['delta'] - e['ci_low']) / e['baseline'] * 100 if e and e['baseline'] else 0 for e in entries])
+            err_high = np.array([(e['ci_high'] - e['delta']) / e['baseline'] * 100 if e and e['baseline'] else 0 for e in entries])
+            bars = ax.bar(positions + i * width, pct, width, yerr=[err_low, err_high], capsize=4,
+                          label=label, edgecolor='black', linewidth=1)
+            for bar, entry in zip(bars, entries):
+                if entry and entry['significant']:
+                    bar.set_hatch('//')
+        ax.axhline(0, color='black', linewidth=1)
+        ax.set_xticks(positions + width * (len(labels) - 1) / 2)
+        ax.set_xticklabels([l.upper() for l in languages], rotation=45, ha='right')
+        ax.set_ylabel(f'Change vs {baseline_label} (%)', fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+    axes[0].legend(loc='best', fontsize=10, framealpha=0.9)
+    fig.suptitle(f'Cross-run Comparison ({CONFIDENCE_LEVEL:.0%} bootstrap CI, hatched = significant)',
+                 fontsize=16, fontweight='bold')
+    
+    plt.tight_layout()
+    save_figure(plt, output_dir, 'comparison_deltas.png')
+
+def print_comparison(comparison, baseline_label):
+    """Print per-language deltas and flag significant changes."""
+    for label, deltas in comparison.items():
+        print(f"\n{label} vs {baseline_label}:")
+        for lang, metrics in deltas.items():
+            for metric, name in [('throughput', 'throughput'), ('p99', 'p99 latency')]:
+                entry = metrics[metric]
+                if entry is None:
+                    print(f"  {lang.upper():<12} {name:<12} not enough samples")
+                    continue
+                flag = ' *significant*' if entry['significant'] else ''
+                scale = 100 / entry['baseline'] if entry['baseline'] else float('nan')
+                print(f"  {lang.upper():<12} {name:<12} {entry['delta_pct']:+7.1f}% "
+                      f"(CI {entry['ci_low'] * scale:+.1f}% .. {entry['ci_high'] * scale:+.1f}%){flag}")
+
+# Result fields prepare_latency reads
+LATENCY_FIELDS = ('timeseries', 'successful_requests', 'latency_histogram', 'response_times')
+
+# Output file -> (chart function, result fields it reads; None means all),
+# in the order they are generated
+CHARTS = {
+    'throughput_comparison.png': (create_throughput_comparison, ('requests_per_second',)),
+    'response_time_distribution.png': (create_response_time_distribution, LATENCY_FIELDS),
+    'latency_ecdf.png': (create_latency_ecdf, LATENCY_FIELDS),
+    'latency_percentiles.png': (create_latency_percentile_curve, LATENCY_FIELDS),
+    'cumulative_requests_timeline.png': (create_cumulative_requests_timeline, ('timeseries',)),
+    'windowed_timeseries.png': (create_windowed_timeseries, ('timeseries',)),
+    'response_time_heatmap.png': (create_response_time_heatmap, ('response_times', 'successful_requests')),
+    'success_rate_comparison.png': (create_success_rate_comparison, ('successful_requests', 'total_requests')),
+    'api_performance_dashboard.html': (create_interactive_dashboard, None),
+}
+
+def _digest_inputs(data, fields):
+    """
+    The parts of one language's results a chart depends on. A lazily loaded
+    timeseries is represented by its source fingerprint instead of its content.
+    """
+    lazy = isinstance(data, LanguageResults)
+    summary = data.summary if lazy else data
+    if fields is None:
+        fields = [f for f in summary if f != 'timeseries'] + ['timeseries']
+    inputs = {}
+    for field in fields:
+        if field == 'timeseries' and lazy:
+            inputs[field] = data.fingerprint
+        else:
+            inputs[field] = summary.get(field)
+    return inputs
+
+def chart_needs_timeseries(name):
+    """Whether a chart reads the per-request timeseries."""
+    _, fields = CHARTS[name]
+    return fields is None or 'timeseries' in fields
+
+def select_charts(patterns):
+    """Chart names matching any of the --only patterns (all charts if none)."""
+    if not patterns:
+        return list(CHARTS)
+    return [name for name in CHARTS if any(p in name.rsplit('.', 1)[0] for p in patterns)]
+
+def chart_digest(name, results, options=None):
+    """
+    Content hash of the result fields a chart reads plus this script, so a
+    figure is only considered up to date if neither its inputs nor the
+    rendering code changed.
+    """
+    _, fields = CHARTS[name]
+    inputs = {lang: _digest_inputs(data, fields) for lang, data in results.items()}
+    digest = hashlib.sha256()
+    digest.update(f'{CACHE_VERSION}:{name}:{json.dumps(options, sort_keys=True)}'.encode())
+    digest.update(Path(__file__).read_bytes())
+    digest.update(json.dumps(inputs, sort_keys=True).encode())
+    return digest.hexdigest()
+
+def load_cache(output_dir):
+    """Load the figure -> input digest map written by the previous run."""
+    try:
+        with open(output_dir / CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(output_dir, cache):
+    """Persist the figure -> input digest map."""
+    with open(output_dir / CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+# Per-process state for pool workers, set once by _init_worker
+_worker_state = {}
+
+def _init_worker(results, prepared, output_dir, image_options):
+    """Pool initializer: receive the shared inputs once per worker process."""
+    _worker_state.update(results=results, prepared=prepared, output_dir=output_dir)
+    IMAGE_OPTIONS.update(image_options)
+
+def _render_chart(name):
+    """Render one chart in a pool worker using the shared inputs."""
+    create_chart, _ = CHARTS[name]
+    create_chart(_worker_state['results'], _worker_state['output_dir'], _worker_state['prepared'])
+    return name
+
+def render_charts(results, output_dir, jobs=None, force=False,
+                  max_points=MAX_TIMELINE_POINTS, downsample='lttb', charts=None, window='auto'):
+    """
+    Render every chart (or only those in charts) whose inputs changed since
+    the last run, on a process pool. Returns the list of charts that were
+    (re)generated.
+    """
+    charts = list(CHARTS) if charts is None else charts
+    options = {'max_points': max_points, 'downsample': downsample, 'window': window,
+               'languages': sorted(results), **IMAGE_OPTIONS}
+    digests = {name: chart_digest(name, results, options) for name in charts}
+    cache = load_cache(output_dir)
+    pending = [
+        name for name in charts
+        if force or cache.get(name) != digests[name] or not (output_dir / output_name(name)).exists()
+    ]
+    for name in charts:
+        if name not in pending:
+            print(f"• {output_name(name)} is up to date")
+    if not pending:
+        return []
+
+    prepared = prepare_results(results, max_points=max_points, method=downsample,
+                               with_timeseries=any(chart_needs_timeseries(n) for n in pending),
+                               window=window)
+    if jobs is None:
+        jobs = min(len(pending), os.cpu_count() or 1)
+
+    if jobs <= 1 or len(pending) == 1:
+        for name in pending:
+            create_chart, _ = CHARTS[name]
+            create_chart(results, output_dir, prepared)
+            cache[name] = digests[name]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(results, prepared, output_dir, dict(IMAGE_OPTIONS))) as pool:
+            for name in pool.map(_render_chart, pending):
+                cache[name] = digests[name]
+
+    save_cache(output_dir, cache)
+    return pending
+
 def main():
     """Main function to generate all visualizations."""
+    parser = argparse.ArgumentParser(description='Generate API performance visualizations.')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of worker processes (default: one per chart, up to the CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate every figure even if its inputs are unchanged')
+    parser.add_argument('--max-points', type=int, default=MAX_TIMELINE_POINTS,
+                        help=f'point budget per line in timeline plots (default: {MAX_TIMELINE_POINTS})')
+    parser.add_argument('--downsample', choices=sorted(DOWNSAMPLERS), default='lttb',
+                        help='downsampling method for long timelines (default: lttb)')
+    parser.add_argument('--window', choices=['auto'] + sorted(WINDOW_SIZES), default='auto',
+                        help='bucket width for windowed throughput/latency charts (default: auto)')
+    parser.add_argument('--only', default='',
+                        help='comma-separated chart names to generate, e.g. throughput,ecdf (default: all)')
+    parser.add_argument('--langs', default='',
+                        help='comma-separated languages to load, e.g. go,rust (default: all)')
+    parser.add_argument('--compare', nargs='+', metavar='DIR',
+                        help='compare result sets (directories laid out like the repo, '
+                             'with <lang>/api_results.json); the first one is the baseline')
+    parser.add_argument('--format', choices=IMAGE_FORMATS, default=IMAGE_OPTIONS['format'],
+                        help='static figure format (default: png)')
+    parser.add_argument('--dpi', type=int, default=None,
+                        help=f"static figure resolution (default: {IMAGE_OPTIONS['dpi']})")
+    parser.add_argument('--quick', action='store_true',
+                        help=f'fast low-resolution preview ({QUICK_DPI} DPI unless --dpi is given)')
+    parser.add_argument('--cdn-plotlyjs', action='store_true',
+                        help='load plotly.js in the dashboard from its CDN instead of embedding it '
+                             '(about 4.8 MB smaller, but needs network access to view)')
+    parser.add_argument('--output-dir', type=Path, default=Path(__file__).parent / 'graphs',
+                        help='directory for generated figures (default: graphs/)')
+    args = parser.parse_args()
+    IMAGE_OPTIONS['format'] = args.format
+    if args.dpi is not None:
+        IMAGE_OPTIONS['dpi'] = args.dpi
+    elif args.quick:
+        IMAGE_OPTIONS['dpi'] = QUICK_DPI
+    if args.cdn_plotlyjs:
+        IMAGE_OPTIONS['plotlyjs'] = 'cdn'
+
     print("\n" + "="*60)
     print("API Performance Visualization Generator")
     print("="*60 + "\n")
     
+    langs = [l.strip().lower() for l in args.langs.split(',') if l.strip()]
+    output_dir = args.output_dir
+
+    if args.compare:
+        if len(args.compare) < 2:
+            print("❌ --compare needs at least two result directories")
+            sys.exit(1)
+        runs = []
+        for run_dir in args.compare:
+            print(f"Loading results from {run_dir}...")
+            runs.append((Path(run_dir).name or run_dir, load_results(langs or None, root=run_dir)))
+        comparison = compare_runs(runs, window=args.window)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        print_comparison(comparison, runs[0][0])
+        create_comparison_chart(comparison, runs[0][0], output_dir)
+        with open(output_dir / 'comparison.json', 'w') as f:
+            json.dump({'baseline': runs[0][0], 'comparison': comparison}, f, indent=2)
+        return
+
     # Load results
     print("Loading API test results...\n")
-    results = load_results()
+    results = load_results(langs or None)
     print(f"\n✓ Successfully loaded {len(results)} language results\n")
+
+    charts = select_charts([c.strip().lower() for c in args.only.split(',') if c.strip()])
+    if not charts:
+        print(f"❌ No charts match --only {args.only}")
+        sys.exit(1)
     
     # Create output directory
-    output_dir = Path(__file__).parent / 'graphs'
-    output_dir.mkdir(exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate visualizations
     print("Generating visualizations...\n")
     
     try:
-        create_throughput_comparison(results, output_dir)
-        create_response_time_distribution(results, output_dir)
-        create_cumulative_requests_timeline(results, output_dir)
-        create_response_time_heatmap(results, output_dir)
-        create_success_rate_comparison(results, output_dir)
-        create_interactive_dashboard(results, output_dir)
+        render_charts(results, output_dir, jobs=args.jobs, force=args.force,
+                      max_points=args.max_points, downsample=args.downsample, charts=charts,
+                      window=args.window)
         
         print("\n" + "="*60)
         print("✓ All visualizations generated successfully!")